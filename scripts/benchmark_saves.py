@@ -0,0 +1,154 @@
+"""
+Compare the save formats: file size, save time and load time.
+
+The save data is either read from an existing save or made up: a
+screenshot tiled from a tileset (so it compresses like a map) and a party
+of monsters with plausible fields. For the compact format, the time spent
+on the game thread is reported too, the rest of the work is done by the
+save writer thread.
+
+Usage:
+    PYTHONPATH=. python scripts/benchmark_saves.py [--save path] [-n runs]
+"""
+
+import base64
+import os
+import tempfile
+import time
+from argparse import ArgumentParser
+from statistics import median
+from typing import Any
+
+import pygame
+
+from tuxemon import prepare, save
+from tuxemon.save_writer import save_writer
+
+METHODS = ("JSON", "CBOR", "COMPACT")
+TILESET = "gfx/tilesets/Basic_Buch_Tiles_Compiled.png"
+
+
+def make_screenshot(size: tuple[int, int]) -> pygame.surface.Surface:
+    tileset = pygame.image.load(prepare.fetch(TILESET))
+    screenshot = pygame.Surface(size)
+    for x in range(0, size[0], tileset.get_width()):
+        for y in range(0, size[1], tileset.get_height()):
+            screenshot.blit(tileset, (x, y))
+    return screenshot
+
+
+def make_save_data() -> dict[str, Any]:
+    screenshot = make_screenshot(prepare.SCREEN_SIZE)
+    monster = {
+        "slug": "rockitten",
+        "name": "Rockitten",
+        "level": 25,
+        "total_experience": 15625,
+        "current_hp": 80,
+        "instance_id": "7d2b8e0a-8a3f-4b2b-9c1d-0a1b2c3d4e5f",
+        "moves": [
+            {"slug": "ram", "power": 1.0, "accuracy": 0.9, "next_use": 0}
+        ]
+        * 4,
+        "status": [],
+        "plague": {},
+        "held_item": None,
+        "mod_hp": 2,
+        "mod_armour": 3,
+        "mod_dodge": 1,
+        "mod_melee": 4,
+        "mod_ranged": 0,
+        "mod_speed": 2,
+    }
+    return {
+        "screenshot": base64.b64encode(
+            pygame.image.tobytes(screenshot, "RGB")
+        ).decode(),
+        "screenshot_width": screenshot.get_width(),
+        "screenshot_height": screenshot.get_height(),
+        "time": "2025-01-01 12:00",
+        "version": save.SAVE_VERSION,
+        "player_name": "Red",
+        "current_map": "taba_town.tmx",
+        "player_steps": 12345.0,
+        "template": {
+            "sprite_name": "adventurer",
+            "combat_front": "",
+            "slug": "adventurer",
+        },
+        "game_variables": {f"variable_{i}": "yes" for i in range(500)},
+        "tuxepedia": {f"monster_{i}": "caught" for i in range(200)},
+        "monsters": [monster] * 6,
+        "monster_boxes": {"Kennel": [monster] * 60},
+        "item_boxes": {"Locker": []},
+        "inventory": [{"slug": "potion", "quantity": 5}] * 30,
+    }
+
+
+def benchmark(method: str, save_data: Any, runs: int) -> dict[str, float]:
+    prepare.SAVE_METHOD = method
+    returned = []
+    written = []
+    loaded = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        save.save(save_data, 1)
+        returned.append(time.perf_counter() - start)
+        save_writer.flush()
+        written.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        save.load(1)
+        loaded.append(time.perf_counter() - start)
+    return {
+        "size": os.path.getsize(save.get_save_path(1)) / 1024,
+        "game_thread": median(returned) * 1000,
+        "save": median(written) * 1000,
+        "load": median(loaded) * 1000,
+    }
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument(
+        "--save",
+        dest="save",
+        help="Save file to use, instead of made up data",
+    )
+    parser.add_argument(
+        "-n",
+        "--runs",
+        dest="runs",
+        type=int,
+        default=5,
+        help="Number of runs of each format",
+    )
+    args = parser.parse_args()
+
+    pygame.init()
+    if args.save:
+        data = save.open_save_file(args.save)
+        if not data:
+            raise SystemExit(f"Unable to read {args.save}")
+        save_data = save.upgrade_save(data)
+        screenshot = save.decode_screenshot(save_data)
+        if screenshot is not None:
+            save_data["screenshot"] = base64.b64encode(
+                pygame.image.tobytes(screenshot, "RGB")
+            ).decode()
+            save_data.pop("screenshot_format", None)
+    else:
+        save_data = make_save_data()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        prepare.SAVE_PATH = os.path.join(tmp, "slot")
+        print(
+            f"{'format':<10}{'size KiB':>10}{'game ms':>10}"
+            f"{'save ms':>10}{'load ms':>10}"
+        )
+        for method in METHODS:
+            result = benchmark(method, save_data, args.runs)
+            print(
+                f"{method:<10}{result['size']:>10.1f}"
+                f"{result['game_thread']:>10.1f}{result['save']:>10.1f}"
+                f"{result['load']:>10.1f}"
+            )
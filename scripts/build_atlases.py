@@ -0,0 +1,110 @@
+"""
+Build the texture atlases of the animations.
+
+The frames of every animation of the database are packed into a single
+image, with an index giving the rectangle of each frame, and written to
+the atlas folder. With --npc, the standing sprites and walk cycles of the
+NPCs are packed too. Atlases that are up to date are skipped. At runtime,
+the game loads the frames from the atlases instead of a file per frame
+(see the "atlases" option in tuxemon.cfg).
+
+Usage:
+    PYTHONPATH=. python scripts/build_atlases.py [--npc] [-o output] [-j jobs]
+"""
+
+import glob
+import os
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from tuxemon import prepare
+from tuxemon.asset_index import get_mod_roots
+from tuxemon.atlas import animation_atlas_name, build_atlas
+from tuxemon.constants import paths
+from tuxemon.db import db
+from tuxemon.graphics import animation_frame_files
+from tuxemon.npc import npc_sprite_files
+
+
+def find_animations() -> dict[str, list[str]]:
+    """Returns the frame files of every animation, by atlas name."""
+    if prepare.CONFIG.db_snapshot:
+        db.load_cached(paths.DB_SNAPSHOT_PATH)
+    else:
+        db.load()
+    atlases = {}
+    for animation in db.database["animation"].values():
+        directory = prepare.fetch("animations", animation.file)
+        files = animation_frame_files(directory, animation.slug)
+        if files:
+            name = animation_atlas_name(directory, animation.slug)
+            atlases[name] = list(files)
+    return atlases
+
+
+def find_npcs() -> dict[str, list[str]]:
+    """Returns the sprite files of every NPC with walk cycles."""
+    suffix = "_front_walk.000.png"
+    sprite_names = set()
+    for mod_name in prepare.CONFIG.mods:
+        for root in get_mod_roots(mod_name):
+            for path in glob.glob(os.path.join(root, "sprites", "*" + suffix)):
+                sprite_names.add(os.path.basename(path)[: -len(suffix)])
+    atlases = {}
+    for sprite_name in sorted(sprite_names):
+        try:
+            files = [prepare.fetch(f) for f in npc_sprite_files(sprite_name)]
+        except OSError:
+            continue
+        atlases[f"npc_{sprite_name}"] = files
+    return atlases
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument(
+        "--npc",
+        dest="npc",
+        action="store_true",
+        default=False,
+        help="Pack the NPC walk cycles too",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        dest="output",
+        default=paths.ATLAS_DIR,
+        help="Atlas output folder",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        dest="jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+    args = parser.parse_args()
+
+    atlases = find_animations()
+    if args.npc:
+        atlases.update(find_npcs())
+
+    built = failed = 0
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        futures = {
+            executor.submit(build_atlas, name, files, args.output): name
+            for name, files in atlases.items()
+        }
+        for future in as_completed(futures):
+            try:
+                built += future.result()
+            except Exception as e:
+                failed += 1
+                print(f"{futures[future]}: {e}")
+
+    frames = sum(len(files) for files in atlases.values())
+    print(
+        f"{len(atlases)} atlases ({frames} frames), {built} built, "
+        f"{len(atlases) - built - failed} up to date, {failed} failed"
+    )
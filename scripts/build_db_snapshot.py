@@ -0,0 +1,38 @@
+"""
+Build the precompiled database snapshot used for fast startup.
+
+The whole database is loaded and validated from the JSON files of the
+configured mods, then written to a single snapshot file. At runtime, the
+game loads the snapshot instead of the JSON files as long as the mod list
+and the files are unchanged (see the "db_snapshot" option in tuxemon.cfg).
+
+Usage:
+    PYTHONPATH=. python scripts/build_db_snapshot.py [-o output]
+"""
+from argparse import ArgumentParser
+
+from tuxemon.constants import paths
+from tuxemon.db import db
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument(
+        "-o",
+        "--output",
+        dest="output",
+        default=paths.DB_SNAPSHOT_PATH,
+        help="Snapshot output file",
+    )
+    parser.add_argument(
+        "--validate",
+        dest="validate",
+        action="store_true",
+        default=False,
+        help="Stop if an entry fails validation",
+    )
+    args = parser.parse_args()
+
+    key = db.snapshot_key()
+    db.load(validate=args.validate)
+    db.write_snapshot(args.output, key)
+    print(f"Database snapshot written to '{args.output}'")
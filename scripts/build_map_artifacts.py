@@ -0,0 +1,71 @@
+"""
+Build the compiled artifacts of the maps.
+
+Every map of the configured mods is parsed and compiled (collisions,
+surfaces and events, including the ones of its YAML files), and the result
+is written to the artifact folder. Maps whose artifact is up to date are
+skipped. At runtime, the game reads the artifacts instead of compiling the
+maps again (see the "map_artifacts" option in tuxemon.cfg).
+
+Usage:
+    PYTHONPATH=. python scripts/build_map_artifacts.py [-o output] [-j jobs]
+"""
+
+import glob
+import os
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from tuxemon import prepare
+from tuxemon.asset_index import get_mod_roots
+from tuxemon.constants import paths
+from tuxemon.map_loader import build_artifact
+
+
+def find_maps() -> list[str]:
+    """Returns the tmx files of the configured mods, by priority."""
+    maps: dict[str, str] = {}
+    for mod_name in prepare.CONFIG.mods:
+        for root in get_mod_roots(mod_name):
+            for path in glob.glob(os.path.join(root, "maps", "*.tmx")):
+                maps.setdefault(os.path.basename(path), path)
+    return sorted(maps.values())
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument(
+        "-o",
+        "--output",
+        dest="output",
+        default=paths.MAP_ARTIFACT_DIR,
+        help="Artifact output folder",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        dest="jobs",
+        type=int,
+        default=None,
+        help="Number of worker processes (default: number of CPUs)",
+    )
+    args = parser.parse_args()
+
+    maps = find_maps()
+    built = failed = 0
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        futures = {
+            executor.submit(build_artifact, path, args.output): path
+            for path in maps
+        }
+        for future in as_completed(futures):
+            try:
+                built += future.result()
+            except Exception as e:
+                failed += 1
+                print(f"{futures[future]}: {e}")
+
+    print(
+        f"{len(maps)} maps, {built} artifacts built, "
+        f"{len(maps) - built - failed} up to date, {failed} failed"
+    )
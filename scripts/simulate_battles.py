@@ -0,0 +1,204 @@
+"""
+Simulate battles between monsters, to balance the monsters and techniques.
+
+Every pair of the given monsters fights a number of seeded battles with the
+headless combat (same rules and AI as the game, no graphics). The battles
+are spread across a process pool. The win rate and the average number of
+turns of every matchup, and the usage and win rate of every technique, are
+printed and optionally written as CSV files.
+
+The same arguments always give the same results.
+
+Usage:
+    PYTHONPATH=. python scripts/simulate_battles.py [monster ...]
+        [-l level] [-n battles] [-j jobs] [-s seed] [-o output]
+"""
+
+import csv
+import logging
+import os
+import time
+import zlib
+from argparse import ArgumentParser
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import combinations
+
+from tuxemon import prepare
+from tuxemon.constants import paths
+from tuxemon.db import db
+from tuxemon.states.combat.headless import (
+    MAX_TURNS,
+    MatchupResult,
+    simulate_matchup,
+)
+
+
+def load_db() -> None:
+    """Loads the database once per worker, like the game does."""
+    logging.basicConfig(level=logging.ERROR)
+    if prepare.CONFIG.db_snapshot:
+        db.load_cached(paths.DB_SNAPSHOT_PATH)
+    else:
+        db.load()
+
+
+def run_matchup(
+    left: str, right: str, level: int, battles: int, seed: int, turns: int
+) -> MatchupResult:
+    # every matchup gets its own seeds, whatever the order of the runs
+    seed += zlib.crc32(f"{left}:{right}".encode())
+    return simulate_matchup(
+        ([(left, level)], [(right, level)]), battles, seed, turns
+    )
+
+
+def write_csv(path: str, header: list[str], rows: list[list[object]]) -> None:
+    with open(path, "w", newline="") as fp:
+        writer = csv.writer(fp)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument(
+        "monsters",
+        nargs="*",
+        help="Monsters to simulate, all the monsters if none is given",
+    )
+    parser.add_argument(
+        "-l", "--level", dest="level", type=int, default=20, help="Level"
+    )
+    parser.add_argument(
+        "-n",
+        "--battles",
+        dest="battles",
+        type=int,
+        default=20,
+        help="Battles per matchup",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        dest="jobs",
+        type=int,
+        default=os.cpu_count(),
+        help="Number of processes",
+    )
+    parser.add_argument(
+        "-s", "--seed", dest="seed", type=int, default=0, help="Base seed"
+    )
+    parser.add_argument(
+        "-t",
+        "--max-turns",
+        dest="max_turns",
+        type=int,
+        default=MAX_TURNS,
+        help="Turns after which a battle is a draw",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        dest="output",
+        help="Folder where matchups.csv and techniques.csv are written",
+    )
+    args = parser.parse_args()
+
+    load_db()
+    monsters = sorted(args.monsters or db.database["monster"])
+    matchups = list(combinations(monsters, 2))
+    print(
+        f"Simulating {len(matchups) * args.battles} battles "
+        f"({len(matchups)} matchups) with {args.jobs} processes"
+    )
+
+    start = time.perf_counter()
+    with ProcessPoolExecutor(args.jobs, initializer=load_db) as executor:
+        results = list(
+            executor.map(
+                run_matchup,
+                *zip(*matchups),
+                *(
+                    [value] * len(matchups)
+                    for value in (
+                        args.level,
+                        args.battles,
+                        args.seed,
+                        args.max_turns,
+                    )
+                ),
+                chunksize=max(1, len(matchups) // (args.jobs * 8)),
+            )
+        )
+    elapsed = time.perf_counter() - start
+
+    matchup_rows: list[list[object]] = []
+    monster_stats: dict[str, Counter[str]] = defaultdict(Counter)
+    technique_stats: dict[str, Counter[str]] = defaultdict(Counter)
+    errors = 0
+    for result in results:
+        (left, _), (right, _) = result.parties[0][0], result.parties[1][0]
+        matchup_rows.append(
+            [
+                left,
+                right,
+                result.battles,
+                result.wins[0],
+                result.wins[1],
+                result.draws,
+                round(result.wins[0] / result.battles, 3),
+                round(result.turns / result.battles, 2),
+            ]
+        )
+        for index, slug in enumerate((left, right)):
+            monster_stats[slug]["battles"] += result.battles
+            monster_stats[slug]["wins"] += result.wins[index]
+        for slug, stats in result.techniques.items():
+            technique_stats[slug].update(stats)
+        errors += result.errors
+
+    technique_rows: list[list[object]] = [
+        [
+            slug,
+            stats["uses"],
+            round(stats["successes"] / stats["uses"], 3),
+            round(stats["damage"] / stats["uses"], 2),
+            round(stats["wins"] / stats["battles"], 3),
+        ]
+        for slug, stats in sorted(technique_stats.items())
+        if stats["uses"]
+    ]
+
+    print(f"Done in {elapsed:.1f}s ({errors} actions skipped)")
+    print(f"\n{'monster':<24}{'battles':>10}{'win rate':>10}")
+    for slug, stats in sorted(
+        monster_stats.items(),
+        key=lambda item: item[1]["wins"] / item[1]["battles"],
+        reverse=True,
+    ):
+        rate = stats["wins"] / stats["battles"]
+        print(f"{slug:<24}{stats['battles']:>10}{rate:>10.3f}")
+
+    if args.output:
+        os.makedirs(args.output, exist_ok=True)
+        write_csv(
+            os.path.join(args.output, "matchups.csv"),
+            [
+                "left",
+                "right",
+                "battles",
+                "left_wins",
+                "right_wins",
+                "draws",
+                "left_win_rate",
+                "mean_turns",
+            ],
+            matchup_rows,
+        )
+        write_csv(
+            os.path.join(args.output, "techniques.csv"),
+            ["technique", "uses", "success_rate", "mean_damage", "win_rate"],
+            technique_rows,
+        )
+        print(f"\nResults written to '{args.output}'")
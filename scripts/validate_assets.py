@@ -0,0 +1,52 @@
+"""
+Run the full, strict validation of the database and of its assets.
+
+At runtime the game trusts the assets referenced by the database (see the
+"strict_validation" option in tuxemon.cfg). Modders can use this script to
+check that every file exists and has the expected size, and that every
+entry of the database is valid.
+
+Image dimensions are read from the file headers and cached by
+modification time, use --no-cache to read every header again.
+
+Usage:
+    PYTHONPATH=. python scripts/validate_assets.py [--no-cache]
+"""
+import sys
+from argparse import ArgumentParser
+
+from pydantic import ValidationError
+
+from tuxemon.db import db, has
+
+if __name__ == "__main__":
+    parser = ArgumentParser()
+    parser.add_argument(
+        "--no-cache",
+        dest="no_cache",
+        action="store_true",
+        default=False,
+        help="Ignore the cached image dimensions",
+    )
+    args = parser.parse_args()
+
+    has.strict = True
+    if args.no_cache:
+        has.index.cache_dir = None
+
+    db.preload()
+    errors = []
+    for table, entries in db.preloaded.items():
+        for slug, item in entries.items():
+            try:
+                db.load_model(item, table, validate=True)
+            except (ValidationError, ValueError, OSError) as e:
+                errors.append((table, slug, e))
+    db.preloaded.clear()
+    has.index.save()
+
+    for table, slug, error in errors:
+        print(f"{table} '{slug}': {error}")
+    total = sum(len(entries) for entries in db.database.values())
+    print(f"{total} entries valid, {len(errors)} invalid")
+    sys.exit(1 if errors else 0)
@@ -1,9 +1,11 @@
 # SPDX-License-Identifier: GPL-3.0
 # Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
 import unittest
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock, patch
 
-from tuxemon.event.eventengine import EventEngine, RunningEvent
+from tuxemon import prepare
+from tuxemon.event import EventObject, MapCondition
+from tuxemon.event.eventengine import EventEngine, EventIndex, RunningEvent
 
 
 class TestRunningEvent(unittest.TestCase):
@@ -20,3 +22,183 @@ class TestRunningEvent(unittest.TestCase):
 class TestEventEngine(unittest.TestCase):
     def test_(self):
         eng = EventEngine(None)
+
+
+class TestIncrementalConditions(unittest.TestCase):
+    def setUp(self):
+        self.session = MagicMock()
+        self.session.player.game_variables = {}
+        self.session.player.monsters = []
+        self.session.player.items = []
+        self.session.player.tile_pos = (0, 0)
+        self.session.client.get_state_by_name.return_value.npcs = []
+        self.engine = EventEngine(self.session)
+        self.variable_set = self.engine.conditions["variable_set"]
+        self.calls = 0
+        original = self.variable_set.test
+
+        def counted(condition, session, cond_data):
+            self.calls += 1
+            return original(condition, session, cond_data)
+
+        patcher = patch.object(self.variable_set, "test", counted)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_event(self, *conds):
+        return EventObject(
+            1,
+            "event",
+            0,
+            0,
+            1,
+            1,
+            [
+                MapCondition(kind, [param], 0, 0, 1, 1, "is", None)
+                for kind, param in conds
+            ],
+            [],
+        )
+
+    def run_frames(self, event, frames):
+        self.session.client.inits = []
+        self.session.client.events = [event]
+        with patch.object(self.engine, "start_event") as start_event:
+            for _ in range(frames):
+                self.engine.check_conditions()
+        return start_event.call_count
+
+    def test_reused_until_signal_changes(self):
+        event = self.make_event(("variable_set", "door:open"))
+        self.assertEqual(self.run_frames(event, 3), 0)
+        self.assertEqual(self.calls, 1)
+        self.session.player.game_variables["door"] = "open"
+        self.assertEqual(self.run_frames(event, 3), 3)
+        self.assertEqual(self.calls, 2)
+
+    def test_other_signal_changes(self):
+        event = self.make_event(("variable_set", "door:open"))
+        self.run_frames(event, 1)
+        self.session.player.tile_pos = (1, 0)
+        self.run_frames(event, 1)
+        self.assertEqual(self.calls, 1)
+
+    def test_volatile_condition(self):
+        event = self.make_event(
+            ("button_pressed", "K_RETURN"), ("variable_set", "door:open")
+        )
+        self.assertIsNone(self.engine.get_event_signals(event))
+        self.session.client.key_events = []
+        self.run_frames(event, 3)
+        self.assertEqual(self.calls, 0)
+
+    def test_disabled(self):
+        event = self.make_event(("variable_set", "door:open"))
+        with patch.object(prepare.CONFIG, "event_cache", False):
+            self.run_frames(event, 3)
+        self.assertEqual(self.calls, 3)
+
+    def test_reset(self):
+        event = self.make_event(("variable_set", "door:open"))
+        self.run_frames(event, 1)
+        self.engine.reset()
+        self.run_frames(event, 1)
+        self.assertEqual(self.calls, 2)
+
+
+def make_cond(kind, params, operator="is", area=(2, 3, 2, 1)):
+    return MapCondition(kind, params, *area, operator, None)
+
+
+class TestEventIndex(unittest.TestCase):
+    def setUp(self):
+        self.conditions = EventEngine(None).conditions
+        self.at = EventObject(
+            1, "at", 2, 3, 2, 1, [make_cond("char_at", ["player"])], []
+        )
+        self.facing = EventObject(
+            2,
+            "facing",
+            2,
+            3,
+            2,
+            1,
+            [make_cond("char_facing_tile", ["npc_maple"])],
+            [],
+        )
+        self.anywhere = EventObject(
+            3, "anywhere", 0, 0, 1, 1, [make_cond("variable_set", ["x"])], []
+        )
+        self.index = EventIndex(
+            [self.anywhere, self.facing, self.at], self.conditions
+        )
+
+    def test_area(self):
+        self.assertEqual(
+            sorted(self.index.by_tile["player"]), [(2, 3), (3, 3)]
+        )
+        self.assertEqual(len(self.index.by_tile["npc_maple"]), 4 * 3)
+
+    def test_get_events_keeps_map_order(self):
+        tiles = {"player": (3, 3), "npc_maple": (1, 2)}
+        self.assertEqual(
+            self.index.get_events(tiles),
+            [self.anywhere, self.facing, self.at],
+        )
+        tiles = {"player": (4, 3), "npc_maple": (0, 0)}
+        self.assertEqual(self.index.get_events(tiles), [self.anywhere])
+
+    def test_not_indexed(self):
+        events = [
+            EventObject(
+                1,
+                "not",
+                0,
+                0,
+                1,
+                1,
+                [make_cond("char_at", ["player"], "not")],
+                [],
+            ),
+            EventObject(
+                2,
+                "volatile first",
+                0,
+                0,
+                1,
+                1,
+                [
+                    make_cond("button_pressed", ["K_RETURN"]),
+                    make_cond("char_at", ["player"]),
+                ],
+                [],
+            ),
+            EventObject(
+                3,
+                "by property",
+                0,
+                0,
+                1,
+                1,
+                [make_cond("char_facing_tile", ["player", "surfable"])],
+                [],
+            ),
+        ]
+        index = EventIndex(events, self.conditions)
+        self.assertEqual(index.by_tile, {})
+        self.assertEqual(len(index.always), 3)
+
+    def test_engine_skips_far_events(self):
+        session = MagicMock()
+        session.player.tile_pos = (9, 9)
+        session.client.inits = []
+        session.client.events = [self.at, self.anywhere]
+        engine = EventEngine(session)
+        with patch.object(engine, "process_map_event") as process:
+            engine.check_conditions()
+            session.player.tile_pos = (2, 3)
+            engine.check_conditions()
+        self.assertEqual(
+            [c.args[0] for c in process.call_args_list],
+            [self.anywhere, self.at, self.anywhere],
+        )
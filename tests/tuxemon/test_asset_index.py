@@ -0,0 +1,62 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import tempfile
+import unittest
+
+from PIL import Image
+
+from tuxemon import prepare
+from tuxemon.asset_index import AssetIndex, read_image_size
+
+
+class TestReadImageSize(unittest.TestCase):
+    def test_png_header(self):
+        path = prepare.fetch(prepare.MISSING_IMAGE)
+        with Image.open(path) as image:
+            self.assertEqual(read_image_size(path), image.size)
+
+
+class TestAssetIndex(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.index = AssetIndex(prepare.CONFIG.mods, self.tmp_dir.name)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_find(self):
+        self.assertEqual(
+            self.index.find(prepare.MISSING_IMAGE),
+            prepare.fetch(prepare.MISSING_IMAGE),
+        )
+
+    def test_find_missing(self):
+        self.assertIsNone(self.index.find("gfx/not_a_file.png"))
+
+    def test_image_size_missing(self):
+        with self.assertRaises(OSError):
+            self.index.image_size("gfx/not_a_file.png")
+
+    def test_image_size_cached(self):
+        size = self.index.image_size(prepare.MISSING_IMAGE)
+        self.index.save()
+        cached = AssetIndex(prepare.CONFIG.mods, self.tmp_dir.name)
+        self.assertEqual(cached.image_size(prepare.MISSING_IMAGE), size)
+        self.assertFalse(cached._dirty)
+
+    def test_find_folder(self):
+        self.assertEqual(self.index.find("l18n"), prepare.fetch("l18n"))
+
+    def test_counters(self):
+        self.index.find(prepare.MISSING_IMAGE)
+        self.index.find("gfx/not_a_file.png")
+        stats = self.index.stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertGreater(stats["files"], 0)
+
+    def test_invalidate(self):
+        self.index.find(prepare.MISSING_IMAGE)
+        self.index.invalidate()
+        self.assertEqual(self.index.stats()["files"], 0)
+        self.assertIsNotNone(self.index.find(prepare.MISSING_IMAGE))
@@ -0,0 +1,104 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pygame
+
+from tuxemon import prepare
+from tuxemon.atlas import (
+    animation_atlas_name,
+    build_atlas,
+    clear_atlas_cache,
+    find_atlas,
+    pack_rects,
+)
+from tuxemon.graphics import load_frames_files, surface_cache
+
+COLORS = [(255, 0, 0), (0, 255, 0), (255, 0, 0), (0, 0, 255)]
+
+
+class TestPackRects(unittest.TestCase):
+    def test_empty(self):
+        self.assertEqual(pack_rects([]), ([], (0, 0)))
+
+    def test_rects_do_not_overlap(self):
+        sizes = [(16, 16), (32, 8), (8, 24), (16, 16), (40, 4)]
+        positions, (width, height) = pack_rects(sizes)
+        rects = [
+            pygame.Rect(position, size)
+            for position, size in zip(positions, sizes)
+        ]
+        bounds = pygame.Rect(0, 0, width, height)
+        for index, rect in enumerate(rects):
+            self.assertTrue(bounds.contains(rect))
+            self.assertEqual(rect.collidelist(rects[index + 1 :]), -1)
+
+
+class TestAtlas(unittest.TestCase):
+    def setUp(self):
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.tmp.name, "technique")
+        self.atlas_dir = os.path.join(self.tmp.name, "atlases")
+        os.makedirs(self.directory)
+        self.files = []
+        for index, color in enumerate(COLORS):
+            frame = pygame.Surface((8, 6), pygame.SRCALPHA)
+            frame.fill(color, (0, 0, 4, 6))
+            filename = os.path.join(self.directory, f"spark_{index:02}.png")
+            pygame.image.save(frame, filename)
+            self.files.append(filename)
+        self.name = animation_atlas_name(self.directory, "spark")
+        patcher = patch("tuxemon.atlas.paths.ATLAS_DIR", self.atlas_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        clear_atlas_cache()
+        surface_cache.clear()
+
+    def tearDown(self):
+        clear_atlas_cache()
+        surface_cache.clear()
+        self.tmp.cleanup()
+
+    def test_name(self):
+        self.assertEqual(self.name, "technique_spark")
+
+    def test_build_and_find(self):
+        self.assertIsNone(find_atlas(self.name, self.files))
+        self.assertTrue(build_atlas(self.name, self.files))
+        self.assertFalse(build_atlas(self.name, self.files))
+        image_path, rects = find_atlas(self.name, self.files)
+        self.assertEqual(len(rects), len(self.files))
+        # identical frames are stored once
+        self.assertEqual(rects[0], rects[2])
+        self.assertEqual(pygame.image.load(image_path).get_size(), (8, 18))
+
+    def test_stale_atlas_is_ignored(self):
+        build_atlas(self.name, self.files)
+        pygame.image.save(pygame.Surface((8, 8)), self.files[1])
+        os.utime(self.files[1], ns=(0, 0))
+        self.assertIsNone(find_atlas(self.name, self.files))
+
+    def test_disabled(self):
+        build_atlas(self.name, self.files)
+        with patch.object(prepare.CONFIG, "atlases", False):
+            self.assertIsNone(find_atlas(self.name, self.files))
+
+    def test_frames_match_files(self):
+        expected = [
+            pygame.image.tobytes(frame, "RGBA")
+            for frame in load_frames_files(self.directory, "spark")
+        ]
+        surface_cache.clear()
+        build_atlas(self.name, self.files)
+        with patch("pygame.image.load", wraps=pygame.image.load) as load:
+            frames = load_frames_files(self.directory, "spark")
+        self.assertEqual(load.call_count, 1)
+        self.assertEqual(
+            [pygame.image.tobytes(frame, "RGBA") for frame in frames],
+            expected,
+        )
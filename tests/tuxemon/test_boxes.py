@@ -3,11 +3,17 @@
 import unittest
 from uuid import uuid4
 
-from tuxemon.boxes import MonsterBoxes
+from tuxemon.boxes import InventoryIndex, MonsterBoxes
 from tuxemon.monster import Monster
 from tuxemon.states.pc_kennel import HIDDEN_LIST
 
 
+def make_monster(slug: str) -> Monster:
+    monster = Monster()
+    monster.slug = slug
+    return monster
+
+
 class TestBoxes(unittest.TestCase):
 
     def setUp(self):
@@ -197,3 +203,74 @@ class TestBoxes(unittest.TestCase):
             len(self.monster_boxes.get_monsters(f"{self.box_id1}1")), 10
         )
         self.assertEqual(len(self.monster_boxes.get_monsters(self.box_id1)), 0)
+
+    def test_index_consistency(self):
+        monsters = [Monster() for _ in range(5)]
+        for monster in monsters:
+            self.monster_boxes.add_monster(self.box_id1, monster)
+        self.monster_boxes.move_monster(
+            self.box_id1, self.box_id2, monsters[0]
+        )
+        self.monster_boxes.remove_monster(monsters[1])
+        self.monster_boxes.merge_boxes(self.box_id2, "box3")
+        self.monster_boxes.swap_with_external_monster_by_iid(
+            monsters[2].instance_id, self.monster1
+        )
+        self.assertEqual(self.monster_boxes.check_index(), [])
+        self.assertEqual(
+            self.monster_boxes.get_box_name(monsters[0].instance_id), "box3"
+        )
+        self.assertIsNone(
+            self.monster_boxes.get_monsters_by_iid(monsters[1].instance_id)
+        )
+        self.assertIsNone(
+            self.monster_boxes.get_monsters_by_iid(monsters[2].instance_id)
+        )
+        self.monster_boxes.remove_box(self.box_id1)
+        self.assertEqual(self.monster_boxes.check_index(), [])
+        self.assertIsNone(
+            self.monster_boxes.get_monsters_by_iid(monsters[3].instance_id)
+        )
+
+    def test_remove_monster_not_in_boxes(self):
+        self.monster_boxes.add_monster(self.box_id1, self.monster1)
+        self.monster_boxes.remove_monster(self.monster2)
+        self.assertEqual(
+            self.monster_boxes.get_monsters(self.box_id1), [self.monster1]
+        )
+        self.assertEqual(self.monster_boxes.check_index(), [])
+
+
+class TestInventoryIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = InventoryIndex()
+        self.entries = [make_monster("rockitten"), make_monster("nut")]
+
+    def test_lookup(self):
+        self.index.sync(self.entries)
+        self.assertIs(
+            self.index.get_by_id(self.entries[1].instance_id),
+            self.entries[1],
+        )
+        self.assertIs(self.index.get_by_slug("rockitten"), self.entries[0])
+        self.assertIsNone(self.index.get_by_slug("bigfin"))
+
+    def test_added_and_removed(self):
+        self.index.sync(self.entries)
+        twin = make_monster("rockitten")
+        self.entries.append(twin)
+        self.index.added(twin)
+        first = self.entries.pop(0)
+        self.index.removed(first)
+        self.assertIs(self.index.get_by_slug("rockitten"), twin)
+        self.assertIsNone(self.index.get_by_id(first.instance_id))
+        self.assertEqual(self.index.check(self.entries), [])
+
+    def test_outside_changes(self):
+        self.index.sync(self.entries)
+        self.entries.append(make_monster("bigfin"))
+        self.assertEqual(self.index.sync(self.entries).check(self.entries), [])
+        self.assertIsNotNone(self.index.get_by_slug("bigfin"))
+        replaced = [make_monster("bigfin")]
+        self.index.sync(replaced)
+        self.assertIsNone(self.index.get_by_slug("nut"))
@@ -0,0 +1,65 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from tuxemon.db import EconomyItemModel, EconomyModel, JSONDatabase
+
+
+class TestDatabaseSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "db", "test.snapshot")
+        self.database = JSONDatabase()
+        self.database.database["economy"]["test_economy"] = EconomyModel(
+            slug="test_economy",
+            items=[EconomyItemModel(name="potion", price=20)],
+            monsters=[],
+        )
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_snapshot_key_is_stable(self):
+        self.assertEqual(
+            self.database.snapshot_key(), JSONDatabase().snapshot_key()
+        )
+
+    def test_write_and_load_snapshot(self):
+        self.database.write_snapshot(self.path, "key")
+        loaded = JSONDatabase()
+        self.assertTrue(loaded.load_snapshot(self.path, "key"))
+        economy = loaded.database["economy"]["test_economy"]
+        self.assertEqual(economy.items[0].name, "potion")
+        self.assertEqual(economy.items[0].price, 20)
+
+    def test_load_snapshot_stale_key(self):
+        self.database.write_snapshot(self.path, "key")
+        loaded = JSONDatabase()
+        self.assertFalse(loaded.load_snapshot(self.path, "other_key"))
+        self.assertEqual(loaded.database["economy"], {})
+
+    def test_load_snapshot_missing_file(self):
+        self.assertFalse(self.database.load_snapshot(self.path))
+
+    def test_load_snapshot_corrupted_file(self):
+        os.makedirs(os.path.dirname(self.path))
+        with open(self.path, "wb") as fp:
+            fp.write(b"garbage")
+        self.assertFalse(self.database.load_snapshot(self.path))
+
+    def test_snapshot_key_depends_on_pydantic(self):
+        key = self.database.snapshot_key()
+        with patch("pydantic.VERSION", "0.0.0"):
+            self.assertNotEqual(self.database.snapshot_key(), key)
+
+    def test_load_snapshot_outdated_model(self):
+        economy = self.database.database["economy"]["test_economy"]
+        # as if the model gained a field since the snapshot was written
+        del economy.__dict__["monsters"]
+        self.database.write_snapshot(self.path, "key")
+        loaded = JSONDatabase()
+        self.assertFalse(loaded.load_snapshot(self.path, "key"))
+        self.assertEqual(loaded.database["economy"], {})
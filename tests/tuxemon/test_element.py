@@ -0,0 +1,98 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import unittest
+
+from tuxemon import prepare
+from tuxemon.db import ElementItemModel, ElementModel, ElementType, db
+from tuxemon.element import Element, get_element_matrix
+from tuxemon.formula import calculate_multiplier, simple_damage_multiplier
+
+MULTIPLIERS = {
+    ElementType.fire: {ElementType.wood: 2.0, ElementType.water: 0.5},
+    ElementType.water: {ElementType.fire: 2.0, ElementType.wood: 0.5},
+    ElementType.wood: {ElementType.water: 2.0, ElementType.fire: 0.5},
+}
+
+
+def make_table() -> dict[str, ElementModel]:
+    table = {}
+    for element in ElementType:
+        against = MULTIPLIERS.get(element, {})
+        table[element.value] = ElementModel.model_construct(
+            slug=element,
+            icon="",
+            types=[
+                ElementItemModel(
+                    against=other, multiplier=against.get(other, 1.0)
+                )
+                for other in ElementType
+            ],
+        )
+    return table
+
+
+class TestElementMatrix(unittest.TestCase):
+    def setUp(self):
+        self._elements = db.database["element"]
+        db.database["element"] = make_table()
+        self.fire = Element("fire")
+        self.water = Element("water")
+        self.wood = Element("wood")
+        self.aether = Element("aether")
+
+    def tearDown(self):
+        db.database["element"] = self._elements
+
+    def test_lookup_multiplier(self):
+        self.assertEqual(self.fire.lookup_multiplier(ElementType.wood), 2.0)
+        self.assertEqual(self.fire.lookup_multiplier(ElementType.water), 0.5)
+        self.assertEqual(self.fire.lookup_multiplier(ElementType.earth), 1.0)
+
+    def test_damage_multiplier(self):
+        self.assertEqual(
+            simple_damage_multiplier([self.water], [self.fire]), 2.0
+        )
+        self.assertEqual(
+            simple_damage_multiplier([self.aether], [self.fire]), 1.0
+        )
+        self.assertEqual(
+            simple_damage_multiplier([self.water], [self.fire], {"a": 1.5}),
+            3.0,
+        )
+
+    def test_damage_multiplier_clamped(self):
+        low, high = prepare.MULTIPLIER_RANGE
+        matrix = get_element_matrix()
+        for row in matrix.damage:
+            for value in row:
+                if value is not None:
+                    self.assertTrue(low <= value <= high)
+
+    def test_type_multiplier(self):
+        self.assertEqual(
+            calculate_multiplier([self.fire, self.water], [self.wood]), 1.0
+        )
+        self.assertEqual(
+            calculate_multiplier([self.water], [self.fire, self.aether]), 2.0
+        )
+
+    def test_damage_multipliers(self):
+        attacks = [[self.fire], [self.water], [self.fire]]
+        targets = [[self.wood], [self.water, self.aether], [self.aether]]
+        matrix = get_element_matrix()
+        self.assertEqual(
+            matrix.damage_multipliers(attacks, targets),
+            [
+                [matrix.damage_multiplier(a, t) for t in targets]
+                for a in attacks
+            ],
+        )
+
+    def test_table_replaced(self):
+        table = make_table()
+        table["fire"].types[0].multiplier = 0.0
+        db.database["element"] = table
+        self.assertIsNot(get_element_matrix().table, self._elements)
+        self.assertEqual(
+            get_element_matrix().multiplier("fire", "aether"), 0.0
+        )
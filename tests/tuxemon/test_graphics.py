@@ -0,0 +1,83 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import unittest
+
+from pygame.surface import Surface
+
+from tuxemon.graphics import CachedTileset, SurfaceCache, TilesetCache
+
+
+def surface_size(surface: Surface) -> int:
+    return surface.get_pitch() * surface.get_height()
+
+
+class TestSurfaceCache(unittest.TestCase):
+    def setUp(self):
+        self.surface = Surface((16, 16))
+        self.cache = SurfaceCache(surface_size(self.surface) * 2)
+
+    def test_get_missing(self):
+        self.assertIsNone(self.cache.get("missing"))
+        self.assertEqual(self.cache.stats()["misses"], 1)
+
+    def test_put_and_get(self):
+        self.cache.put("a", self.surface)
+        self.assertIs(self.cache.get("a"), self.surface)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+        self.assertEqual(self.cache.size, surface_size(self.surface))
+
+    def test_evicts_least_recently_used(self):
+        self.cache.put("a", Surface((16, 16)))
+        self.cache.put("b", Surface((16, 16)))
+        self.cache.get("a")
+        self.cache.put("c", Surface((16, 16)))
+        self.assertIsNotNone(self.cache.get("a"))
+        self.assertIsNone(self.cache.get("b"))
+        self.assertIsNotNone(self.cache.get("c"))
+        self.assertEqual(self.cache.stats()["evictions"], 1)
+
+    def test_surface_over_budget(self):
+        self.cache.put("big", Surface((64, 64)))
+        self.assertIsNone(self.cache.get("big"))
+        self.assertEqual(self.cache.size, 0)
+
+    def test_replace_entry(self):
+        self.cache.put("a", self.surface)
+        self.cache.put("a", self.surface)
+        self.assertEqual(self.cache.size, surface_size(self.surface))
+
+    def test_clear(self):
+        self.cache.put("a", self.surface)
+        self.cache.clear()
+        self.assertIsNone(self.cache.get("a"))
+        self.assertEqual(self.cache.size, 0)
+
+
+class TestTilesetCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = TilesetCache(2)
+
+    def test_get_missing(self):
+        self.assertIsNone(self.cache.get("missing"))
+        self.assertEqual(self.cache.stats()["misses"], 1)
+
+    def test_put_and_get(self):
+        tileset = CachedTileset(Surface((32, 32)))
+        tileset.tiles[((0, 0, 16, 16), None)] = Surface((16, 16))
+        self.cache.put("a", tileset)
+        self.assertIs(self.cache.get("a"), tileset)
+        self.assertEqual(self.cache.stats()["tiles"], 1)
+
+    def test_evicts_least_recently_used(self):
+        self.cache.put("a", CachedTileset(Surface((32, 32))))
+        self.cache.put("b", CachedTileset(Surface((32, 32))))
+        self.cache.get("a")
+        self.cache.put("c", CachedTileset(Surface((32, 32))))
+        self.assertIsNotNone(self.cache.get("a"))
+        self.assertIsNone(self.cache.get("b"))
+        self.assertIsNotNone(self.cache.get("c"))
+
+    def test_clear(self):
+        self.cache.put("a", CachedTileset(Surface((32, 32))))
+        self.cache.clear()
+        self.assertIsNone(self.cache.get("a"))
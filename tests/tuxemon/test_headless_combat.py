@@ -0,0 +1,101 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import unittest
+
+from tuxemon import prepare
+
+from tuxemon.db import db
+from tuxemon.states.combat.headless import (
+    HeadlessCombat,
+    HeadlessTrainer,
+    make_monster,
+    simulate_battle,
+    simulate_matchup,
+)
+
+LEFT = [("rockitten", 20)]
+RIGHT = [("nut", 20)]
+
+
+class TestHeadlessCombat(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # other tests replace some tables with stubs
+        cls._database = dict(db.database)
+        for table in db.database:
+            db.database[table] = {}
+        db.load()
+
+    @classmethod
+    def tearDownClass(cls):
+        db.database.clear()
+        db.database.update(cls._database)
+
+    def test_battle_has_a_winner(self):
+        result = simulate_battle(1, (LEFT, RIGHT))
+        self.assertIn(result.winner, (0, 1))
+        self.assertGreater(result.turns, 0)
+        self.assertTrue(result.techniques)
+
+    def test_same_seed_same_battle(self):
+        self.assertEqual(
+            simulate_battle(3, (LEFT, RIGHT)),
+            simulate_battle(3, (LEFT, RIGHT)),
+        )
+
+    def test_max_turns(self):
+        result = simulate_battle(1, (LEFT, RIGHT), max_turns=1)
+        self.assertLessEqual(result.turns, 1)
+
+    def test_matchup(self):
+        result = simulate_matchup((LEFT, RIGHT), 4, seed=5)
+        self.assertEqual(result.battles, 4)
+        self.assertEqual(sum(result.wins) + result.draws, 4)
+        # the parties swap sides, the wins are still by party
+        swapped = simulate_matchup((RIGHT, LEFT), 4, seed=5)
+        self.assertEqual(sum(swapped.wins), sum(result.wins))
+        for stats in result.techniques.values():
+            self.assertLessEqual(stats["wins"], stats["battles"])
+
+    def test_clean_combat(self):
+        players = (
+            HeadlessTrainer("left", [make_monster(*LEFT[0])]),
+            HeadlessTrainer("right", [make_monster(*RIGHT[0])]),
+        )
+        combat = HeadlessCombat(players)
+        combat.run()
+        self.assertEqual(combat._action_queue.queue, [])
+        self.assertEqual(combat._damage_map, [])
+        self.assertEqual(combat._combat_variables, {})
+        for player in players:
+            self.assertEqual(player.max_position, 1)
+
+    def test_trainer_is_a_complete_npc(self):
+        trainer = HeadlessTrainer("left", [make_monster(*LEFT[0])])
+        for _ in range(trainer.party_limit):
+            trainer.add_monster(make_monster(*RIGHT[0]), len(trainer.monsters))
+        self.assertEqual(len(trainer.monsters), trainer.party_limit)
+        self.assertTrue(trainer.monster_boxes.get_monsters(prepare.KENNEL))
+        self.assertEqual(trainer.check_index(), [])
+
+    def test_guard_skips_missing_game(self):
+        combat = HeadlessCombat(
+            (HeadlessTrainer("left", []), HeadlessTrainer("right", []))
+        )
+
+        def needs_client():
+            raise AttributeError("'NoneType' object has no attribute 'x'")
+
+        combat.guard(needs_client, "technique", "test")
+        self.assertEqual(combat._errors, 1)
+
+    def test_guard_raises_bugs(self):
+        combat = HeadlessCombat(
+            (HeadlessTrainer("left", []), HeadlessTrainer("right", []))
+        )
+
+        def bug():
+            raise TypeError("unsupported operand")
+
+        with self.assertRaises(TypeError):
+            combat.guard(bug, "technique", "test")
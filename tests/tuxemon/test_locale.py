@@ -0,0 +1,89 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import unittest
+from unittest.mock import MagicMock
+
+from tuxemon import prepare
+from tuxemon.db import SeenStatus
+from tuxemon.locale import parse_template, replace_text
+
+
+class TestReplaceText(unittest.TestCase):
+    def setUp(self):
+        self.session = MagicMock()
+        player = self.session.player
+        player.name = "Red"
+        player.money = {"player": 150}
+        player.steps = 0
+        player.tuxepedia = {
+            "rockitten": SeenStatus.caught,
+            "nut": SeenStatus.seen,
+        }
+        player.game_variables = {"unit_measure": prepare.METRIC, "x": 3}
+        monster = MagicMock(level=5, current_hp=12, hp=20)
+        monster.name = "Rockitten"
+        player.monsters = [monster]
+
+    def test_player(self):
+        self.assertEqual(
+            replace_text(
+                self.session, "${{name}} has ${{money}}${{currency}}"
+            ),
+            "Red has 150$",
+        )
+        self.assertEqual(replace_text(self.session, "${{NAME}}"), "RED")
+
+    def test_tuxepedia(self):
+        self.assertEqual(
+            replace_text(
+                self.session, "${{tuxepedia_seen}}/${{tuxepedia_caught}}"
+            ),
+            "2/1",
+        )
+
+    def test_units(self):
+        self.assertEqual(
+            replace_text(self.session, "${{weight}}"), prepare.U_KG
+        )
+        self.session.player.game_variables["unit_measure"] = "imperial"
+        self.assertEqual(
+            replace_text(self.session, "${{weight}}"), prepare.U_LB
+        )
+
+    def test_monster(self):
+        self.assertEqual(
+            replace_text(
+                self.session,
+                "${{monster_0_name}} Lv.${{monster_0_level}} "
+                "${{monster_0_hp}}/${{monster_0_hp_max}}",
+            ),
+            "Rockitten Lv.5 12/20",
+        )
+
+    def test_missing_monster_is_left_as_is(self):
+        self.assertEqual(
+            replace_text(self.session, "${{monster_1_name}}"),
+            "${{monster_1_name}}",
+        )
+
+    def test_game_variables(self):
+        self.assertEqual(replace_text(self.session, "${{var:x}}"), "3")
+        self.assertEqual(
+            replace_text(self.session, "${{var:unknown}}"), "${{var:unknown}}"
+        )
+
+    def test_unknown_placeholder_and_newlines(self):
+        self.assertEqual(
+            replace_text(self.session, r"${{foo}}\n${{name}}"),
+            "${{foo}}\nRed",
+        )
+
+    def test_only_present_placeholders_are_resolved(self):
+        self.session.client.map_name = None
+        self.assertEqual(replace_text(self.session, "${{name}}"), "Red")
+
+    def test_parse_template(self):
+        self.assertEqual(
+            parse_template("Hi ${{name}}, ${{var:x}}!"),
+            ("Hi ", "name", ", ", "var:x", "!"),
+        )
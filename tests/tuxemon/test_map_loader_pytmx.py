@@ -1,13 +1,26 @@
 # SPDX-License-Identifier: GPL-3.0
 # Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import shutil
+import tempfile
 import unittest
 from itertools import combinations
 from operator import is_not
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
+from tuxemon import prepare
 from tuxemon.db import Direction as Dir
 from tuxemon.map import RegionProperties as RP
-from tuxemon.map_loader import TMXMapLoader
+from tuxemon.map_loader import (
+    CachedMap,
+    CompiledMap,
+    MapCache,
+    TMXMapLoader,
+    artifact_key,
+    get_artifact_path,
+    load_map,
+    read_artifact,
+    write_artifact,
+)
 
 
 class TestTMXMapLoaderRegionTiles(unittest.TestCase):
@@ -73,3 +86,97 @@ class TestTMXMapLoaderRegionTiles(unittest.TestCase):
             ],
             self.result,
         )
+
+
+class TestMapCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = MapCache(2)
+        self.parsed = []
+
+        def parse(path, load_images):
+            txmn_map = Mock(
+                events=[],
+                inits=[],
+                surface_map={},
+                collision_map={(0, 0): None},
+                collision_lines_map=set(),
+                filename=path,
+                maps={},
+            )
+            txmn_map.data.width = txmn_map.data.height = 1
+            self.parsed.append(path)
+            return CachedMap(txmn_map, {}, True)
+
+        patcher = patch.object(MapCache, "parse", side_effect=parse)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_second_load_is_a_hit(self):
+        self.cache.load("a.tmx")
+        self.cache.load("a.tmx")
+        self.assertEqual(self.parsed, ["a.tmx"])
+        self.assertEqual(self.cache.stats()["hits"], 1)
+        self.assertEqual(self.cache.stats()["misses"], 1)
+
+    def test_loaded_maps_dont_share_collisions(self):
+        first = self.cache.load("a.tmx")
+        first.collision_map[(1, 1)] = None
+        second = self.cache.load("a.tmx")
+        self.assertNotIn((1, 1), second.collision_map)
+
+    def test_least_recently_used_is_evicted(self):
+        self.cache.load("a.tmx")
+        self.cache.load("b.tmx")
+        self.cache.load("a.tmx")
+        self.cache.load("c.tmx")
+        self.cache.load("a.tmx")
+        self.cache.load("b.tmx")
+        self.assertEqual(self.parsed, ["a.tmx", "b.tmx", "c.tmx", "b.tmx"])
+
+    def test_stale_map_is_parsed_again(self):
+        self.cache.load("a.tmx")
+        with patch.object(CachedMap, "is_stale", return_value=True):
+            self.cache.load("a.tmx")
+        self.assertEqual(self.parsed, ["a.tmx", "a.tmx"])
+
+    def test_prefetch(self):
+        self.cache.prefetch(["a.tmx"])
+        self.cache.load("a.tmx")
+        self.assertEqual(self.parsed, ["a.tmx"])
+        self.assertEqual(self.cache.stats()["pending"], 0)
+
+
+class TestMapArtifacts(unittest.TestCase):
+    def setUp(self):
+        self.artifact_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.artifact_dir)
+        self.path = prepare.fetch("maps", "player_house_bedroom.tmx")
+
+    def test_artifact_is_reused(self):
+        first = load_map(self.path, False, self.artifact_dir)
+        with patch.object(TMXMapLoader, "compile") as compile_:
+            second = load_map(self.path, False, self.artifact_dir)
+        compile_.assert_not_called()
+        self.assertEqual(first.collision_map, second.collision_map)
+        self.assertEqual(first.surface_map, second.surface_map)
+        self.assertEqual(first.events, second.events)
+
+    def test_stale_artifact_is_rebuilt(self):
+        artifact_path = get_artifact_path(self.artifact_dir, self.path)
+        compiled = CompiledMap([], [], {}, {}, set())
+        write_artifact(artifact_path, "stale", compiled)
+        txmn_map = load_map(self.path, False, self.artifact_dir)
+        self.assertTrue(txmn_map.collision_map)
+
+    def test_key_depends_on_sources(self):
+        with tempfile.NamedTemporaryFile("w", suffix=".yaml") as fp:
+            before = artifact_key(self.path, [fp.name])
+            fp.write("events: {}")
+            fp.flush()
+            self.assertNotEqual(before, artifact_key(self.path, [fp.name]))
+
+    def test_invalid_artifact(self):
+        artifact_path = get_artifact_path(self.artifact_dir, self.path)
+        with open(artifact_path, "wb") as fp:
+            fp.write(b"not a pickle")
+        self.assertIsNone(read_artifact(artifact_path, "key"))
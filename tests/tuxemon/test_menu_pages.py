@@ -0,0 +1,77 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import unittest
+
+from tuxemon.menu.menu import MenuImageCache, get_neighbour_pages, get_page
+
+SPRITE = "gfx/sprites/battle/rockitten-front.png"
+
+
+class TestGetPage(unittest.TestCase):
+    def test_pages(self):
+        items = list(range(10))
+        self.assertEqual(get_page(items, 0, 4), [0, 1, 2, 3])
+        self.assertEqual(get_page(items, 2, 4), [8, 9])
+
+    def test_pages_wrap_around(self):
+        items = list(range(10))
+        self.assertEqual(get_page(items, 3, 4), [0, 1, 2, 3])
+        self.assertEqual(get_page(items, -1, 4), [8, 9])
+
+    def test_empty(self):
+        self.assertEqual(get_page([], 0, 4), [])
+        self.assertEqual(get_page([], 1, 4), [])
+
+
+class TestGetNeighbourPages(unittest.TestCase):
+    def test_neighbours(self):
+        self.assertEqual(get_neighbour_pages(1, 5), [2, 0])
+        self.assertEqual(get_neighbour_pages(0, 5), [1, 4])
+
+    def test_two_pages(self):
+        self.assertEqual(get_neighbour_pages(0, 2), [1])
+        self.assertEqual(get_neighbour_pages(1, 2), [0])
+
+    def test_single_page(self):
+        self.assertEqual(get_neighbour_pages(0, 1), [])
+        self.assertEqual(get_neighbour_pages(0, 0), [])
+
+
+class TestMenuImageCache(unittest.TestCase):
+    def setUp(self):
+        self.cache = MenuImageCache(2)
+
+    def test_scaled_copies(self):
+        image = self.cache.get(SPRITE, 2, 2)
+        again = self.cache.get(SPRITE, 2, 2)
+        self.assertIsNot(image, again)
+        self.assertEqual(image.get_size(), again.get_size())
+        self.assertEqual(self.cache.stats()["misses"], 1)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+        # a copy can be modified without affecting the cached image
+        image.scale(2, 2)
+        self.assertEqual(
+            self.cache.get(SPRITE, 2, 2).get_size(), again.get_size()
+        )
+
+    def test_scale_is_part_of_the_key(self):
+        small = self.cache.get(SPRITE, 1, 1)
+        big = self.cache.get(SPRITE, 2, 2)
+        self.assertEqual(big.get_width(), small.get_width() * 2)
+        self.assertEqual(self.cache.stats()["images"], 2)
+
+    def test_prefetch(self):
+        self.cache.prefetch(SPRITE, 1, 1)
+        self.cache.prefetch(SPRITE, 1, 1)
+        self.assertEqual(self.cache.stats()["misses"], 1)
+        self.cache.get(SPRITE, 1, 1)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_evict_least_recently_used(self):
+        self.cache.get(SPRITE, 1, 1)
+        self.cache.get(SPRITE, 2, 2)
+        self.cache.get(SPRITE, 1, 1)
+        self.cache.get(SPRITE, 3, 3)
+        self.assertEqual(self.cache.stats()["images"], 2)
+        self.cache.get(SPRITE, 1, 1)
+        self.assertEqual(self.cache.stats()["misses"], 3)
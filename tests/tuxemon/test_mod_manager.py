@@ -0,0 +1,247 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+import unittest
+import zipfile
+from collections import Counter
+from dataclasses import replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+from tuxemon.mod_manager import Manager
+from tuxemon.mod_manager.downloader import (
+    ChecksumError,
+    Downloader,
+    Release,
+)
+
+
+def make_zip(name: str) -> bytes:
+    data = io.BytesIO()
+    with zipfile.ZipFile(data, "w") as zipf:
+        zipf.writestr("mod.conf", f"name = {name}\n" + "x" * 4096)
+    return data.getvalue()
+
+
+PACKAGES = {
+    "alice/base": make_zip("base"),
+    "bob/maps": make_zip("maps"),
+    "bob/music": make_zip("music"),
+}
+DEPENDENCIES = {
+    "alice/base": [
+        {"name": "maps", "packages": ["bob/maps"]},
+        {"name": "music", "packages": ["bob/music", "default"]},
+    ],
+    "bob/maps": [{"name": "music", "packages": ["bob/music"]}],
+}
+
+
+class FakeServer(BaseHTTPRequestHandler):
+    """Content server serving the fake packages, release 1 only."""
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+    def send_body(self, body: bytes, status: int = 200) -> None:
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self) -> None:
+        server = self.server
+        parts = self.path.split("?")[0].strip("/").split("/")
+        if parts[:2] == ["api", "packages"] and parts[4] == "releases":
+            package = PACKAGES["/".join(parts[2:4])]
+            sha256 = server.sha256 or hashlib.sha256(package).hexdigest()
+            body = json.dumps([{"id": 1, "sha256": sha256}]).encode()
+            self.send_body(body)
+        elif parts[:2] == ["api", "packages"]:
+            body = json.dumps(
+                {"/".join(parts[2:4]): DEPENDENCIES["/".join(parts[2:4])]}
+            ).encode()
+            self.send_body(body)
+        else:
+            package = "/".join(parts[1:3])
+            server.downloads[package] += 1
+            body = PACKAGES[package]
+            range_header = self.headers.get("Range")
+            if range_header and server.ranges:
+                server.range_requests.append(range_header)
+                start = int(range_header[6:].rstrip("-"))
+                self.send_response(206)
+                self.send_header(
+                    "Content-Range",
+                    f"bytes {start}-{len(body) - 1}/{len(body)}",
+                )
+                self.send_header("Content-Length", str(len(body) - start))
+                self.end_headers()
+                self.wfile.write(body[start:])
+            else:
+                self.send_body(body)
+
+
+class ModManagerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), FakeServer)
+        self.server.downloads = Counter()
+        self.server.range_requests = []
+        self.server.ranges = True
+        self.server.sha256 = None
+        self.url = f"http://127.0.0.1:{self.server.server_port}"
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.tmp.name, "cache")
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+        self.tmp.cleanup()
+
+    def release(self, package: str) -> Release:
+        author, name = package.split("/")
+        return Release(
+            author,
+            name,
+            1.0,
+            f"{self.url}/packages/{package}/releases/1.0/download",
+            hashlib.sha256(PACKAGES[package]).hexdigest(),
+        )
+
+
+class TestDownloader(ModManagerTestCase):
+    def test_fetch_uses_cache(self):
+        downloader = Downloader(self.cache_dir)
+        release = self.release("alice/base")
+        path = downloader.fetch(release)
+        with open(path, "rb") as fp:
+            self.assertEqual(fp.read(), PACKAGES["alice/base"])
+        self.assertEqual(downloader.fetch(release), path)
+        self.assertEqual(self.server.downloads["alice/base"], 1)
+
+    def test_fetch_resumes_part_file(self):
+        downloader = Downloader(self.cache_dir)
+        release = self.release("alice/base")
+        body = PACKAGES["alice/base"]
+        os.makedirs(self.cache_dir)
+        with open(downloader.path(release) + ".part", "wb") as fp:
+            fp.write(body[:1000])
+        path = downloader.fetch(release)
+        self.assertEqual(self.server.range_requests, ["bytes=1000-"])
+        with open(path, "rb") as fp:
+            self.assertEqual(fp.read(), body)
+        self.assertFalse(os.path.exists(path + ".part"))
+
+    def test_fetch_restarts_without_range_support(self):
+        self.server.ranges = False
+        downloader = Downloader(self.cache_dir)
+        release = self.release("alice/base")
+        os.makedirs(self.cache_dir)
+        with open(downloader.path(release) + ".part", "wb") as fp:
+            fp.write(b"garbage")
+        with open(downloader.fetch(release), "rb") as fp:
+            self.assertEqual(fp.read(), PACKAGES["alice/base"])
+
+    def test_fetch_checks_hash(self):
+        downloader = Downloader(self.cache_dir)
+        release = self.release("alice/base")
+        with self.assertRaises(ChecksumError):
+            downloader.fetch(replace(release, sha256="0" * 64))
+        self.assertEqual(os.listdir(self.cache_dir), [])
+
+    def test_fetch_without_hash_uses_cache(self):
+        downloader = Downloader(self.cache_dir)
+        release = replace(self.release("alice/base"), sha256=None)
+        path = downloader.fetch(release)
+        self.assertEqual(downloader.fetch(release), path)
+        self.assertEqual(self.server.downloads["alice/base"], 1)
+
+    def test_fetch_without_hash_replaces_truncated_file(self):
+        downloader = Downloader(self.cache_dir)
+        release = replace(self.release("alice/base"), sha256=None)
+        body = PACKAGES["alice/base"]
+        path = downloader.fetch(release)
+        with open(path, "wb") as fp:
+            fp.write(body[:1000])
+        self.assertFalse(downloader.is_cached(release))
+        with open(downloader.fetch(release), "rb") as fp:
+            self.assertEqual(fp.read(), body)
+        self.assertEqual(self.server.downloads["alice/base"], 2)
+
+    def test_fetch_without_hash_ignores_unchecked_file(self):
+        downloader = Downloader(self.cache_dir)
+        release = replace(self.release("alice/base"), sha256=None)
+        os.makedirs(self.cache_dir)
+        with open(downloader.path(release), "wb") as fp:
+            fp.write(b"garbage")
+        with open(downloader.fetch(release), "rb") as fp:
+            self.assertEqual(fp.read(), PACKAGES["alice/base"])
+
+    def test_fetch_all(self):
+        downloader = Downloader(self.cache_dir)
+        releases = [self.release(package) for package in PACKAGES]
+        paths = downloader.fetch_all(releases)
+        for package, path in zip(PACKAGES, paths):
+            with open(path, "rb") as fp:
+                self.assertEqual(fp.read(), PACKAGES[package])
+
+
+class TestManager(ModManagerTestCase):
+    def setUp(self):
+        super().setUp()
+        base = os.path.join(self.tmp.name, "base")
+        os.makedirs(os.path.join(base, "mods"))
+        for name, value in (
+            ("BASEDIR", base),
+            ("CACHE_DIR", self.cache_dir),
+            ("USER_GAME_DATA_DIR", self.tmp.name),
+        ):
+            patcher = patch(f"tuxemon.constants.paths.{name}", value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.manager = Manager(self.url, default_to_cache=False)
+
+    def test_resolve_dependencies(self):
+        dependencies = self.manager.resolve_dependencies(
+            "alice", "base", self.url
+        )
+        self.assertEqual(dependencies, [("bob", "maps"), ("bob", "music")])
+
+    def test_resolve_dependencies_skips_installed(self):
+        os.makedirs(os.path.join(self.tmp.name, "base", "mods", "maps"))
+        dependencies = self.manager.resolve_dependencies(
+            "alice", "base", self.url, done=["bob/music"]
+        )
+        self.assertEqual(dependencies, [])
+
+    def test_download_package(self):
+        self.manager.download_package(
+            "alice", "base", release=None, repo=self.url + "/"
+        )
+        self.assertEqual(
+            self.server.downloads,
+            Counter({"alice/base": 1, "bob/maps": 1, "bob/music": 1}),
+        )
+        for name in ("base", "maps", "music"):
+            path = os.path.join(self.tmp.name, "base", "mods", name)
+            self.assertTrue(os.path.exists(os.path.join(path, "mod.conf")))
+
+        self.manager.download_package(
+            "alice", "base", release=1, repo=self.url, dont_extract=True
+        )
+        self.assertEqual(self.server.downloads["alice/base"], 1)
+
+    def test_download_package_bad_hash(self):
+        self.server.sha256 = "0" * 64
+        with self.assertRaises(ChecksumError):
+            self.manager.download_package(
+                "alice", "base", release=1, repo=self.url, install_deps=False
+            )
@@ -4,6 +4,7 @@ import unittest
 from unittest import mock
 
 from tuxemon import prepare
+from tuxemon.boxes import InventoryIndex
 from tuxemon.client import LocalPygameClient
 from tuxemon.db import (
     ConditionModel,
@@ -22,6 +23,8 @@ def mockPlayer(self) -> None:
     self.money = {}
     self.game_variables = {}
     self.tuxepedia = {}
+    self._monster_index = InventoryIndex()
+    self._item_index = InventoryIndex()
 
 
 class TestMonsterActions(unittest.TestCase):
@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pygame
+
+from tuxemon.audio import SoundManager
+from tuxemon.graphics import scaled_image_key, surface_cache
+from tuxemon.prefetch import AssetPrefetcher
+
+
+class TestAssetPrefetcher(unittest.TestCase):
+    def setUp(self):
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+        self.tmp = tempfile.TemporaryDirectory()
+        self.files = []
+        for i in range(3):
+            filename = os.path.join(self.tmp.name, f"spark_{i:02}.png")
+            pygame.image.save(pygame.Surface((8, 8)), filename)
+            self.files.append(filename)
+        patcher = patch(
+            "tuxemon.prefetch.animation_files",
+            side_effect=lambda slug: self.files if slug == "spark" else [],
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        for filename in self.files:
+            surface_cache._surfaces.pop(scaled_image_key(filename), None)
+        self.tmp.cleanup()
+
+    def test_frames_are_cached(self):
+        prefetcher = AssetPrefetcher()
+        prefetcher.start(["spark", "spark"])
+        prefetcher.finish()
+        self.assertTrue(prefetcher.done)
+        for filename in self.files:
+            self.assertIn(scaled_image_key(filename), surface_cache)
+
+    def test_warm_ups_run_after_loading(self):
+        cached = []
+
+        def warm_up():
+            cached.append(scaled_image_key(self.files[-1]) in surface_cache)
+
+        prefetcher = AssetPrefetcher()
+        prefetcher.start(["spark"], warm_ups=[warm_up])
+        prefetcher.finish()
+        self.assertEqual(cached, [True])
+
+    def test_update_respects_budget(self):
+        warm_ups = [MagicMock() for _ in range(3)]
+        prefetcher = AssetPrefetcher(budget=0)
+        prefetcher.start([], warm_ups=warm_ups)
+        prefetcher._thread.join()
+        prefetcher.update()
+        self.assertFalse(prefetcher.done)
+        prefetcher.finish()
+        for warm_up in warm_ups:
+            warm_up.assert_called_once_with()
+
+    def test_cancel(self):
+        warm_up = MagicMock()
+        prefetcher = AssetPrefetcher()
+        prefetcher.start(["spark"], warm_ups=[warm_up])
+        prefetcher.cancel()
+        prefetcher.finish()
+        self.assertTrue(prefetcher.done)
+        warm_up.assert_not_called()
+
+
+class TestPreloadSound(unittest.TestCase):
+    def test_preloaded_sound_is_used(self):
+        manager = SoundManager()
+        sound = MagicMock()
+        manager.preload_sound("sound_spark", sound)
+        with patch.object(manager, "get_sound_filename") as get_filename:
+            wrapper = manager.load_sound("sound_spark", 0.5)
+        get_filename.assert_not_called()
+        self.assertIs(wrapper.sound, sound)
+        sound.set_volume.assert_called_once_with(0.5)
+        self.assertIs(manager.load_sound("sound_spark"), wrapper)
@@ -0,0 +1,196 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import base64
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pygame
+
+from tuxemon import prepare, save, save_writer
+
+
+def make_save_data(name: str = "Red", time: str = "2024-01-02 03:04"):
+    screenshot = pygame.Surface((64, 32))
+    screenshot.fill((10, 200, 30))
+    return {
+        "screenshot": base64.b64encode(
+            pygame.image.tobytes(screenshot, "RGB")
+        ).decode(),
+        "screenshot_width": 64,
+        "screenshot_height": 32,
+        "time": time,
+        "version": save.SAVE_VERSION,
+        "player_name": name,
+        "current_map": "taba_town.tmx",
+        "player_steps": 42.0,
+        "template": {"sprite_name": "", "combat_front": "", "slug": ""},
+        "monsters": [],
+        "monster_boxes": {},
+        "item_boxes": {},
+        "tuxepedia": {},
+        "inventory": [],
+    }
+
+
+class TestSaveMetadata(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        patcher = patch.object(
+            prepare, "SAVE_PATH", os.path.join(self.tmp.name, "slot")
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_save_writes_metadata(self):
+        save.save(make_save_data(), 1)
+        save_writer.save_writer.flush()
+        self.assertTrue(os.path.exists(save.get_metadata_path(1)))
+        metadata = save.load_metadata(1)
+        self.assertEqual(metadata["player_name"], "Red")
+        self.assertEqual(metadata["time"], "2024-01-02 03:04")
+        self.assertEqual(metadata["current_map"], "taba_town.tmx")
+        thumbnail = save.load_thumbnail(metadata)
+        self.assertEqual(thumbnail.get_size(), (16, 8))
+
+    def test_metadata_does_not_load_save(self):
+        save.save(make_save_data(), 1)
+        save_writer.save_writer.flush()
+        with patch.object(save, "load") as load:
+            save.load_metadata(1)
+        load.assert_not_called()
+
+    def test_missing_slot(self):
+        self.assertIsNone(save.load_metadata(2))
+
+    def test_rebuilds_missing_metadata(self):
+        save.save(make_save_data(), 1)
+        save_writer.save_writer.flush()
+        os.remove(save.get_metadata_path(1))
+        metadata = save.load_metadata(1)
+        self.assertEqual(metadata["player_name"], "Red")
+        self.assertTrue(os.path.exists(save.get_metadata_path(1)))
+
+    def test_rebuilds_stale_metadata(self):
+        save.save(make_save_data(), 1)
+        save_writer.save_writer.flush()
+        with open(save.get_metadata_path(1)) as fp:
+            metadata = json.load(fp)
+        metadata["player_name"] = "Old"
+        metadata["save_size"] -= 1
+        with open(save.get_metadata_path(1), "w") as fp:
+            json.dump(metadata, fp)
+        self.assertEqual(save.load_metadata(1)["player_name"], "Red")
+
+    def test_broken_save(self):
+        with open(save.get_save_path(1), "w") as fp:
+            fp.write("{}")
+        metadata = save.load_metadata(1)
+        self.assertIn("error", metadata)
+        self.assertFalse(os.path.exists(save.get_metadata_path(1)))
+
+    def test_latest_save(self):
+        save.save(make_save_data(time="2024-01-02 03:04"), 1)
+        save.save(make_save_data(time="2024-05-02 03:04"), 2)
+        save.save(make_save_data(time="2023-01-02 03:04"), 3)
+        self.assertEqual(save.get_index_of_latest_save(), 1)
+
+
+class TestCompactSave(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        patcher = patch.object(
+            prepare, "SAVE_PATH", os.path.join(self.tmp.name, "slot")
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        method = patch.object(prepare, "SAVE_METHOD", "COMPACT")
+        method.start()
+        self.addCleanup(method.stop)
+        self.addCleanup(self.tmp.cleanup)
+
+    def test_round_trip(self):
+        save_data = make_save_data()
+        save.save(save_data, 1)
+        loaded = save.load(1)
+        self.assertEqual(loaded["screenshot_format"], "png")
+        self.assertEqual(loaded["player_name"], "Red")
+        self.assertEqual(loaded["current_map"], "taba_town.tmx")
+        screenshot = save.decode_screenshot(loaded)
+        self.assertEqual(screenshot.get_size(), (64, 32))
+        self.assertEqual(screenshot.get_at((5, 5))[:3], (10, 200, 30))
+
+    def test_is_compact(self):
+        save.save(make_save_data(), 1)
+        save_writer.save_writer.flush()
+        with open(save.get_save_path(1), "rb") as fp:
+            self.assertTrue(save_writer.is_compact(fp.read()))
+
+    def test_smaller_than_json(self):
+        save.save(make_save_data(), 1)
+        save_writer.save_writer.flush()
+        compact_size = os.path.getsize(save.get_save_path(1))
+        with patch.object(prepare, "SAVE_METHOD", "JSON"):
+            save.save(make_save_data(), 2)
+        self.assertLess(compact_size, os.path.getsize(save.get_save_path(2)))
+
+    def test_loads_json_save(self):
+        with patch.object(prepare, "SAVE_METHOD", "JSON"):
+            save.save(make_save_data(), 1)
+        self.assertEqual(save.load(1)["player_name"], "Red")
+
+    def test_metadata(self):
+        save.save(make_save_data(), 1)
+        metadata = save.load_metadata(1)
+        self.assertEqual(metadata["player_name"], "Red")
+        self.assertEqual(save.load_thumbnail(metadata).get_size(), (16, 8))
+
+    def test_snapshot(self):
+        save_data = make_save_data()
+        with patch.object(save_writer.save_writer, "submit") as submit:
+            save.save(save_data, 1)
+        save_data["player_name"] = "Changed"
+        submit.call_args.args[1]()
+        self.assertEqual(save.load(1)["player_name"], "Red")
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            save_writer.load_compact(save_writer.MAGIC + b"\x01")
+        with self.assertRaises(ValueError):
+            save_writer.load_compact(b"{}")
+
+
+class TestSaveWriter(unittest.TestCase):
+    def test_callback_runs_on_poll(self):
+        writer = save_writer.SaveWriter()
+        results = []
+        writer.submit("a", lambda: None, results.append)
+        writer.flush()
+        self.assertEqual(results, [])
+        writer.poll()
+        self.assertEqual(results, [None])
+
+    def test_error_is_reported(self):
+        writer = save_writer.SaveWriter()
+        results = []
+
+        def fail():
+            raise OSError("disk full")
+
+        with self.assertLogs("tuxemon.save_writer", "ERROR"):
+            writer.submit("a", fail, results.append)
+            writer.flush()
+        writer.poll()
+        self.assertIsInstance(results[0], OSError)
+
+    def test_writes_in_order(self):
+        writer = save_writer.SaveWriter()
+        order = []
+        for i in range(5):
+            writer.submit("a", lambda i=i: order.append(i))
+        writer.wait("a")
+        self.assertEqual(order, list(range(5)))
+        self.assertFalse(writer.busy)
@@ -0,0 +1,91 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import unittest
+from unittest.mock import MagicMock, patch
+
+import pygame
+
+from tuxemon.db import db
+from tuxemon.element import get_element
+from tuxemon.item.item import Item
+from tuxemon.locale import T
+from tuxemon.monster import Monster
+from tuxemon.session import local_session
+from tuxemon.technique.technique import Technique, technique_templates
+
+
+class TestSlugCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        pygame.display.init()
+        pygame.display.set_mode((1, 1))
+        # other tests replace some tables with stubs, load the real ones
+        # and put everything back afterwards
+        cls._patchers = [
+            patch.dict(db.database, {table: {} for table in db.database}),
+            patch.dict(db.preloaded, {table: {} for table in db.database}),
+        ]
+        for patcher in cls._patchers:
+            patcher.start()
+        db.load()
+
+    @classmethod
+    def tearDownClass(cls):
+        for patcher in reversed(cls._patchers):
+            patcher.stop()
+
+    def test_techniques_share_template(self):
+        first = Technique(save_data={"slug": "ram"})
+        second = Technique(save_data={"slug": "ram", "counter": 3})
+        self.assertIs(first.effects, second.effects)
+        self.assertIs(first.conditions, second.conditions)
+        self.assertIs(first.types, second.types)
+        self.assertIs(first.types[0], get_element(first.types[0].slug))
+        self.assertEqual((first.counter, second.counter), (0, 3))
+        self.assertFalse(hasattr(first, "__dict__"))
+
+    def test_state_is_not_shared(self):
+        first = Technique(save_data={"slug": "ram"})
+        second = Technique(save_data={"slug": "ram"})
+        first.next_use = 2
+        first.power = 5.0
+        self.assertEqual(second.next_use, 0)
+        self.assertNotEqual(second.power, 5.0)
+
+    def test_rebuilt_when_entry_is_replaced(self):
+        template = technique_templates.get("ram")
+        model = db.database["technique"]["ram"]
+        replaced = model.model_copy(update={"effects": []})
+        with patch.dict(db.database["technique"], {"ram": replaced}):
+            self.assertEqual(Technique(save_data={"slug": "ram"}).effects, ())
+        self.assertEqual(
+            technique_templates.get("ram").effects, template.effects
+        )
+
+    def test_rebuilt_when_language_changes(self):
+        name = Technique(save_data={"slug": "ram"}).name
+        with patch.object(T, "translate", lambda text: text.upper()):
+            self.assertEqual(Technique(save_data={"slug": "ram"}).name, "RAM")
+        self.assertEqual(Technique(save_data={"slug": "ram"}).name, name)
+
+    def test_monsters_share_template(self):
+        first = Monster(save_data={"slug": "rockitten"})
+        second = Monster(save_data={"slug": "rockitten"})
+        self.assertIs(first.types[0], second.types[0])
+        self.assertEqual(first.front_battle_sprite, second.front_battle_sprite)
+        first.types = []
+        self.assertTrue(second.types)
+
+    def test_items_share_template(self):
+        first = Item(save_data={"slug": "potion"})
+        second = Item(save_data={"slug": "potion", "quantity": 4})
+        self.assertIs(first.effects, second.effects)
+        self.assertEqual((first.quantity, second.quantity), (1, 4))
+
+    def test_shared_effects_use_current_player(self):
+        item = Item(save_data={"slug": "tuxeball"})
+        technique = Technique(save_data={"slug": "menu_run"})
+        player = MagicMock()
+        with patch.object(local_session, "player", player):
+            self.assertIs(item.effects[0].user, player)
+            self.assertIs(technique.conditions[0].player, player)
@@ -8,6 +8,8 @@ from pygame import Rect
 
 from tuxemon.ui.draw import (
     GraphicBox,
+    LabelCache,
+    TextCache,
     blit_alpha,
     build_line,
     constrain_width,
@@ -259,3 +261,100 @@ class TestBlitAlphaFunction(unittest.TestCase):
         self.target_surface.fill((0, 0, 0))
         blit_alpha(self.target_surface, self.source_surface, (0, 0), -1)
         self.assertEqual(self.target_surface.get_at((0, 0)), (0, 0, 0))
+
+
+class TestTextCache(unittest.TestCase):
+
+    def setUp(self):
+        pygame.init()
+        self.font = pygame.font.SysFont("Arial", 24)
+        self.cache = TextCache(4, 4)
+
+    def test_glyph_is_cached(self):
+        first = self.cache.glyph(self.font, (0, 0, 0), (255, 255, 255), "a")
+        second = self.cache.glyph(self.font, [0, 0, 0], "white", "a")
+        self.assertIs(first, second)
+        self.assertEqual(self.cache.stats()["hits"], 1)
+
+    def test_glyph_depends_on_colors(self):
+        first = self.cache.glyph(self.font, (0, 0, 0), (255, 255, 255), "a")
+        second = self.cache.glyph(self.font, (255, 0, 0), (255, 255, 255), "a")
+        self.assertIsNot(first, second)
+
+    def test_glyph_eviction(self):
+        for char in "abcde":
+            self.cache.glyph(self.font, (0, 0, 0), (255, 255, 255), char)
+        self.assertEqual(self.cache.stats()["glyphs"], 4)
+
+    def test_offsets_match_prefix_width(self):
+        line = "This is a test"
+        offsets = self.cache.offsets(self.font, line)
+        self.assertEqual(
+            offsets,
+            [self.font.size(line[:i])[0] for i in range(len(line))],
+        )
+
+    def test_lines_match_constrain_width(self):
+        text = "This is a test message that is too long for the width"
+        self.assertEqual(
+            self.cache.lines(self.font, text, 100),
+            list(constrain_width(text, self.font, 100)),
+        )
+        self.cache.lines(self.font, text, 100)
+        self.assertEqual(self.cache.stats()["lines"], 1)
+
+    def test_lines_too_large(self):
+        with self.assertRaises(RuntimeError):
+            self.cache.lines(self.font, "a" * 100, 10)
+        self.assertEqual(self.cache.stats()["lines"], 0)
+
+    def test_iter_render_text_positions(self):
+        rect = pygame.Rect(0, 0, 400, 200)
+        line = "Test message"
+        renders = list(
+            iter_render_text(line, self.font, (0, 0, 0), (255, 255, 255), rect)
+        )
+        lefts = [update_rect.left for update_rect, _ in renders]
+        expected = [
+            self.font.size(line[:i])[0]
+            for i in range(len(line))
+            if line[i] != " "
+        ]
+        self.assertEqual(lefts, expected)
+
+
+class TestLabelCache(unittest.TestCase):
+
+    def setUp(self):
+        pygame.init()
+        self.font = pygame.font.SysFont("Arial", 24)
+        self.cache = LabelCache(2)
+
+    def test_label_is_cached(self):
+        first = self.cache.render(
+            self.font, (0, 0, 0), (255, 255, 255), "Lv.5"
+        )
+        second = self.cache.render(
+            self.font, (0, 0, 0), (255, 255, 255), "Lv.5"
+        )
+        self.assertIs(first, second)
+        self.assertEqual(self.cache.stats()["hit_rate"], 0.5)
+
+    def test_label_without_shadow(self):
+        shadowed = self.cache.render(self.font, (0, 0, 0), (1, 1, 1), "Test")
+        plain = self.cache.render(self.font, (0, 0, 0), None, "Test")
+        self.assertEqual(
+            plain.get_size(),
+            self.font.render("Test", True, (0, 0, 0)).get_size(),
+        )
+        self.assertNotEqual(plain.get_size(), shadowed.get_size())
+
+    def test_eviction(self):
+        for text in ("a", "b", "c"):
+            self.cache.render(self.font, (0, 0, 0), None, text)
+        self.assertEqual(self.cache.stats()["labels"], 2)
+
+    def test_language_changed(self):
+        self.cache.render(self.font, (0, 0, 0), None, "Test")
+        self.cache.language_changed("fr_FR")
+        self.assertEqual(self.cache.stats()["labels"], 0)
@@ -1,8 +1,15 @@
 # SPDX-License-Identifier: GPL-3.0
 # Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
 import unittest
+from unittest.mock import Mock
 
-from tuxemon.states.world.world_classes import BoundaryChecker
+from tuxemon.map import RegionProperties
+from tuxemon.states.world.world_classes import (
+    BoundaryChecker,
+    CollisionIndex,
+    EntityIndex,
+    Pathfinder,
+)
 
 
 class TestBoundaryChecker(unittest.TestCase):
@@ -38,3 +45,165 @@ class TestBoundaryChecker(unittest.TestCase):
             repr(self.checker),
             "BoundaryChecker(invalid_x=(-1, 5), invalid_y=(-1, 7))",
         )
+
+
+class TestCollisionIndex(unittest.TestCase):
+    def setUp(self):
+        self.entities = EntityIndex()
+        self.index = CollisionIndex(self.entities)
+        self.region = RegionProperties([], [], [], None, "door")
+        self.index.set_maps(
+            {(0, 0): None, (1, 1): self.region},
+            {(2, 2): {"surfable": 0}, (3, 3): {"grass": 0.5}},
+        )
+
+    def test_collision_map(self):
+        self.assertIsNone(self.index[(0, 0)])
+        self.assertEqual(self.index[(1, 1)], self.region)
+        self.assertNotIn((5, 5), self.index)
+        self.assertIsNone(self.index.get((5, 5)))
+
+    def test_blocking_surface(self):
+        self.assertEqual(self.index[(2, 2)].key, "surfable")
+        self.assertNotIn((3, 3), self.index)
+
+    def test_set_surface(self):
+        self.index.set_surface((2, 2), {"surfable": 1})
+        self.index.set_surface((3, 3), {"grass": 0})
+        self.assertNotIn((2, 2), self.index)
+        self.assertEqual(self.index[(3, 3)].key, "grass")
+        self.assertEqual(self.index.surface_map[(3, 3)], {"grass": 0})
+
+    def test_entities(self):
+        npc = Mock(tile_pos=(4, 4))
+        self.entities.add(npc)
+        self.assertIs(self.index[(4, 4)].entity, npc)
+        npc.tile_pos = (4, 5)
+        self.entities.move(npc)
+        self.assertNotIn((4, 4), self.index)
+        self.assertIs(self.index[(4, 5)].entity, npc)
+        self.entities.remove(npc)
+        self.assertNotIn((4, 5), self.index)
+
+    def test_collision_map_has_priority(self):
+        npc = Mock(tile_pos=(1, 1))
+        self.entities.add(npc)
+        self.assertEqual(self.index[(1, 1)], self.region)
+        self.index.collision_map.pop((1, 1))
+        self.assertIs(self.index[(1, 1)].entity, npc)
+
+    def test_iteration(self):
+        self.entities.add(Mock(tile_pos=(0, 0)))
+        self.entities.add(Mock(tile_pos=(6, 6)))
+        self.assertEqual(sorted(self.index), [(0, 0), (1, 1), (2, 2), (6, 6)])
+        self.assertEqual(len(self.index), 4)
+
+
+class TestEntityIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = EntityIndex()
+        self.npcs = [
+            Mock(slug="a", instance_id=1, tile_pos=(0, 0)),
+            Mock(slug="b", instance_id=2, tile_pos=(3, 4)),
+            Mock(slug="a", instance_id=3, tile_pos=(9, 9)),
+        ]
+        for npc in self.npcs:
+            self.index.add(npc)
+
+    def test_lookups(self):
+        self.assertIs(self.index.get_slug("a"), self.npcs[0])
+        self.assertIs(self.index.get_iid(2), self.npcs[1])
+        self.assertEqual(self.index.get_tile((9, 9)), [self.npcs[2]])
+        self.assertIsNone(self.index.get_slug("c"))
+        self.assertEqual(self.index.get_tile((1, 1)), [])
+
+    def test_remove(self):
+        self.index.remove(self.npcs[0])
+        self.assertIs(self.index.get_slug("a"), self.npcs[2])
+        self.assertIsNone(self.index.get_iid(1))
+        self.assertEqual(self.index.get_tile((0, 0)), [])
+        self.assertEqual(len(self.index), 2)
+
+    def test_move(self):
+        self.npcs[1].tile_pos = (3, 5)
+        self.index.move(self.npcs[1])
+        self.assertEqual(self.index.get_tile((3, 4)), [])
+        self.assertEqual(self.index.get_tile((3, 5)), [self.npcs[1]])
+
+    def test_move_unknown_entity(self):
+        self.index.move(Mock(tile_pos=(1, 1)))
+        self.assertEqual(self.index.get_tile((1, 1)), [])
+
+    def test_in_rect(self):
+        self.assertEqual(self.index.in_rect(0, 0, 4, 5), self.npcs[:2])
+        self.assertEqual(self.index.in_rect(1, 1, 1, 1), [])
+
+    def test_in_radius(self):
+        self.assertEqual(self.index.in_radius((0, 0), 5), self.npcs[:2])
+        self.assertEqual(self.index.in_radius((0, 0), 4.9), [self.npcs[0]])
+
+    def test_clear(self):
+        self.index.clear()
+        self.assertEqual(len(self.index), 0)
+        self.assertIsNone(self.index.get_slug("a"))
+
+
+class TestPathfinder(unittest.TestCase):
+    def setUp(self):
+        self.pathfinder = Pathfinder()
+        self.pathfinder.set_map_size((5, 5))
+        # wall on x = 2, except at y = 4
+        self.blocked = {(2, 0), (2, 1), (2, 2), (2, 3)}
+
+    def get_exits(self, position):
+        x, y = position
+        exits = []
+        for tile in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+            if (
+                0 <= tile[0] < 5
+                and 0 <= tile[1] < 5
+                and tile not in self.blocked
+            ):
+                exits.append(tile)
+        return exits
+
+    def test_shortest_path_around_wall(self):
+        path = self.pathfinder.find((0, 0), (4, 0), self.get_exits, 0)
+        self.assertEqual(len(path), 12)
+        self.assertEqual(path[0], (4, 0))
+        self.assertIn((2, 4), path)
+        self.assertNotIn((0, 0), path)
+
+    def test_same_tile(self):
+        self.assertEqual(
+            self.pathfinder.find((1, 1), (1, 1), self.get_exits, 0), []
+        )
+
+    def test_no_path(self):
+        self.blocked.add((2, 4))
+        self.assertIsNone(
+            self.pathfinder.find((0, 0), (4, 0), self.get_exits, 0)
+        )
+
+    def test_outside_map(self):
+        self.assertIsNone(
+            self.pathfinder.find((0, 0), (9, 9), self.get_exits, 0)
+        )
+
+    def test_cached_path(self):
+        first = self.pathfinder.find((0, 0), (4, 0), self.get_exits, 0)
+        second = self.pathfinder.find((0, 0), (4, 0), self.get_exits, 0)
+        self.assertEqual(first, second)
+        self.assertEqual(self.pathfinder.stats()["hits"], 1)
+
+    def test_blocked_cached_path_is_searched_again(self):
+        self.pathfinder.find((0, 0), (0, 4), self.get_exits, 0)
+        self.blocked.add((0, 2))
+        path = self.pathfinder.find((0, 0), (0, 4), self.get_exits, 0)
+        self.assertNotIn((0, 2), path)
+        self.assertEqual(self.pathfinder.stats()["misses"], 2)
+
+    def test_version_change_clears_cache(self):
+        self.pathfinder.find((0, 0), (4, 0), self.get_exits, 0)
+        self.pathfinder.find((0, 0), (4, 0), self.get_exits, 1)
+        self.assertEqual(self.pathfinder.stats()["misses"], 2)
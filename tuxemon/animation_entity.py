@@ -3,17 +3,43 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 
 from pygame.surface import Surface
 
 from tuxemon import prepare
 from tuxemon.db import db
-from tuxemon.graphics import create_animation, load_frames_files
+from tuxemon.graphics import (
+    animation_frame_files,
+    create_animation,
+    load_frames_files,
+)
 
 logger = logging.getLogger(__name__)
 
 
+def animation_files(slug: str) -> Sequence[str]:
+    """
+    Returns the frame files of an animation.
+
+    Parameters:
+        slug: Slug of the animation.
+
+    Returns:
+        Paths of the frames, in order.
+
+    Raises:
+        RuntimeError: If the animation doesn't exist.
+
+    """
+    try:
+        results = db.lookup(slug, table="animation")
+    except KeyError:
+        raise RuntimeError(f"Animation {slug} not found")
+    directory = prepare.fetch("animations", results.file)
+    return animation_frame_files(directory, results.slug)
+
+
 class AnimationEntity:
     """Holds all the values for animations."""
 
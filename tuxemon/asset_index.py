@@ -0,0 +1,257 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+"""
+Index of the asset files provided by the mods.
+
+The index is built by walking every mod root once, which replaces the
+``os.path.exists`` probing that used to be done for every single lookup
+(see :func:`tuxemon.prepare.fetch`). Image dimensions are read from the
+file headers only and persisted in the cache directory, so that validating
+the database doesn't need to decode every image.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import os
+import struct
+from collections.abc import Sequence
+from typing import Optional
+
+from PIL import Image
+
+from tuxemon.constants import paths
+
+logger = logging.getLogger(__name__)
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+IMAGE_CACHE_VERSION = 1
+
+
+def get_mod_roots(mod_name: str) -> Sequence[str]:
+    """
+    Returns the folders that can contain the files of a mod.
+
+    The order is the same used to look up assets: the mods folder shipped
+    with the source, the system installed folders and finally the mods
+    folder next to the launch script.
+
+    Parameters:
+        mod_name: Name of the mod.
+
+    Returns:
+        The candidate root folders, existing or not.
+
+    """
+    roots = [os.path.join(paths.mods_folder, mod_name)]
+    for root_path in paths.system_installed_folders:
+        roots.append(os.path.join(root_path, "mods", mod_name))
+    roots.append(os.path.join(paths.BASEDIR, "mods", mod_name))
+    return roots
+
+
+def read_image_size(path: str) -> tuple[int, int]:
+    """
+    Reads the dimensions of an image without decoding it.
+
+    PNG files are handled by reading the IHDR chunk, other formats are
+    delegated to PIL (which also reads the header only).
+
+    Parameters:
+        path: Absolute path of the image.
+
+    Returns:
+        Width and height of the image.
+
+    """
+    with open(path, "rb") as fp:
+        header = fp.read(24)
+    if header[:8] == PNG_SIGNATURE and header[12:16] == b"IHDR":
+        width, height = struct.unpack(">II", header[16:24])
+        return width, height
+    with Image.open(path) as image:
+        return image.size
+
+
+class AssetIndex:
+    """
+    Maps paths relative to a mod folder to the files providing them.
+
+    When several mods provide the same file, the first mod of the list
+    wins, which is the same priority used by :func:`tuxemon.prepare.fetch`.
+    Folders are indexed too, so they can be looked up like files.
+
+    The index is built on first use. Call :meth:`invalidate` whenever
+    files are added or removed (installed packages, dev reload, etc.).
+
+    Parameters:
+        mods: Names of the mods to index, by priority.
+        cache_dir: Folder where the image dimensions are persisted. ``None``
+            keeps them in memory only.
+
+    """
+
+    def __init__(
+        self, mods: Sequence[str], cache_dir: Optional[str] = None
+    ) -> None:
+        self.mods = list(mods)
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.misses = 0
+        self._files: Optional[dict[str, str]] = None
+        self._file_mod: dict[str, str] = {}
+        self._image_sizes: dict[str, dict[str, list[int]]] = {}
+        self._dirty: set[str] = set()
+
+    @property
+    def files(self) -> dict[str, str]:
+        """Relative path -> absolute path, scanned on first use."""
+        if self._files is None:
+            self.scan()
+        assert self._files is not None
+        return self._files
+
+    def scan(self) -> None:
+        """Walks the roots of every mod and (re)builds the index."""
+        files: dict[str, str] = {}
+        self._file_mod = {}
+        for mod_name in self.mods:
+            for root in get_mod_roots(mod_name):
+                if not os.path.isdir(root):
+                    continue
+                for dirpath, dirnames, filenames in os.walk(root):
+                    relative_dir = os.path.relpath(dirpath, root)
+                    for filename in (*dirnames, *filenames):
+                        relative_path = os.path.normpath(
+                            os.path.join(relative_dir, filename)
+                        )
+                        if relative_path not in files:
+                            files[relative_path] = os.path.join(
+                                dirpath, filename
+                            )
+                            self._file_mod[relative_path] = mod_name
+        self._files = files
+        logger.debug("asset index: %s files", len(files))
+
+    def invalidate(self) -> None:
+        """Forgets the indexed files, they are scanned again on next use."""
+        logger.debug("asset index invalidated")
+        self._files = None
+        self._file_mod = {}
+
+    def find(self, relative_path: str) -> Optional[str]:
+        """
+        Returns the absolute path of a file, if any mod provides it.
+
+        Files that aren't indexed are searched on disk (they may have been
+        created after the scan) and added to the index when found.
+
+        Parameters:
+            relative_path: The file path relative to a mod directory.
+
+        Returns:
+            The absolute path or ``None``.
+
+        """
+        relative_path = os.path.normpath(relative_path)
+        path = self.files.get(relative_path)
+        if path is not None:
+            self.hits += 1
+            return path
+
+        self.misses += 1
+        for mod_name in self.mods:
+            for root in get_mod_roots(mod_name):
+                path = os.path.join(root, relative_path)
+                logger.debug("searching asset: %s", path)
+                if os.path.exists(path):
+                    self.files[relative_path] = path
+                    self._file_mod[relative_path] = mod_name
+                    return path
+        return None
+
+    def stats(self) -> dict[str, int]:
+        """
+        Returns the counters of the index, useful for tuning.
+
+        Returns:
+            Number of indexed files, hits and misses.
+
+        """
+        return {
+            "files": len(self._files or {}),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def image_size(self, relative_path: str) -> tuple[int, int]:
+        """
+        Returns the dimensions of an image provided by a mod.
+
+        Cached dimensions are reused as long as the modification time and
+        the size of the file didn't change.
+
+        Parameters:
+            relative_path: The file path relative to a mod directory.
+
+        Returns:
+            Width and height of the image.
+
+        Raises:
+            OSError: If the file doesn't exist.
+
+        """
+        relative_path = os.path.normpath(relative_path)
+        path = self.find(relative_path)
+        if path is None:
+            raise OSError(f"cannot load file {relative_path}")
+        mod_name = self._file_mod[relative_path]
+        sizes = self._load_image_sizes(mod_name)
+        stat = os.stat(path)
+        entry = sizes.get(relative_path)
+        if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2], entry[3]
+        width, height = read_image_size(path)
+        sizes[relative_path] = [stat.st_mtime_ns, stat.st_size, width, height]
+        self._dirty.add(mod_name)
+        return width, height
+
+    def _cache_path(self, mod_name: str) -> Optional[str]:
+        if self.cache_dir is None:
+            return None
+        return os.path.join(self.cache_dir, f"{mod_name}_images.json")
+
+    def _load_image_sizes(self, mod_name: str) -> dict[str, list[int]]:
+        if mod_name in self._image_sizes:
+            return self._image_sizes[mod_name]
+        sizes: dict[str, list[int]] = {}
+        path = self._cache_path(mod_name)
+        if path and os.path.exists(path):
+            try:
+                with open(path) as fp:
+                    data = json.load(fp)
+                if data.get("version") == IMAGE_CACHE_VERSION:
+                    sizes = data["images"]
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Invalid image cache {path}: {e}")
+        self._image_sizes[mod_name] = sizes
+        return sizes
+
+    def save(self) -> None:
+        """Persists the image dimensions read since the last save."""
+        for mod_name in self._dirty:
+            path = self._cache_path(mod_name)
+            if path is None:
+                continue
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            data = {
+                "version": IMAGE_CACHE_VERSION,
+                "images": self._image_sizes[mod_name],
+            }
+            try:
+                with open(path + ".tmp", "w") as fp:
+                    json.dump(data, fp, separators=(",", ":"))
+                os.replace(path + ".tmp", path)
+            except OSError as e:
+                logger.error(f"Unable to write image cache {path}: {e}")
+        self._dirty.clear()
@@ -0,0 +1,250 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+"""
+Texture atlases of the animation frames.
+
+An atlas packs the frames of an animation (or the walk cycle of an NPC)
+into a single image, with an index giving the rectangle of each frame::
+
+    <name>.png    the packed frames
+    <name>.json   {"version": ..., "key": ..., "frames": [[x, y, w, h], ...]}
+
+The atlases are built offline by ``scripts/build_atlases.py``. The key
+identifies the frame files (path, size and modification time), so an
+atlas whose frames changed is ignored until it is built again. At runtime
+(see :func:`tuxemon.graphics.load_atlas_frames`), the atlas image is
+loaded and scaled once and the frames are subsurfaces of it, instead of
+opening and decoding a file per frame.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import os
+import threading
+from collections.abc import Sequence
+from functools import lru_cache
+from typing import Optional
+
+import pygame
+
+from tuxemon import prepare
+from tuxemon.constants import paths
+
+logger = logging.getLogger(__name__)
+
+ATLAS_VERSION = 1
+
+FrameRect = tuple[int, int, int, int]
+
+
+def animation_atlas_name(directory: str, name: str) -> str:
+    """
+    Returns the name of the atlas of an animation.
+
+    Parameters:
+        directory: Directory where the frames are located.
+        name: Name of the animation (common prefix of the frames).
+
+    Returns:
+        The name of the atlas, e.g. ``technique_fireball``.
+
+    """
+    return f"{os.path.basename(os.path.normpath(directory))}_{name}"
+
+
+def get_atlas_paths(atlas_dir: str, name: str) -> tuple[str, str]:
+    """
+    Returns the paths of the image and of the index of an atlas.
+
+    Parameters:
+        atlas_dir: Folder of the atlases.
+        name: Name of the atlas.
+
+    Returns:
+        Paths of the image and of the index.
+
+    """
+    base = os.path.join(atlas_dir, name)
+    return f"{base}.png", f"{base}.json"
+
+
+def atlas_key(files: Sequence[str]) -> str:
+    """
+    Computes the key identifying the frame files of an atlas.
+
+    Only the files metadata is read, so checking an atlas is much cheaper
+    than loading its frames.
+
+    Parameters:
+        files: Paths of the frame files, in order.
+
+    Returns:
+        Hex digest of the atlas version and of the path, size and
+        modification time of every file.
+
+    Raises:
+        OSError: If a file is missing.
+
+    """
+    digest = hashlib.sha1(f"{ATLAS_VERSION}".encode())
+    for filename in files:
+        stat = os.stat(filename)
+        digest.update(
+            f"{os.path.abspath(filename)}:{stat.st_size}:"
+            f"{stat.st_mtime_ns};".encode()
+        )
+    return digest.hexdigest()
+
+
+def pack_rects(
+    sizes: Sequence[tuple[int, int]],
+) -> tuple[list[tuple[int, int]], tuple[int, int]]:
+    """
+    Packs rectangles into shelves, aiming at a square atlas.
+
+    Parameters:
+        sizes: Width and height of each rectangle.
+
+    Returns:
+        The position of each rectangle, in order, and the atlas size.
+
+    """
+    if not sizes:
+        return [], (0, 0)
+    area = sum(w * h for w, h in sizes)
+    max_width = max(max(w for w, _ in sizes), math.ceil(math.sqrt(area)))
+    positions: list[tuple[int, int]] = [(0, 0)] * len(sizes)
+    x = y = shelf_height = width = 0
+    for index in sorted(range(len(sizes)), key=lambda i: -sizes[i][1]):
+        w, h = sizes[index]
+        if x + w > max_width:
+            x = 0
+            y += shelf_height
+            shelf_height = 0
+        positions[index] = (x, y)
+        x += w
+        width = max(width, x)
+        shelf_height = max(shelf_height, h)
+    return positions, (width, y + shelf_height)
+
+
+def build_atlas(
+    name: str, files: Sequence[str], atlas_dir: Optional[str] = None
+) -> bool:
+    """
+    Builds the atlas of some frames, if it's missing or stale.
+
+    Identical frames are stored once. No display is needed, so this can
+    run in a worker process. The atlases looked up by this process are
+    forgotten, so the new one is used.
+
+    Parameters:
+        name: Name of the atlas.
+        files: Paths of the frame files, in order.
+        atlas_dir: Folder of the atlases, the one of the cache by default.
+
+    Returns:
+        Whether the atlas was (re)built.
+
+    """
+    atlas_dir = atlas_dir or paths.ATLAS_DIR
+    key = atlas_key(files)
+    if _read_index(atlas_dir, name, key) is not None:
+        return False
+
+    frames: list[pygame.surface.Surface] = []
+    unique: dict[tuple[tuple[int, int], bytes], int] = {}
+    frame_ids: list[int] = []
+    for filename in files:
+        image = pygame.image.load(filename)
+        rgba = pygame.image.tobytes(image, "RGBA")
+        frame_id = unique.setdefault((image.get_size(), rgba), len(frames))
+        if frame_id == len(frames):
+            frames.append(image)
+        frame_ids.append(frame_id)
+
+    positions, size = pack_rects([frame.get_size() for frame in frames])
+    atlas = pygame.Surface(size, pygame.SRCALPHA)
+    atlas.fill((0, 0, 0, 0))
+    for frame, position in zip(frames, positions):
+        atlas.blit(frame, position)
+    rects = [
+        (*positions[frame_id], *frames[frame_id].get_size())
+        for frame_id in frame_ids
+    ]
+
+    image_path, index_path = get_atlas_paths(atlas_dir, name)
+    suffix = f".{os.getpid()}.{threading.get_ident()}.tmp"
+    os.makedirs(atlas_dir, exist_ok=True)
+    # pygame picks the image format from the extension
+    pygame.image.save(atlas, image_path + suffix + ".png")
+    with open(index_path + suffix, "w") as fp:
+        json.dump({"version": ATLAS_VERSION, "key": key, "frames": rects}, fp)
+    # the index is replaced last, so it never points to a missing image
+    os.replace(image_path + suffix + ".png", image_path)
+    os.replace(index_path + suffix, index_path)
+    clear_atlas_cache()
+    return True
+
+
+def _read_index(
+    atlas_dir: str, name: str, key: str
+) -> Optional[list[FrameRect]]:
+    _, index_path = get_atlas_paths(atlas_dir, name)
+    try:
+        with open(index_path) as fp:
+            index = json.load(fp)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning(f"Invalid atlas index {index_path}: {e}")
+        return None
+    if index.get("version") != ATLAS_VERSION or index.get("key") != key:
+        logger.debug("atlas is stale: %s", index_path)
+        return None
+    return [tuple(rect) for rect in index["frames"]]
+
+
+@lru_cache(maxsize=1024)
+def _find_atlas(
+    atlas_dir: str, name: str, files: tuple[str, ...]
+) -> Optional[tuple[str, tuple[FrameRect, ...]]]:
+    try:
+        key = atlas_key(files)
+    except OSError:
+        return None
+    rects = _read_index(atlas_dir, name, key)
+    if rects is None or len(rects) != len(files):
+        return None
+    return get_atlas_paths(atlas_dir, name)[0], tuple(rects)
+
+
+def find_atlas(
+    name: str, files: Sequence[str], atlas_dir: Optional[str] = None
+) -> Optional[tuple[str, Sequence[FrameRect]]]:
+    """
+    Returns the atlas of some frames, if it's up to date.
+
+    Atlases are looked up once: the result is kept for the next calls.
+
+    Parameters:
+        name: Name of the atlas.
+        files: Paths of the frame files, in order.
+        atlas_dir: Folder of the atlases, the one of the cache by default.
+
+    Returns:
+        The path of the atlas image and the rectangle of each frame, or
+        ``None`` if atlases are disabled or the atlas is missing or stale.
+
+    """
+    if not prepare.CONFIG.atlases or not files:
+        return None
+    return _find_atlas(atlas_dir or paths.ATLAS_DIR, name, tuple(files))
+
+
+def clear_atlas_cache() -> None:
+    """Forgets the atlases looked up, e.g. once they are rebuilt."""
+    _find_atlas.cache_clear()
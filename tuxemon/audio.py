@@ -150,6 +150,7 @@ class SoundManager:
     def __init__(self, sound_volume: float = prepare.SOUND_VOLUME):
         self.sound_volume = sound_volume
         self.sounds: dict[str, SoundProtocol] = {}
+        self._preloaded: dict[str, pygame.mixer.Sound] = {}
 
     def get_sound_filename(self, slug: str) -> Optional[str]:
         if slug is None or slug == "":
@@ -170,12 +171,15 @@ class SoundManager:
         if slug in self.sounds:
             return self.sounds[slug]
 
-        filename = self.get_sound_filename(slug)
-        if filename is None:
-            return SoundWrapper()
+        sound = self._preloaded.pop(slug, None)
+        if sound is None:
+            filename = self.get_sound_filename(slug)
+            if filename is None:
+                return SoundWrapper()
 
         try:
-            sound = pygame.mixer.Sound(filename)
+            if sound is None:
+                sound = pygame.mixer.Sound(filename)
             sound.set_volume(value or self.sound_volume)
             self.sounds[slug] = SoundWrapper(sound)
             return self.sounds[slug]
@@ -183,6 +187,20 @@ class SoundManager:
             logger.error(f"Failed to load sound '{slug}': {e}")
             return SoundWrapper()
 
+    def preload_sound(self, slug: str, sound: pygame.mixer.Sound) -> None:
+        """
+        Adds a sound loaded ahead of time, e.g. by another thread.
+
+        The volume is still set by :meth:`load_sound`, on first use.
+
+        Parameters:
+            slug: Slug of the sound.
+            sound: The loaded sound.
+
+        """
+        if slug not in self.sounds:
+            self._preloaded[slug] = sound
+
     def play_sound(
         self, slug: str, value: float = prepare.SOUND_VOLUME
     ) -> None:
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import uuid
-from typing import TYPE_CHECKING, Optional
+from collections.abc import Iterable, Mapping, Sequence
+from typing import TYPE_CHECKING, Generic, Optional, Protocol, TypeVar
 
 from tuxemon import prepare
 from tuxemon.item.item import decode_items, encode_items
@@ -17,13 +18,169 @@ if TYPE_CHECKING:
     from tuxemon.npc import NPCState
 
 
+class Stored(Protocol):
+    """Anything kept in a box or in a bag: monsters and items."""
+
+    instance_id: uuid.UUID
+    slug: str
+
+
+StoredT = TypeVar("StoredT", bound=Stored)
+
+
+def check_index(
+    index: Mapping[uuid.UUID, tuple[str, Stored]],
+    boxes: Mapping[str, Sequence[Stored]],
+) -> list[str]:
+    """
+    Compares an instance ID index with the boxes it indexes.
+
+    Parameters:
+        index: The index, instance ID to box ID and entry.
+        boxes: The boxes.
+
+    Returns:
+        The inconsistencies found, empty if the index is correct.
+    """
+    problems = []
+    count = 0
+    for box_id, entries in boxes.items():
+        for entry in entries:
+            count += 1
+            indexed = index.get(entry.instance_id)
+            if indexed is None:
+                problems.append(f"{entry.instance_id} ({box_id}) not indexed")
+            elif indexed[0] != box_id or indexed[1] is not entry:
+                problems.append(
+                    f"{entry.instance_id} indexed in {indexed[0]} instead "
+                    f"of {box_id}"
+                )
+    if len(index) != count:
+        problems.append(f"{len(index)} entries indexed instead of {count}")
+    return problems
+
+
+class InventoryIndex(Generic[StoredT]):
+    """
+    Index by instance ID and by slug of a list of monsters or items.
+
+    Used for the party and the bag of the NPCs. Those lists are replaced
+    or modified directly in places, so the index checks it still matches
+    the list (same list, same length) before every use and is rebuilt if
+    it doesn't. The NPC methods update it as they add and remove entries,
+    so it's only rebuilt after outside changes.
+
+    """
+
+    def __init__(self) -> None:
+        self._entries: Optional[list[StoredT]] = None
+        self._size = 0
+        self._by_id: dict[uuid.UUID, StoredT] = {}
+        self._by_slug: dict[str, StoredT] = {}
+
+    def sync(self, entries: list[StoredT]) -> InventoryIndex[StoredT]:
+        """
+        Rebuilds the index if the list was replaced or changed size.
+
+        Parameters:
+            entries: The indexed list.
+
+        Returns:
+            The index itself.
+        """
+        if entries is not self._entries or len(entries) != self._size:
+            self._entries = entries
+            self._size = len(entries)
+            self._by_id = {}
+            self._by_slug = {}
+            for entry in entries:
+                self._by_id[entry.instance_id] = entry
+                self._by_slug.setdefault(entry.slug, entry)
+        return self
+
+    def added(self, entry: StoredT) -> None:
+        """
+        Records an entry just added to the synced list.
+
+        Parameters:
+            entry: The new entry.
+        """
+        self._size += 1
+        self._by_id[entry.instance_id] = entry
+        self._by_slug.setdefault(entry.slug, entry)
+
+    def removed(self, entry: StoredT) -> None:
+        """
+        Forgets an entry just removed from the synced list.
+
+        Parameters:
+            entry: The removed entry.
+        """
+        self._size -= 1
+        if self._by_id.get(entry.instance_id) is entry:
+            del self._by_id[entry.instance_id]
+        if self._by_slug.get(entry.slug) is entry:
+            del self._by_slug[entry.slug]
+            assert self._entries is not None
+            other = next(
+                (e for e in self._entries if e.slug == entry.slug), None
+            )
+            if other is not None:
+                self._by_slug[entry.slug] = other
+
+    def invalidate(self) -> None:
+        """Rebuilds the index on next use, after a reordering."""
+        self._entries = None
+
+    def get_by_id(self, instance_id: uuid.UUID) -> Optional[StoredT]:
+        return self._by_id.get(instance_id)
+
+    def get_by_slug(self, slug: str) -> Optional[StoredT]:
+        """Returns the first entry with the given slug, if any."""
+        return self._by_slug.get(slug)
+
+    def check(self, entries: Iterable[StoredT]) -> list[str]:
+        """
+        Compares the index with a list.
+
+        Parameters:
+            entries: The list that should be indexed.
+
+        Returns:
+            The inconsistencies found, empty if the index is correct.
+        """
+        problems = []
+        by_id: dict[uuid.UUID, StoredT] = {}
+        by_slug: dict[str, StoredT] = {}
+        for entry in entries:
+            by_id[entry.instance_id] = entry
+            by_slug.setdefault(entry.slug, entry)
+        if by_id != self._by_id:
+            problems.append("instance IDs don't match")
+        if by_slug != self._by_slug:
+            problems.append("slugs don't match")
+        return problems
+
+
 class BoxCollection:
+    """
+    Boxes of items and boxes of monsters.
+
+    The boxes are lists, in the order the items and monsters were added.
+    An index by instance ID, kept up to date by the methods below, tells in
+    which box every item and monster is: the boxes must not be modified
+    directly.
+
+    """
+
     def __init__(self) -> None:
         """
         Initializes a new BoxCollection instance.
         """
         self.item_boxes: dict[str, list[Item]] = {}
         self.monster_boxes: dict[str, list[Monster]] = {}
+        self._item_index: dict[uuid.UUID, tuple[str, Item]] = {}
+        self._monster_index: dict[uuid.UUID, tuple[str, Monster]] = {}
 
     def create_box(self, box_id: str, box_type: str) -> None:
         """
@@ -35,8 +192,12 @@ class BoxCollection:
                 "monster").
         """
         if box_type == "item":
+            for item in self.item_boxes.get(box_id, ()):
+                del self._item_index[item.instance_id]
             self.item_boxes[box_id] = []
         elif box_type == "monster":
+            for monster in self.monster_boxes.get(box_id, ()):
+                del self._monster_index[monster.instance_id]
             self.monster_boxes[box_id] = []
 
     def add_item(self, box_id: str, item: Item) -> None:
@@ -50,6 +211,7 @@ class BoxCollection:
         if box_id not in self.item_boxes:
             self.create_box(box_id, "item")
         self.item_boxes[box_id].append(item)
+        self._item_index[item.instance_id] = (box_id, item)
 
     def add_monster(self, box_id: str, monster: Monster) -> None:
         """
@@ -62,6 +224,7 @@ class BoxCollection:
         if box_id not in self.monster_boxes:
             self.create_box(box_id, "monster")
         self.monster_boxes[box_id].append(monster)
+        self._monster_index[monster.instance_id] = (box_id, monster)
 
     def remove_item(self, item: Item) -> None:
         """
@@ -70,10 +233,9 @@ class BoxCollection:
         Parameters:
             item: The item to remove from all boxes.
         """
-        for box in self.item_boxes.values():
-            if item in box:
-                box.remove(item)
-                return
+        entry = self._item_index.get(item.instance_id)
+        if entry is not None and entry[1] is item:
+            self.remove_item_from(entry[0], item)
 
     def remove_monster(self, monster: Monster) -> None:
         """
@@ -82,10 +244,9 @@ class BoxCollection:
         Parameters:
             monster: The monster to remove from all boxes.
         """
-        for box in self.monster_boxes.values():
-            if monster in box:
-                box.remove(monster)
-                return
+        entry = self._monster_index.get(monster.instance_id)
+        if entry is not None and entry[1] is monster:
+            self.remove_monster_from(entry[0], monster)
 
     def remove_item_from(self, box_id: str, item: Item) -> None:
         """
@@ -97,6 +258,7 @@ class BoxCollection:
         """
         if box_id in self.item_boxes:
             self.item_boxes[box_id].remove(item)
+            del self._item_index[item.instance_id]
 
     def remove_monster_from(self, box_id: str, monster: Monster) -> None:
         """
@@ -108,6 +270,7 @@ class BoxCollection:
         """
         if box_id in self.monster_boxes:
             self.monster_boxes[box_id].remove(monster)
+            del self._monster_index[monster.instance_id]
 
     def get_items_by_iid(self, instance_id: uuid.UUID) -> Optional[Item]:
         """
@@ -119,15 +282,8 @@ class BoxCollection:
         Returns:
             The item with the given instance ID, or None if not found.
         """
-        return next(
-            (
-                m
-                for box in self.item_boxes.values()
-                for m in box
-                if m.instance_id == instance_id
-            ),
-            None,
-        )
+        entry = self._item_index.get(instance_id)
+        return None if entry is None else entry[1]
 
     def get_monsters_by_iid(self, instance_id: uuid.UUID) -> Optional[Monster]:
         """
@@ -139,15 +295,8 @@ class BoxCollection:
         Returns:
             The monster with the given instance ID, or None if not found.
         """
-        return next(
-            (
-                m
-                for box in self.monster_boxes.values()
-                for m in box
-                if m.instance_id == instance_id
-            ),
-            None,
-        )
+        entry = self._monster_index.get(instance_id)
+        return None if entry is None else entry[1]
 
     def get_items(self, box_id: str) -> list[Item]:
         """
@@ -299,10 +448,7 @@ class BoxCollection:
             target_box_id: The ID of the box to move the item to.
             item: The item to move.
         """
-        if (
-            source_box_id in self.item_boxes
-            and item in self.item_boxes[source_box_id]
-        ):
+        if self._item_index.get(item.instance_id) == (source_box_id, item):
             self.remove_item_from(source_box_id, item)
             self.add_item(target_box_id, item)
 
@@ -317,9 +463,9 @@ class BoxCollection:
             target_box_id: The ID of the box to move the monster to.
             monster: The monster to move.
         """
-        if (
-            source_box_id in self.monster_boxes
-            and monster in self.monster_boxes[source_box_id]
+        if self._monster_index.get(monster.instance_id) == (
+            source_box_id,
+            monster,
         ):
             self.remove_monster_from(source_box_id, monster)
             self.add_monster(target_box_id, monster)
@@ -351,10 +497,27 @@ class BoxCollection:
         """
         self.item_boxes = {}
         self.monster_boxes = {}
+        self._item_index = {}
+        self._monster_index = {}
         for box_id, encoded_items in save_data["item_boxes"].items():
-            self.item_boxes[box_id] = decode_items(encoded_items)
+            self.create_box(box_id, "item")
+            for item in decode_items(encoded_items):
+                self.add_item(box_id, item)
         for box_id, encoded_monsters in save_data["monster_boxes"].items():
-            self.monster_boxes[box_id] = decode_monsters(encoded_monsters)
+            self.create_box(box_id, "monster")
+            for monster in decode_monsters(encoded_monsters):
+                self.add_monster(box_id, monster)
+
+    def check_index(self) -> list[str]:
+        """
+        Checks that the instance ID indexes match the boxes.
+
+        Returns:
+            The inconsistencies found, empty if the indexes are correct.
+        """
+        return check_index(self._item_index, self.item_boxes) + check_index(
+            self._monster_index, self.monster_boxes
+        )
 
 
 class ItemBoxes(BoxCollection):
@@ -398,7 +561,8 @@ class MonsterBoxes(BoxCollection):
             box_id: The ID of the box to remove.
         """
         if box_id in self.monster_boxes:
-            del self.monster_boxes[box_id]
+            for monster in self.monster_boxes.pop(box_id):
+                del self._monster_index[monster.instance_id]
         else:
             raise ValueError(f"{box_id} doesn't exist.")
 
@@ -423,15 +587,8 @@ class MonsterBoxes(BoxCollection):
             The name of the monster box that contains the monster, or None
             if not found.
         """
-        return next(
-            (
-                box
-                for box, monsters in self.monster_boxes.items()
-                for m in monsters
-                if m.instance_id == instance_id
-            ),
-            None,
-        )
+        entry = self._monster_index.get(instance_id)
+        return None if entry is None else entry[0]
 
     def is_box_full(
         self, box_id: str, max_capacity: int = prepare.MAX_KENNEL
@@ -462,11 +619,17 @@ class MonsterBoxes(BoxCollection):
         """
         if target_box_id not in self.monster_boxes:
             self.create_box(target_box_id, "monster")
-        if source_box_id in self.monster_boxes:
-            self.monster_boxes[target_box_id].extend(
-                self.monster_boxes[source_box_id]
-            )
-            del self.monster_boxes[source_box_id]
+        if (
+            source_box_id in self.monster_boxes
+            and source_box_id != target_box_id
+        ):
+            monsters = self.monster_boxes.pop(source_box_id)
+            self.monster_boxes[target_box_id].extend(monsters)
+            for monster in monsters:
+                self._monster_index[monster.instance_id] = (
+                    target_box_id,
+                    monster,
+                )
 
     def create_and_merge_box(self, box_id: str) -> None:
         """
@@ -27,6 +27,7 @@ from tuxemon.platform.platform_pygame.events import (
     PygameMouseInput,
     PygameTouchOverlayInput,
 )
+from tuxemon.save_writer import save_writer
 from tuxemon.session import local_session
 from tuxemon.state import State, StateManager
 from tuxemon.states.world.worldstate import WorldState
@@ -343,6 +344,9 @@ class LocalPygameClient:
 
         self.event_engine.update(time_delta)
 
+        # Report the saves written in the background
+        save_writer.poll()
+
         if self.event_data:
             logger.debug("Event Data:" + str(self.event_data))
 
@@ -464,8 +468,7 @@ class LocalPygameClient:
 
         """
         world = self.get_state_by_name(WorldState)
-        world.npcs = []
-        world.npcs_off_map = []
+        world.clear_npcs()
         for client in registry:
             if "sprite" in registry[client]:
                 sprite = registry[client]["sprite"]
@@ -476,6 +479,7 @@ class LocalPygameClient:
                 if client_map == current_map:
                     if sprite not in world.npcs:
                         world.npcs.append(sprite)
+                        world.entity_index.add(sprite)
                     if sprite in world.npcs_off_map:
                         world.npcs_off_map.remove(sprite)
 
@@ -485,6 +489,7 @@ class LocalPygameClient:
                         world.npcs_off_map.append(sprite)
                     if sprite in world.npcs:
                         world.npcs.remove(sprite)
+                        world.entity_index.remove(sprite)
 
     def get_map_filepath(self) -> Optional[str]:
         """
@@ -50,6 +50,7 @@ class TuxemonConfig:
         )
         self.hide_mouse = cfg.getboolean("display", "hide_mouse")
         self.window_caption = cfg.get("display", "window_caption")
+        self.surface_cache_size = cfg.getint("display", "surface_cache_size")
 
         # [game]
         self.data = cfg.get("game", "data")
@@ -65,6 +66,11 @@ class TuxemonConfig:
             "recompile_translations",
         )
         self.skip_titlescreen = cfg.getboolean("game", "skip_titlescreen")
+        self.db_snapshot = cfg.getboolean("game", "db_snapshot")
+        self.strict_validation = cfg.getboolean("game", "strict_validation")
+        self.map_artifacts = cfg.getboolean("game", "map_artifacts")
+        self.atlases = cfg.getboolean("game", "atlases")
+        self.event_cache = cfg.getboolean("game", "event_cache")
         self.compress_save: Optional[str] = cfg.get("game", "compress_save")
         if self.compress_save == "None":
             self.compress_save = None
@@ -200,6 +206,7 @@ def get_defaults() -> Mapping[str, Any]:
                         ("controller_transparency", "45"),
                         ("hide_mouse", "True"),
                         ("window_caption", "Tuxemon"),
+                        ("surface_cache_size", "64"),
                     )
                 ),
             ),
@@ -214,6 +221,11 @@ def get_defaults() -> Mapping[str, Any]:
                         ("locale", "en_US"),
                         ("dev_tools", "False"),
                         ("recompile_translations", "True"),
+                        ("db_snapshot", "True"),
+                        ("strict_validation", "False"),
+                        ("map_artifacts", "True"),
+                        ("atlases", "True"),
+                        ("event_cache", "True"),
                         ("compress_save", "None"),
                     )
                 ),
@@ -39,6 +39,22 @@ logger.debug("save games: %s", USER_GAME_SAVE_DIR)
 CACHE_DIR = os.path.join(USER_STORAGE_DIR, "cache")
 logger.debug("cache: %s", CACHE_DIR)
 
+# precompiled database snapshot
+DB_SNAPSHOT_PATH = os.path.join(CACHE_DIR, "db", "database.snapshot")
+logger.debug("db snapshot: %s", DB_SNAPSHOT_PATH)
+
+# asset index (image dimensions, etc.)
+ASSET_CACHE_DIR = os.path.join(CACHE_DIR, "assets")
+logger.debug("asset cache: %s", ASSET_CACHE_DIR)
+
+# compiled map artifacts
+MAP_ARTIFACT_DIR = os.path.join(CACHE_DIR, "maps")
+logger.debug("map artifacts: %s", MAP_ARTIFACT_DIR)
+
+# packed texture atlases of the animations
+ATLAS_DIR = os.path.join(CACHE_DIR, "atlases")
+logger.debug("atlases: %s", ATLAS_DIR)
+
 # game lang dir
 L18N_MO_FILES = os.path.join(CACHE_DIR, "l18n")
 logger.debug("l18: %s", L18N_MO_FILES)
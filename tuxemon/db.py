@@ -3,15 +3,17 @@
 from __future__ import annotations
 
 import difflib
+import hashlib
 import json
 import logging
 import os
+import pickle
 import sys
 from collections.abc import Mapping, Sequence
 from enum import Enum
 from typing import Annotated, Any, Literal, Optional, Union, overload
 
-from PIL import Image
+import pydantic
 from pydantic import (
     BaseModel,
     ConfigDict,
@@ -33,6 +35,10 @@ T.load_translator()
 
 SurfaceKeys = prepare.SURFACE_KEYS
 
+# Bump whenever the snapshot format changes. Changes to the models are
+# detected from the source of this module (see JSONDatabase.snapshot_key).
+SNAPSHOT_VERSION = 1
+
 
 class Direction(str, Enum):
     up = "up"
@@ -1487,6 +1493,48 @@ DataModel = Union[
 ]
 
 
+_fingerprint: Optional[str] = None
+
+
+def _models_fingerprint() -> str:
+    """Returns a digest of the source of this module, where the models live."""
+    global _fingerprint
+    if _fingerprint is None:
+        with open(__file__, "rb") as fp:
+            _fingerprint = hashlib.sha1(fp.read()).hexdigest()
+    return _fingerprint
+
+
+def _is_current_model(value: Any) -> bool:
+    """
+    Checks that an unpickled value matches the current model classes.
+
+    Pickled models are restored without validation, so a model that gained
+    or lost fields since the snapshot was written would be restored with
+    missing or extra attributes. Nested models and containers are checked
+    too.
+
+    Parameters:
+        value: The value to check.
+
+    Returns:
+        Whether the value (and every model it contains) has exactly the
+        fields of its current model class.
+
+    """
+    if isinstance(value, BaseModel):
+        fields = type(value).model_fields
+        values = value.__dict__
+        if values.keys() != fields.keys():
+            return False
+        return all(_is_current_model(item) for item in values.values())
+    if isinstance(value, (list, tuple)):
+        return all(_is_current_model(item) for item in value)
+    if isinstance(value, dict):
+        return all(_is_current_model(item) for item in value.values())
+    return True
+
+
 class JSONDatabase:
     """
     Handles connecting to the game database for resources.
@@ -1561,6 +1609,151 @@ class JSONDatabase:
             for slug, item in entries.items():
                 self.load_model(item, table, validate)
         self.preloaded.clear()
+        has.index.save()
+
+    def load_cached(self, snapshot_path: str) -> None:
+        """
+        Loads the whole database, using a snapshot when it's up to date.
+
+        The snapshot is rebuilt (after a full, validated load) whenever the
+        mod list or any of the JSON files changed since it was written.
+
+        Parameters:
+            snapshot_path: Path of the snapshot file.
+
+        """
+        key = self.snapshot_key()
+        if self.load_snapshot(snapshot_path, key):
+            logger.debug("database loaded from snapshot: %s", snapshot_path)
+            return
+        self.load()
+        self.write_snapshot(snapshot_path, key)
+
+    def snapshot_key(self) -> str:
+        """
+        Computes the key identifying the current set of JSON files.
+
+        Only file names, sizes and modification times are used, so the
+        files don't need to be read to know if a snapshot is stale. The
+        source of this module (where the models are defined) and the
+        pydantic version are part of the key too, so a snapshot is never
+        restored into models that changed since it was written.
+
+        Returns:
+            Hex digest of the models, the mod list and the state of every
+            JSON file.
+
+        """
+        digest = hashlib.sha1()
+        digest.update(
+            f"{SNAPSHOT_VERSION}:{sys.version_info[:2]}:"
+            f"{pydantic.VERSION}:{_models_fingerprint()}".encode()
+        )
+        for mod_directory in prepare.CONFIG.mods:
+            digest.update(f"mod:{mod_directory}".encode())
+            path = os.path.join(paths.mods_folder, mod_directory, "db")
+            for table in self._tables:
+                table_path = os.path.join(path, table)
+                if not os.path.isdir(table_path):
+                    continue
+                entries = sorted(
+                    (entry.name, entry.stat())
+                    for entry in os.scandir(table_path)
+                    if entry.name.endswith(".json")
+                )
+                for name, stat in entries:
+                    digest.update(
+                        f"{table}/{name}:{stat.st_mtime_ns}:{stat.st_size}".encode()
+                    )
+        return digest.hexdigest()
+
+    def write_snapshot(self, snapshot_path: str, key: str) -> None:
+        """
+        Writes the loaded (and validated) tables to a snapshot file.
+
+        Parameters:
+            snapshot_path: Path of the snapshot file.
+            key: Key returned by :meth:`snapshot_key`.
+
+        """
+        os.makedirs(os.path.dirname(snapshot_path), exist_ok=True)
+        payload = {
+            "version": SNAPSHOT_VERSION,
+            "key": key,
+            "database": self.database,
+        }
+        tmp_path = snapshot_path + ".tmp"
+        try:
+            with open(tmp_path, "wb") as fp:
+                pickle.dump(payload, fp, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, snapshot_path)
+        except OSError as e:
+            logger.error(f"Unable to write database snapshot: {e}")
+        else:
+            logger.info("database snapshot written: %s", snapshot_path)
+
+    def load_snapshot(
+        self, snapshot_path: str, key: Optional[str] = None
+    ) -> bool:
+        """
+        Loads the tables from a snapshot file without validating them again.
+
+        Models are restored as they were pickled, which skips pydantic
+        validation entirely (like ``model_construct``). The restored models
+        are still checked against the current model classes, and the
+        snapshot is ignored if any of them doesn't have the expected fields.
+
+        Parameters:
+            snapshot_path: Path of the snapshot file.
+            key: Expected key, the snapshot is ignored if it doesn't match.
+                ``None`` accepts any snapshot of the current version.
+
+        Returns:
+            Whether the snapshot was loaded.
+
+        """
+        try:
+            with open(snapshot_path, "rb") as fp:
+                payload = pickle.load(fp)
+        except FileNotFoundError:
+            return False
+        except (
+            OSError,
+            pickle.UnpicklingError,
+            EOFError,
+            AttributeError,
+            ImportError,
+            IndexError,
+            TypeError,
+            ValueError,
+        ) as e:
+            logger.warning(f"Invalid database snapshot {snapshot_path}: {e}")
+            return False
+
+        if not isinstance(payload, dict):
+            logger.warning(f"Invalid database snapshot {snapshot_path}")
+            return False
+        if payload.get("version") != SNAPSHOT_VERSION:
+            logger.debug("database snapshot has an old version")
+            return False
+        if key is not None and payload.get("key") != key:
+            logger.debug("database snapshot is stale")
+            return False
+
+        database = payload.get("database")
+        if not isinstance(database, dict) or not all(
+            _is_current_model(model)
+            for table in self._tables
+            for model in database.get(table, {}).values()
+        ):
+            logger.warning(
+                f"Database snapshot {snapshot_path} doesn't match the models"
+            )
+            return False
+
+        for table in self._tables:
+            self.database[table] = database.get(table, {})
+        return True
 
     def _load_json_files(self, directory: TableName) -> None:
         for json_item in os.listdir(os.path.join(self.path, directory)):
@@ -1884,11 +2077,27 @@ class Validator:
     """
     Helper class for validating resources exist.
 
+    In strict mode (the default) files and image sizes are checked against
+    the asset index. Otherwise they're trusted, which is meant for a game
+    whose data was already checked when it was built.
+
+    Parameters:
+        strict: Whether files and image sizes should be checked.
+
     """
 
-    def __init__(self) -> None:
-        self.db = JSONDatabase()
-        self.db.preload()
+    def __init__(self, strict: bool = True) -> None:
+        self.strict = strict
+        self._db: Optional[JSONDatabase] = None
+        self.index = prepare.ASSETS
+
+    @property
+    def db(self) -> JSONDatabase:
+        """Untyped copy of the database, preloaded on first use."""
+        if self._db is None:
+            self._db = JSONDatabase()
+            self._db.preload()
+        return self._db
 
     def translation(self, msgid: str) -> bool:
         """
@@ -1915,12 +2124,9 @@ class Validator:
             True if file exists
 
         """
-
-        try:
-            path = prepare.fetch(file)
-            return os.path.exists(path)
-        except OSError:
-            return False
+        if not self.strict:
+            return True
+        return self.index.find(file) is not None
 
     def size(self, file: str, size: tuple[int, int]) -> bool:
         """
@@ -1934,23 +2140,21 @@ class Validator:
             True if file respects
 
         """
-        path = prepare.fetch(file)
-        sprite = Image.open(path)
+        if not self.strict:
+            return True
+        sprite_size = self.index.image_size(file)
         native = prepare.NATIVE_RESOLUTION
         if size == native:
-            if sprite.size[0] > size[0] or sprite.size[1] > size[1]:
-                sprite.close()
+            if sprite_size[0] > size[0] or sprite_size[1] > size[1]:
                 raise ValueError(
-                    f"{file} {sprite.size}: "
+                    f"{file} {sprite_size}: "
                     f"It must be less than the native resolution {native}"
                 )
         else:
-            if sprite.size[0] != size[0] or sprite.size[1] != size[1]:
-                sprite.close()
+            if sprite_size[0] != size[0] or sprite_size[1] != size[1]:
                 raise ValueError(
-                    f"{file} {sprite.size}: It must be equal to {size}"
+                    f"{file} {sprite_size}: It must be equal to {size}"
                 )
-        sprite.close()
         return True
 
     def check_conditions(self, conditions: Sequence[str]) -> bool:
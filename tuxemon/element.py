@@ -3,13 +3,20 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Sequence
+from collections.abc import Mapping, Sequence
 from typing import Optional
 
-from tuxemon.db import ElementItemModel, ElementType, db
+from tuxemon import prepare
+from tuxemon.db import ElementItemModel, ElementModel, ElementType, db
+from tuxemon.slug_cache import SlugCache
 
 logger = logging.getLogger(__name__)
 
+# Index of every element in the rows and columns of the element matrix.
+ELEMENT_IDS: dict[str, int] = {
+    element.value: index for index, element in enumerate(ElementType)
+}
+
 
 class Element:
     """An Element holds a list of types and multipliers."""
@@ -45,11 +52,221 @@ class Element:
 
     def lookup_multiplier(self, element: ElementType) -> float:
         """Looks up the element multiplier for this element."""
-        mult = self.lookup_field(element, "multiplier")
-        if mult is None:
-            logger.error(
-                f"Multiplier for element '{element}' not found in "
-                f"this element '{self.slug}'"
-            )
-            return 1.0
-        return mult
+        return get_element_matrix().multiplier(self.slug, element)
+
+
+_elements: SlugCache[Element] = SlugCache(
+    "element", lambda results: Element(results.slug)
+)
+
+
+def get_element(slug: str) -> Element:
+    """
+    Returns the element of a slug, shared by everything of that element.
+
+    The element is loaded once, and again if the database is reloaded.
+    It must not be modified.
+
+    Parameters:
+        slug: Slug of the element.
+
+    Returns:
+        The element.
+
+    """
+    try:
+        return _elements.get(slug)
+    except KeyError:
+        raise RuntimeError(f"Element {slug} not found")
+
+
+class ElementMatrix:
+    """
+    Multipliers of every element against every other element.
+
+    The element table is compiled into dense matrices indexed by
+    :data:`ELEMENT_IDS`, the attacking element being the row and the
+    defending element the column. Missing multipliers count as 1.0.
+
+    Parameters:
+        elements: The element table of the database.
+
+    """
+
+    def __init__(self, elements: Mapping[str, ElementModel]) -> None:
+        size = len(ELEMENT_IDS)
+        aether = ELEMENT_IDS[ElementType.aether]
+        low, high = prepare.MULTIPLIER_RANGE
+        self.table = elements
+        self.size = len(elements)
+        self.multipliers = [[1.0] * size for _ in range(size)]
+        for slug, model in elements.items():
+            row = self.multipliers[ELEMENT_IDS[slug]]
+            found = set()
+            for item in model.types:
+                row[ELEMENT_IDS[item.against]] = float(item.multiplier)
+                found.add(item.against)
+            for against in ElementType:
+                if against not in found:
+                    logger.error(
+                        f"Multiplier for element '{against}' not found in "
+                        f"this element '{slug}'"
+                    )
+        # aether is neutral: it doesn't count in the damage (None) and
+        # weighs 1.0 in the type multiplier
+        self.damage: list[list[Optional[float]]] = [
+            [
+                (
+                    None
+                    if aether in (attack, target)
+                    else min(high, max(low, self.multipliers[attack][target]))
+                )
+                for target in range(size)
+            ]
+            for attack in range(size)
+        ]
+        self.types = [
+            [
+                1.0 if aether in (attack, target) else multiplier
+                for target, multiplier in enumerate(row)
+            ]
+            for attack, row in enumerate(self.multipliers)
+        ]
+
+    def is_current(self, elements: Mapping[str, ElementModel]) -> bool:
+        """Whether the matrix was compiled from this element table."""
+        return self.table is elements and self.size == len(elements)
+
+    def multiplier(self, attack: str, target: str) -> float:
+        """
+        Returns the multiplier of an element against another.
+
+        Parameters:
+            attack: Slug of the attacking element.
+            target: Slug of the defending element.
+
+        Returns:
+            The multiplier, as written in the database.
+
+        """
+        return self.multipliers[ELEMENT_IDS[attack]][ELEMENT_IDS[target]]
+
+    def damage_multiplier(
+        self, attack_types: Sequence[Element], target_types: Sequence[Element]
+    ) -> float:
+        """
+        Returns the damage multiplier of a technique against a monster.
+
+        The multiplier is clamped to ``MULTIPLIER_RANGE`` and aether is
+        neutral. When both sides have several types, the last pair of
+        types wins, as in :func:`tuxemon.formula.simple_damage_multiplier`.
+
+        Parameters:
+            attack_types: The types of the technique.
+            target_types: The types of the target.
+
+        Returns:
+            The damage multiplier.
+
+        """
+        multiplier = 1.0
+        for attack_type in attack_types:
+            row = self.damage[ELEMENT_IDS[attack_type.slug]]
+            for target_type in target_types:
+                value = row[ELEMENT_IDS[target_type.slug]]
+                if value is not None:
+                    multiplier = value
+        return multiplier
+
+    def type_multiplier(
+        self,
+        monster_types: Sequence[Element],
+        opponent_types: Sequence[Element],
+    ) -> float:
+        """
+        Returns the product of the multipliers of some types against others.
+
+        Parameters:
+            monster_types: The types of the monster.
+            opponent_types: The types of the opponent.
+
+        Returns:
+            The type multiplier, aether being neutral.
+
+        """
+        multiplier = 1.0
+        for monster_type in monster_types:
+            row = self.types[ELEMENT_IDS[monster_type.slug]]
+            for opponent_type in opponent_types:
+                multiplier *= row[ELEMENT_IDS[opponent_type.slug]]
+        return multiplier
+
+    def damage_multipliers(
+        self,
+        attack_types: Sequence[Sequence[Element]],
+        target_types: Sequence[Sequence[Element]],
+    ) -> list[list[float]]:
+        """
+        Returns the damage multipliers of several techniques against
+        several monsters at once.
+
+        Techniques and monsters sharing the same types are only computed
+        once, so this is cheaper than calling :meth:`damage_multiplier` for
+        every pair.
+
+        Parameters:
+            attack_types: The types of every technique.
+            target_types: The types of every target.
+
+        Returns:
+            One row per technique, with the multiplier against every target.
+
+        """
+        targets = [
+            tuple(ELEMENT_IDS[element.slug] for element in types)
+            for types in target_types
+        ]
+        rows: dict[tuple[int, ...], list[float]] = {}
+        result = []
+        for types in attack_types:
+            attacks = tuple(ELEMENT_IDS[element.slug] for element in types)
+            row = rows.get(attacks)
+            if row is None:
+                row = rows[attacks] = [
+                    self._damage_ids(attacks, target) for target in targets
+                ]
+            result.append(row)
+        return result
+
+    def _damage_ids(
+        self, attacks: Sequence[int], targets: Sequence[int]
+    ) -> float:
+        multiplier = 1.0
+        for attack in attacks:
+            row = self.damage[attack]
+            for target in targets:
+                value = row[target]
+                if value is not None:
+                    multiplier = value
+        return multiplier
+
+
+_element_matrix: Optional[ElementMatrix] = None
+
+
+def get_element_matrix() -> ElementMatrix:
+    """
+    Returns the element matrix of the loaded database.
+
+    The matrix is compiled the first time it's needed after the element
+    table is loaded, and again if the table is replaced.
+
+    Returns:
+        The element matrix.
+
+    """
+    global _element_matrix
+    elements = db.database["element"]
+    if _element_matrix is None or not _element_matrix.is_current(elements):
+        _element_matrix = ElementMatrix(elements)
+    return _element_matrix
@@ -39,9 +39,9 @@ class Entity(Generic[SaveDict]):
     ) -> None:
         self.slug = slug
         self.world = world
-        world.add_entity(self)
+        self._tile_pos = (0, 0)
         self.instance_id = uuid.uuid4()
-        self.tile_pos = (0, 0)
+        world.add_entity(self)
         self.position3 = Point3(0, 0, 0)
         # not used currently
         self.acceleration3 = Vector3(0, 0, 0)
@@ -49,6 +49,17 @@ class Entity(Generic[SaveDict]):
         self.update_location = False
         self.isplayer: bool = False
 
+    @property
+    def tile_pos(self) -> tuple[int, int]:
+        """Tile of the entity, the entity index follows its changes."""
+        return self._tile_pos
+
+    @tile_pos.setter
+    def tile_pos(self, tile_pos: tuple[int, int]) -> None:
+        if tile_pos != self._tile_pos:
+            self._tile_pos = tile_pos
+            self.world.entity_index.move(self)
+
     # === PHYSICS START =======================================================
     def stop_moving(self) -> None:
         """
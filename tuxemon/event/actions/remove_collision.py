@@ -44,4 +44,4 @@ class RemoveCollisionAction(EventAction):
         coords = world.check_collision_zones(world.collision_map, self.label)
         if coords:
             for coord in coords:
-                world.collision_map[coord] = properties
+                world.collision_index.set_collision(coord, properties)
@@ -55,6 +55,7 @@ class SaveGameAction(EventAction):
             save.save(
                 save_data,
                 index,
+                self.on_saved,
             )
             save.slot_number = slot
         except Exception as e:
@@ -62,8 +63,14 @@ class SaveGameAction(EventAction):
             logger.error("Unable to save game!!")
             logger.error(e)
             open_dialog(self.session, [T.translate("save_failure")])
+
+    def on_saved(self, error: Optional[BaseException]) -> None:
+        """Reports the result once the save is written."""
+        if error is not None:
+            logger.error("Unable to save game!!")
+            logger.error(error)
+            open_dialog(self.session, [T.translate("save_failure")])
+        elif self.index is not None:
+            open_dialog(self.session, [T.translate("save_success")])
         else:
-            if self.index is not None:
-                open_dialog(self.session, [T.translate("save_success")])
-            else:
-                logger.info(T.translate("save_success"))
+            logger.info(T.translate("save_success"))
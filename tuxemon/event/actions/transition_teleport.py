@@ -49,6 +49,7 @@ class TransitionTeleportAction(EventAction):
             for _npc in self.world.npcs:
                 if _npc.moving or _npc.path:
                     self.world.npcs.remove(_npc)
+                    self.world.entity_index.remove(_npc)
 
         if self.world.teleporter.delayed_teleport:
             self.stop()
@@ -43,4 +43,4 @@ class UpdateTilePropertiesAction(EventAction):
             prop: dict[str, float] = {}
             prop[self.label] = moverate
             for coord in coords:
-                world.surface_map[coord] = prop
+                world.collision_index.set_surface(coord, prop)
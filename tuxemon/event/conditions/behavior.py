@@ -2,6 +2,8 @@
 # Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
 from __future__ import annotations
 
+from typing import Optional
+
 from tuxemon.event import MapCondition
 from tuxemon.event.conditions.button_pressed import ButtonPressedCondition
 from tuxemon.event.conditions.char_at import CharAtCondition
@@ -21,6 +23,11 @@ class BehaviorCondition(EventCondition):
 
     name = "behav"
 
+    def get_area(self, condition: MapCondition) -> Optional[tuple[str, int]]:
+        if condition.parameters[0] == "door":
+            return "player", 0
+        return None
+
     def test(self, session: Session, condition: MapCondition) -> bool:
         cond = condition
         param = condition.parameters
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from typing import Optional
 
 from tuxemon.event import MapCondition, collide, get_npc
 from tuxemon.event.eventcondition import EventCondition
@@ -26,6 +27,10 @@ class CharAtCondition(EventCondition):
     """
 
     name = "char_at"
+    depends_on = frozenset({"npcs"})
+
+    def get_area(self, condition: MapCondition) -> Optional[tuple[str, int]]:
+        return condition.parameters[0], 0
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         character = get_npc(session, condition.parameters[0])
@@ -22,6 +22,7 @@ class CharExistsCondition(EventCondition):
     """
 
     name = "char_exists"
+    depends_on = frozenset({"npcs"})
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         return get_npc(session, condition.parameters[0]) is not None
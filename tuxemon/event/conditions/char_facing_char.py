@@ -28,6 +28,7 @@ class CharFacingCharCondition(EventCondition):
     """
 
     name = "char_facing_char"
+    depends_on = frozenset({"map", "npcs"})
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         client = session.client
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from typing import Optional
 
 from tuxemon.db import SurfaceKeys
 from tuxemon.event import MapCondition, get_npc
@@ -33,6 +34,12 @@ class CharFacingTileCondition(EventCondition):
 
     name = "char_facing_tile"
 
+    def get_area(self, condition: MapCondition) -> Optional[tuple[str, int]]:
+        if len(condition.parameters) > 1:
+            # the tiles are found by property, anywhere on the map
+            return None
+        return condition.parameters[0], 1
+
     def test(self, session: Session, condition: MapCondition) -> bool:
         character = get_npc(session, condition.parameters[0])
         if character is None:
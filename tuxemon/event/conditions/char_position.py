@@ -28,6 +28,7 @@ class CharPositionCondition(EventCondition):
     """
 
     name = "char_position"
+    depends_on = frozenset({"npcs"})
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         character = get_npc(session, condition.parameters[0])
@@ -31,6 +31,7 @@ class HasBagCondition(EventCondition):
     """
 
     name = "has_bag"
+    depends_on = frozenset({"inventory", "npcs"})
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         character_name, check, number = condition.parameters[:3]
@@ -30,6 +30,7 @@ class HasItemCondition(EventCondition):
     """
 
     name = "has_item"
+    depends_on = frozenset({"inventory", "npcs"})
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         def op(itm_qty: int, op: str, qty: int) -> bool:
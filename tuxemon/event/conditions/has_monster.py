@@ -27,6 +27,7 @@ class HasMonsterCondition(EventCondition):
     """
 
     name = "has_monster"
+    depends_on = frozenset({"npcs", "party"})
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         _character, _monster = condition.parameters[:2]
@@ -21,6 +21,7 @@ class LocationInsideCondition(EventCondition):
     """
 
     name = "location_inside"
+    depends_on = frozenset({"map"})
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         client = session.client
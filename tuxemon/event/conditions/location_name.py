@@ -27,6 +27,7 @@ class LocationNameCondition(EventCondition):
     """
 
     name = "location_name"
+    depends_on = frozenset({"map"})
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         client = session.client
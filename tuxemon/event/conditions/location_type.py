@@ -27,6 +27,7 @@ class LocationTypeCondition(EventCondition):
     """
 
     name = "location_type"
+    depends_on = frozenset({"map"})
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         client = session.client
@@ -28,6 +28,7 @@ class OneOfCondition(EventCondition):
     """
 
     name = "one_of"
+    depends_on = frozenset({"variables"})
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         player = session.player
@@ -2,6 +2,8 @@
 # Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
 from __future__ import annotations
 
+from typing import Optional
+
 from tuxemon.event import MapCondition
 from tuxemon.event.conditions.button_pressed import ButtonPressedCondition
 from tuxemon.event.conditions.char_facing_tile import CharFacingTileCondition
@@ -22,6 +24,9 @@ class ToUseTileCondition(EventCondition):
 
     name = "to_use_tile"
 
+    def get_area(self, condition: MapCondition) -> Optional[tuple[str, int]]:
+        return CharFacingTileCondition().get_area(condition)
+
     def test(self, session: Session, condition: MapCondition) -> bool:
         character_facing_tile = CharFacingTileCondition().test(
             session,
@@ -19,6 +19,7 @@ class TrueCondition(EventCondition):
     """
 
     name = "true"
+    depends_on = frozenset()
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         """
@@ -27,6 +27,7 @@ class VariableIsCondition(EventCondition):
     """
 
     name = "variable_is"
+    depends_on = frozenset({"variables"})
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         # Read the parameters
@@ -27,6 +27,7 @@ class VariableSetCondition(EventCondition):
     """
 
     name = "variable_set"
+    depends_on = frozenset({"variables"})
 
     def test(self, session: Session, condition: MapCondition) -> bool:
         """
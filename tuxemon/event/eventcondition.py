@@ -2,7 +2,7 @@
 # Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
 from __future__ import annotations
 
-from typing import Any, ClassVar
+from typing import Any, ClassVar, Optional
 
 from tuxemon.event import MapCondition
 from tuxemon.session import Session
@@ -10,6 +10,10 @@ from tuxemon.session import Session
 
 class EventCondition:
     name: ClassVar[str] = "GenericCondition"
+    # What the result of the condition depends on (see
+    # tuxemon.event.eventengine.SIGNALS): the result is reused until one
+    # of them changes. ``None`` means it's tested every frame.
+    depends_on: ClassVar[Optional[frozenset[str]]] = None
 
     def __init__(self) -> None:
         pass
@@ -28,6 +32,25 @@ class EventCondition:
         """
         return True
 
+    def get_area(self, condition: MapCondition) -> Optional[tuple[str, int]]:
+        """
+        Return where a character must be for the condition to be true.
+
+        Conditions that can only be true when a character is in (or next
+        to) their area are only tested while the character is there (see
+        :class:`tuxemon.event.eventengine.EventIndex`).
+
+        Parameters:
+            condition: Condition defined in the map.
+
+        Returns:
+            The slug of the character and the margin, in tiles, around
+            the area of the condition. ``None`` if the condition can be
+            true anywhere.
+
+        """
+        return None
+
     def get_persist(self, session: Session) -> dict[str, Any]:
         """
         Return dictionary for this event class's data.
@@ -3,22 +3,84 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Generator, Iterable, Sequence
+from collections.abc import Callable, Generator, Iterable, Mapping, Sequence
 from contextlib import contextmanager
 from textwrap import dedent
-from typing import Any, Optional, Union
+from typing import TYPE_CHECKING, Any, Optional, Union
 
 from tuxemon import plugin, prepare
 from tuxemon.constants import paths
-from tuxemon.event import EventObject, MapAction, MapCondition
+from tuxemon.event import EventObject, MapAction, MapCondition, get_npc
 from tuxemon.event.eventaction import EventAction
 from tuxemon.event.eventcondition import EventCondition
 from tuxemon.map import TuxemonMap
 from tuxemon.session import Session
 
+if TYPE_CHECKING:
+    from tuxemon.npc import NPC
+
 logger = logging.getLogger(__name__)
 
 
+def _characters(session: Session) -> list[NPC]:
+    from tuxemon.states.world.worldstate import WorldState
+
+    world = session.client.get_state_by_name(WorldState)
+    return [session.player, *world.npcs]
+
+
+def _npcs_signal(session: Session) -> Any:
+    return [
+        (id(npc), npc.slug, npc.tile_pos, npc.facing)
+        for npc in _characters(session)
+    ]
+
+
+def _variables_signal(session: Session) -> Any:
+    return dict(session.player.game_variables)
+
+
+def _party_signal(session: Session) -> Any:
+    return [
+        [id(monster) for monster in npc.monsters]
+        for npc in _characters(session)
+    ]
+
+
+def _inventory_signal(session: Session) -> Any:
+    return [
+        [(id(item), item.quantity) for item in npc.items]
+        for npc in _characters(session)
+    ]
+
+
+def _map_signal(session: Session) -> Any:
+    client = session.client
+    return (
+        client.map_slug,
+        client.map_inside,
+        client.map_type,
+        client.map_size,
+    )
+
+
+# What the event conditions can depend on. Every frame, each signal takes
+# a snapshot of the game; the conditions depending on it are tested again
+# when the snapshot changes.
+SIGNALS: dict[str, Callable[[Session], Any]] = {
+    # slug, tile and facing of the player and the NPCs of the map
+    "npcs": _npcs_signal,
+    # the game variables of the player
+    "variables": _variables_signal,
+    # the monsters in the party of the characters
+    "party": _party_signal,
+    # the items in the bag of the characters, and their quantity
+    "inventory": _inventory_signal,
+    # the current map and its properties
+    "map": _map_signal,
+}
+
+
 class RunningEvent:
     """
     Manage MapEvents that are used during gameplay.
@@ -83,6 +145,104 @@ class RunningEvent:
         self.action_index += 1
 
 
+class EventIndex:
+    """
+    Index of the events of a map by the tiles where they can start.
+
+    Many events can only start when a character is in (or next to) their
+    area, e.g. those with an ``is char_at player`` condition. Those events
+    are indexed by the tiles of their area, so only the events around the
+    characters need to be checked, whatever the size of the map. The
+    other events are always checked.
+
+    An event is only indexed if the conditions tested before the one
+    telling its area have no side effects (they declare their signals),
+    so skipping the event doesn't change anything.
+
+    Parameters:
+        events: The events of the map.
+        conditions: The condition classes, by name.
+
+    """
+
+    def __init__(
+        self,
+        events: Sequence[EventObject],
+        conditions: Mapping[str, type[EventCondition]],
+    ) -> None:
+        self.events = events
+        self.always: list[tuple[int, EventObject]] = []
+        self.by_tile: dict[
+            str, dict[tuple[int, int], list[tuple[int, EventObject]]]
+        ] = {}
+        instances: dict[str, EventCondition] = {}
+        for index, event in enumerate(events):
+            area = self.get_event_area(event, conditions, instances)
+            if area is None:
+                self.always.append((index, event))
+                continue
+            slug, margin, cond = area
+            tiles = self.by_tile.setdefault(slug, {})
+            for x in range(cond.x - margin, cond.x + cond.width + margin):
+                for y in range(cond.y - margin, cond.y + cond.height + margin):
+                    tiles.setdefault((x, y), []).append((index, event))
+
+    @staticmethod
+    def get_event_area(
+        event: EventObject,
+        conditions: Mapping[str, type[EventCondition]],
+        instances: dict[str, EventCondition],
+    ) -> Optional[tuple[str, int, MapCondition]]:
+        """
+        Get the area where an event can start.
+
+        Parameters:
+            event: The event.
+            conditions: The condition classes, by name.
+            instances: Condition instances, by name, filled as needed.
+
+        Returns:
+            The slug of the character, the margin in tiles and the
+            condition giving the area, or ``None`` if the event can start
+            anywhere.
+
+        """
+        for cond in event.conds:
+            condition_class = conditions.get(cond.type)
+            if condition_class is None:
+                return None
+            if cond.operator == "is":
+                condition = instances.get(cond.type)
+                if condition is None:
+                    condition = instances[cond.type] = condition_class()
+                area = condition.get_area(cond)
+                if area is not None:
+                    return area[0], area[1], cond
+            if condition_class.depends_on is None:
+                return None
+        return None
+
+    def get_events(
+        self, tiles: Mapping[str, tuple[int, int]]
+    ) -> list[EventObject]:
+        """
+        Get the events that may start, in the order of the map.
+
+        Parameters:
+            tiles: The tile of the characters, by slug.
+
+        Returns:
+            The events always checked and the ones around the characters.
+
+        """
+        candidates = list(self.always)
+        for slug, tile in tiles.items():
+            candidates.extend(self.by_tile[slug].get(tile, ()))
+        if len(candidates) > len(self.always):
+            candidates.sort(key=lambda candidate: candidate[0])
+        return [event for _, event in candidates]
+
+
 class EventEngine:
     """
     A class for the event engine. The event engine checks to see if a group of
@@ -113,6 +273,15 @@ class EventEngine:
         # debug
         self.partial_events: list[Sequence[tuple[bool, MapCondition]]] = list()
 
+        # incremental checking of the conditions, see check_event
+        self._condition_instances: dict[str, EventCondition] = {}
+        self._snapshots: dict[str, Any] = {}
+        self._versions = dict.fromkeys(SIGNALS, 0)
+        self._stamps: dict[tuple[str, ...], tuple[int, ...]] = {}
+        self._event_signals: dict[int, Optional[tuple[str, ...]]] = {}
+        self._event_results: dict[int, tuple[tuple[int, ...], bool]] = {}
+        self._event_index: Optional[EventIndex] = None
+
         self.conditions = plugin.load_plugins(
             paths.CONDITIONS_PATH,
             "conditions",
@@ -136,6 +305,10 @@ class EventEngine:
         self.timer = 0.0
         self.wait = 0.0
         self.button = None
+        self._snapshots = {}
+        self._event_signals = {}
+        self._event_results = {}
+        self._event_index = None
 
     def get_action(
         self,
@@ -237,16 +410,22 @@ class EventEngine:
             The value of the condition.
 
         """
-        map_condition = self.get_condition(cond_data.type)
+        map_condition = self._condition_instances.get(cond_data.type)
         if map_condition is None:
-            logger.debug(f'map condition "{cond_data.type}" is not loaded')
-            return False
+            map_condition = self.get_condition(cond_data.type)
+            if map_condition is None:
+                logger.debug(f'map condition "{cond_data.type}" is not loaded')
+                return False
+            self._condition_instances[cond_data.type] = map_condition
 
         result = map_condition.test(self.session, cond_data) == (
             cond_data.operator == "is"
         )
         logger.debug(
-            f'map condition "{map_condition.name}": {result} ({cond_data})'
+            'map condition "%s": %s (%s)',
+            map_condition.name,
+            result,
+            cond_data,
         )
         return result
 
@@ -328,9 +507,94 @@ class EventEngine:
                 self.start_event(map_event)
         else:
             # Optimal mode: start event if all conditions are met
-            if all(self.check_condition(cond) for cond in map_event.conds):
+            if self.check_event(map_event):
                 self.start_event(map_event)
 
+    def check_event(self, map_event: EventObject) -> bool:
+        """
+        Check if all the conditions of an event are met.
+
+        If every condition of the event tells what it depends on, the
+        result is kept until one of those signals changes (see
+        :meth:`update_signals`), so the conditions aren't tested again
+        while nothing they depend on changed.
+
+        Parameters:
+            map_event: Event to check.
+
+        Returns:
+            Whether the conditions are met.
+
+        """
+        signals = self.get_event_signals(map_event)
+        if signals is None or not prepare.CONFIG.event_cache:
+            return all(self.check_condition(cond) for cond in map_event.conds)
+
+        versions = self._stamps.get(signals)
+        if versions is None:
+            versions = tuple(self._versions[name] for name in signals)
+            self._stamps[signals] = versions
+        cached = self._event_results.get(id(map_event))
+        if cached is not None and cached[0] == versions:
+            return cached[1]
+        result = all(self.check_condition(cond) for cond in map_event.conds)
+        self._event_results[id(map_event)] = (versions, result)
+        return result
+
+    def get_event_signals(
+        self, map_event: EventObject
+    ) -> Optional[tuple[str, ...]]:
+        """
+        Get the signals the conditions of an event depend on.
+
+        Parameters:
+            map_event: Event whose conditions are checked.
+
+        Returns:
+            Names of the signals, or ``None`` if a condition must be tested
+            every frame.
+
+        """
+        key = id(map_event)
+        try:
+            return self._event_signals[key]
+        except KeyError:
+            pass
+
+        signals: Optional[set[str]] = set()
+        for cond in map_event.conds:
+            condition = self.conditions.get(cond.type)
+            depends_on = None if condition is None else condition.depends_on
+            if depends_on is None or not depends_on <= SIGNALS.keys():
+                signals = None
+                break
+            signals.update(depends_on)
+
+        result = None if signals is None else tuple(sorted(signals))
+        self._event_signals[key] = result
+        return result
+
+    def update_signals(self) -> None:
+        """
+        Take a snapshot of every signal and record those that changed.
+
+        A signal that can't be read (e.g. there is no world yet) counts
+        as changed.
+
+        """
+        for name, signal in SIGNALS.items():
+            try:
+                snapshot = signal(self.session)
+            except (AttributeError, ValueError):
+                snapshot = object()
+            if (
+                name not in self._snapshots
+                or snapshot != self._snapshots[name]
+            ):
+                self._snapshots[name] = snapshot
+                self._versions[name] += 1
+        self._stamps.clear()
+
     def process_map_events(self, events: Iterable[EventObject]) -> None:
         """
         Process all events in an iterable.
@@ -364,6 +628,9 @@ class EventEngine:
         Actions may be started during this function.
 
         """
+        if prepare.CONFIG.event_cache:
+            self.update_signals()
+
         # do the "init" events.  this will be done just once
         # TODO: make event engine generic, so can be used in global scope,
         # not just maps
@@ -371,7 +638,38 @@ class EventEngine:
             self.process_map_events(self.session.client.inits)
 
         # process any other events
-        self.process_map_events(self.session.client.events)
+        self.process_map_events(self.get_map_events())
+
+    def get_map_events(self) -> Sequence[EventObject]:
+        """
+        Get the events of the map that may start this frame.
+
+        The events bound to the area of a character are left out while
+        the character is elsewhere (see :class:`EventIndex`). All the events
+        are returned in debug mode, to show their conditions.
+
+        Returns:
+            The events to check, in the order of the map.
+
+        """
+        events = self.session.client.events
+        if prepare.CONFIG.collision_map:
+            return events
+
+        index = self._event_index
+        if index is None or index.events is not events:
+            index = self._event_index = EventIndex(events, self.conditions)
+
+        tiles = {}
+        for slug in index.by_tile:
+            try:
+                character = get_npc(self.session, slug)
+            except ValueError:
+                # there is no world yet
+                return events
+            if character is not None:
+                tiles[slug] = character.tile_pos
+        return index.get_events(tiles)
 
     def update_running_events(self, dt: float) -> None:
         """
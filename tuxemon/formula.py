@@ -12,15 +12,12 @@ from typing import TYPE_CHECKING, Optional
 from tuxemon import prepare as pre
 
 if TYPE_CHECKING:
-    from tuxemon.db import ElementType
     from tuxemon.element import Element
     from tuxemon.monster import Monster
     from tuxemon.technique.technique import Technique
 
 logger = logging.getLogger(__name__)
 
-multiplier_cache: dict[tuple[ElementType, ElementType], float] = {}
-
 range_map: dict[str, tuple[str, str]] = {
     "melee": ("melee", "armour"),
     "touch": ("melee", "dodge"),
@@ -71,24 +68,12 @@ def simple_damage_multiplier(
         The attack multiplier.
 
     """
-    multiplier = 1.0
-    for attack_type in attack_types:
-        for target_type in target_types:
-            if target_type and not (
-                attack_type.slug == "aether" or target_type.slug == "aether"
-            ):
-                key = (attack_type.slug, target_type.slug)
-                if key in multiplier_cache:
-                    multiplier = multiplier_cache[key]
-                else:
-                    multiplier = attack_type.lookup_multiplier(
-                        target_type.slug
-                    )
-                    multiplier_cache[key] = multiplier
-                multiplier = min(
-                    pre.MULTIPLIER_RANGE[1],
-                    max(pre.MULTIPLIER_RANGE[0], multiplier),
-                )
+    # imported here, tuxemon.db imports this module through tuxemon.locale
+    from tuxemon.element import get_element_matrix
+
+    multiplier = get_element_matrix().damage_multiplier(
+        attack_types, target_types
+    )
     # Apply additional factors
     if additional_factors:
         factor_multiplier = math.prod(additional_factors.values())
@@ -112,14 +97,9 @@ def calculate_multiplier(
         float: The final multiplier that represents the effectiveness of
         the monster'stypes against the opponent's types.
     """
-    multiplier = 1.0
-    for _monster in monster_types:
-        for _opponent in opponent_types:
-            if _opponent and not (
-                _monster.slug == "aether" or _opponent.slug == "aether"
-            ):
-                multiplier *= _monster.lookup_multiplier(_opponent.slug)
-    return multiplier
+    from tuxemon.element import get_element_matrix
+
+    return get_element_matrix().type_multiplier(monster_types, opponent_types)
 
 
 def simple_damage_calculate(
@@ -11,7 +11,9 @@ from __future__ import annotations
 import logging
 import os
 import re
-from collections.abc import Iterable, Sequence
+from collections import OrderedDict
+from collections.abc import Hashable, Iterable, Sequence
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Optional, Protocol, Union
 
 import pygame
@@ -19,6 +21,7 @@ from pytmx.pytmx import TileFlags
 from pytmx.util_pygame import handle_transformation, smart_convert
 
 from tuxemon import prepare
+from tuxemon.atlas import animation_atlas_name, find_atlas
 from tuxemon.db import db
 from tuxemon.session import Session
 from tuxemon.sprite import Sprite
@@ -114,7 +117,103 @@ def cursor_from_image(image: pygame.surface.Surface) -> Sequence[str]:
     return icon_string
 
 
-def load_and_scale(filename: str) -> pygame.surface.Surface:
+class SurfaceCache:
+    """
+    Process-wide cache of the surfaces loaded from disk.
+
+    Surfaces are kept until the memory budget is exceeded, then the least
+    recently used ones are evicted. Cached surfaces are shared: callers
+    that modify the surface they get (blits, alpha, etc.) must ask for a
+    private copy.
+
+    Parameters:
+        budget: Maximum memory used by the cached pixels, in bytes.
+
+    """
+
+    def __init__(self, budget: int) -> None:
+        self.budget = budget
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._surfaces: OrderedDict[Hashable, pygame.surface.Surface] = (
+            OrderedDict()
+        )
+
+    def get(self, key: Hashable) -> Optional[pygame.surface.Surface]:
+        """
+        Returns the cached surface, if any, and marks it as recently used.
+
+        Parameters:
+            key: Key of the surface.
+
+        Returns:
+            The cached surface or ``None``.
+
+        """
+        surface = self._surfaces.get(key)
+        if surface is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._surfaces.move_to_end(key)
+        return surface
+
+    def put(self, key: Hashable, surface: pygame.surface.Surface) -> None:
+        """
+        Adds a surface to the cache, evicting old ones to respect the budget.
+
+        Parameters:
+            key: Key of the surface.
+            surface: Surface to cache.
+
+        """
+        surface_size = surface.get_pitch() * surface.get_height()
+        if surface_size > self.budget:
+            return
+        if key in self._surfaces:
+            old = self._surfaces.pop(key)
+            self.size -= old.get_pitch() * old.get_height()
+        self._surfaces[key] = surface
+        self.size += surface_size
+        while self.size > self.budget:
+            _, old = self._surfaces.popitem(last=False)
+            self.size -= old.get_pitch() * old.get_height()
+            self.evictions += 1
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._surfaces
+
+    def clear(self) -> None:
+        """Removes all the surfaces from the cache."""
+        self._surfaces.clear()
+        self.size = 0
+
+    def stats(self) -> dict[str, int]:
+        """
+        Returns the counters of the cache, useful for tuning the budget.
+
+        Returns:
+            Number of entries, used memory, hits, misses and evictions.
+
+        """
+        return {
+            "entries": len(self._surfaces),
+            "size": self.size,
+            "budget": self.budget,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+surface_cache = SurfaceCache(prepare.CONFIG.surface_cache_size * 1024 * 1024)
+
+
+def load_and_scale(
+    filename: str, *, copy: bool = False
+) -> pygame.surface.Surface:
     """
     Load an image and scale it according to game settings.
 
@@ -122,17 +221,59 @@ def load_and_scale(filename: str) -> pygame.surface.Surface:
     * Will be converted if needed
     * Scale factor will match game setting
 
+    The surface is shared through the surface cache, so use ``copy`` if it
+    is going to be modified.
+
     Parameters:
         filename: Path of the image file.
+        copy: Whether to return a private copy of the cached surface.
 
     Returns:
         Loaded and scaled image.
 
     """
-    return scale_surface(load_image(filename), prepare.SCALE)
+    key = scaled_image_key(filename)
+    surface = surface_cache.get(key)
+    if surface is None:
+        surface = scale_surface(_load_converted(key[0]), prepare.SCALE)
+        surface_cache.put(key, surface)
+    return surface.copy() if copy else surface
 
 
-def load_image(filename: str) -> pygame.surface.Surface:
+def scaled_image_key(filename: str) -> tuple[str, float, bool]:
+    """
+    Returns the key of an image loaded by :func:`load_and_scale`.
+
+    Parameters:
+        filename: Path of the image file.
+
+    Returns:
+        The key of the image in the surface cache.
+
+    """
+    return (transform_resource_filename(filename), prepare.SCALE, True)
+
+
+def cache_scaled_image(filename: str, image: pygame.surface.Surface) -> None:
+    """
+    Converts, scales and caches an image decoded elsewhere.
+
+    Images can be decoded by another thread, but they must be converted
+    on the main thread. Once cached, :func:`load_and_scale` returns the
+    image without reading the file.
+
+    Parameters:
+        filename: Path of the image file.
+        image: The decoded image, not converted.
+
+    """
+    key = scaled_image_key(filename)
+    if key not in surface_cache:
+        surface = smart_convert(image, None, True)
+        surface_cache.put(key, scale_surface(surface, prepare.SCALE))
+
+
+def load_image(filename: str, *, copy: bool = False) -> pygame.surface.Surface:
     """Load image from the resources folder
 
     * Filename will be transformed to be loaded from game resource folder
@@ -142,15 +283,28 @@ def load_image(filename: str) -> pygame.surface.Surface:
     but is slightly slower than just loading.  Its important that
     this is not called too often (like once per draw!)
 
+    The surface is shared through the surface cache, so use ``copy`` if it
+    is going to be modified.
+
     Parameters:
         filename: Path of the image file.
+        copy: Whether to return a private copy of the cached surface.
 
     Returns:
         Loaded image.
 
     """
-    filename = transform_resource_filename(filename)
-    return smart_convert(pygame.image.load(filename), None, True)
+    path = transform_resource_filename(filename)
+    key = (path, 1, True)
+    surface = surface_cache.get(key)
+    if surface is None:
+        surface = _load_converted(path)
+        surface_cache.put(key, surface)
+    return surface.copy() if copy else surface
+
+
+def _load_converted(path: str) -> pygame.surface.Surface:
+    return smart_convert(pygame.image.load(path), None, True)
 
 
 def load_sprite(
@@ -174,7 +328,7 @@ def load_sprite(
         Loaded sprite.
 
     """
-    sprite = Sprite(image=load_and_scale(filename))
+    sprite = Sprite(image=load_and_scale(filename, copy=True))
     sprite.rect = sprite.image.get_rect(**rect_kwargs)
     return sprite
 
@@ -203,7 +357,7 @@ def load_animated_sprite(
     anim = []
     for filename in filenames:
         if os.path.exists(filename):
-            image = load_and_scale(filename)
+            image = load_and_scale(filename, copy=True)
             anim.append((image, delay))
 
     tech = SurfaceAnimation(anim, True)
@@ -230,16 +384,55 @@ def load_frames_files(
 
     For example, water00.png, water01.png, water03.png.
 
+    The frames come from the atlas of the animation if there is an up to
+    date one, see :mod:`tuxemon.atlas`.
+
     Parameters:
         directory: Directory where the frames are located.
         name: Name of the animation (common prefix of the frames).
 
-    Yields:
+    Returns:
         Loaded and scaled frames.
 
     """
-    for filename in animation_frame_files(directory, name):
-        yield load_and_scale(filename)
+    files = animation_frame_files(directory, name)
+    frames = load_atlas_frames(animation_atlas_name(directory, name), files)
+    if frames is not None:
+        return frames
+    return [load_and_scale(filename) for filename in files]
+
+
+def load_atlas_frames(
+    name: str, files: Sequence[str]
+) -> Optional[list[pygame.surface.Surface]]:
+    """
+    Load frames from their atlas.
+
+    The atlas image is loaded and scaled like any other image, so it's
+    shared through the surface cache. The frames are subsurfaces of it.
+
+    Parameters:
+        name: Name of the atlas.
+        files: Paths of the frame files, in order.
+
+    Returns:
+        Loaded and scaled frames, in the order of the files, or ``None``
+        if there is no up to date atlas.
+
+    """
+    atlas = find_atlas(name, files)
+    if atlas is None:
+        return None
+    image_path, rects = atlas
+    try:
+        image = load_and_scale(image_path)
+    except (OSError, pygame.error) as e:
+        logger.warning(f"Unable to load atlas {image_path}: {e}")
+        return None
+    return [
+        image.subsurface([int(i * prepare.SCALE) for i in rect])
+        for rect in rects
+    ]
 
 
 def animation_frame_files(
@@ -262,13 +455,18 @@ def animation_frame_files(
         Sequence of filenames.
 
     """
+    return _animation_frame_files(directory, name)
+
+
+@lru_cache(maxsize=1024)
+def _animation_frame_files(directory: str, name: str) -> tuple[str, ...]:
+    # the animations are listed once, not each time they are played
     pattern = re.compile(rf"{name}\.?_?[0-9]+\.png")
-    frames = [
+    return tuple(
         os.path.join(directory, filename)
         for filename in sorted(os.listdir(directory))
         if pattern.match(filename)
-    ]
-    return frames
+    )
 
 
 def create_animation(
@@ -366,6 +564,98 @@ def convert_alpha_to_colorkey(
     return image
 
 
+class CachedTileset:
+    """
+    A scaled tileset image and the tiles already converted from it.
+
+    Parameters:
+        image: The tileset image, scaled to match the game scale.
+
+    """
+
+    def __init__(self, image: pygame.surface.Surface) -> None:
+        self.image = image
+        self.tiles: dict[
+            tuple[Optional[tuple[int, int, int, int]], Optional[TileFlags]],
+            pygame.surface.Surface,
+        ] = {}
+
+
+class TilesetCache:
+    """
+    Keeps the most recently used tilesets across map changes.
+
+    Neighbouring maps share most of their tilesets, so the scaled images
+    and their converted tiles are kept to avoid decoding and scaling the
+    same sheets again on every map transition.
+
+    Parameters:
+        max_size: Maximum number of tilesets kept.
+
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._tilesets: OrderedDict[Hashable, CachedTileset] = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[CachedTileset]:
+        """
+        Returns the cached tileset, if any, and marks it as recently used.
+
+        Parameters:
+            key: Key of the tileset.
+
+        Returns:
+            The cached tileset or ``None``.
+
+        """
+        tileset = self._tilesets.get(key)
+        if tileset is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._tilesets.move_to_end(key)
+        return tileset
+
+    def put(self, key: Hashable, tileset: CachedTileset) -> None:
+        """
+        Adds a tileset, evicting the least recently used ones if needed.
+
+        Parameters:
+            key: Key of the tileset.
+            tileset: Tileset to cache.
+
+        """
+        self._tilesets[key] = tileset
+        self._tilesets.move_to_end(key)
+        while len(self._tilesets) > self.max_size:
+            self._tilesets.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all the tilesets from the cache."""
+        self._tilesets.clear()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Returns the counters of the cache.
+
+        Returns:
+            Number of tilesets and tiles, hits and misses.
+
+        """
+        return {
+            "tilesets": len(self._tilesets),
+            "tiles": sum(len(t.tiles) for t in self._tilesets.values()),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+tileset_cache = TilesetCache(prepare.TILESET_CACHE_SIZE)
+
+
 def scaled_image_loader(
     filename: str,
     colorkey: Optional[str],
@@ -376,7 +666,8 @@ def scaled_image_loader(
     """
     Pytmx image loader for pygame.
 
-    Modified to load images at a scaled size.
+    Modified to load images at a scaled size. The scaled tileset and the
+    converted tiles are kept in the tileset cache.
 
     Parameters:
         filename: Path of the image.
@@ -390,32 +681,44 @@ def scaled_image_loader(
     """
     colorkey_color = pygame.Color(f"#{colorkey}") if colorkey else None
 
-    # load the tileset image
-    image = pygame.image.load(filename)
+    filename = os.path.normpath(filename)
+    key = (filename, prepare.SCALE, colorkey, pixelalpha)
+    tileset = tileset_cache.get(key)
+    if tileset is None:
+        # load the tileset image
+        image = pygame.image.load(filename)
 
-    # scale the tileset image to match game scale
-    scaled_size = scale_sequence(image.get_size())
-    image = pygame.transform.scale(image, scaled_size)
+        # scale the tileset image to match game scale
+        scaled_size = scale_sequence(image.get_size())
+        image = pygame.transform.scale(image, scaled_size)
+        tileset = CachedTileset(image)
+        tileset_cache.put(key, tileset)
 
     def load_image(
         rect: Optional[tuple[int, int, int, int]] = None,
         flags: Optional[TileFlags] = None,
     ) -> pygame.surface.Surface:
+        tile_key = (rect, flags)
+        cached = tileset.tiles.get(tile_key)
+        if cached is not None:
+            return cached
+
         if rect:
             # scale the rect to match the scaled image
-            rect = scale_sequence(rect)
+            scaled_rect = scale_sequence(rect)
             try:
-                tile = image.subsurface(rect)
+                tile = tileset.image.subsurface(scaled_rect)
             except ValueError:
                 logger.error("Tile bounds outside bounds of tileset image")
                 raise
         else:
-            tile = image.copy()
+            tile = tileset.image.copy()
 
         if flags:
             tile = handle_transformation(tile, flags)
 
         tile = smart_convert(tile, colorkey_color, pixelalpha)
+        tileset.tiles[tile_key] = tile
         return tile
 
     return load_image
@@ -11,10 +11,11 @@ import pygame
 
 from tuxemon import graphics, plugin, prepare
 from tuxemon.constants import paths
-from tuxemon.db import ItemCategory, State, db
+from tuxemon.db import ItemCategory, ItemModel, State, db
 from tuxemon.item.itemcondition import ItemCondition
 from tuxemon.item.itemeffect import ItemEffect, ItemEffectResult
 from tuxemon.locale import T
+from tuxemon.slug_cache import SlugCache
 
 if TYPE_CHECKING:
     from tuxemon.monster import Monster
@@ -29,6 +30,42 @@ SIMPLE_PERSISTANCE_ATTRIBUTES = (
 )
 
 
+class ItemTemplate:
+    """
+    What the items of a slug share, built once from the database.
+
+    Parameters:
+        results: The database entry of the item.
+
+    """
+
+    __slots__ = (
+        "slug",
+        "name",
+        "description",
+        "use_item",
+        "use_success",
+        "use_failure",
+        "effects",
+        "conditions",
+    )
+
+    def __init__(self, results: ItemModel) -> None:
+        self.slug = results.slug
+        self.name = T.translate(self.slug)
+        self.description = T.translate(f"{self.slug}_description")
+        # item use notifications (translated!)
+        self.use_item = T.translate(results.use_item)
+        self.use_success = T.translate(results.use_success)
+        self.use_failure = T.translate(results.use_failure)
+        Item.load_plugins()
+        self.effects = tuple(Item.parse_effects(results.effects))
+        self.conditions = tuple(Item.parse_conditions(results.conditions))
+
+
+item_templates: SlugCache[ItemTemplate] = SlugCache("item", ItemTemplate)
+
+
 class Item:
     """An item object is an item that can be used either in or out of combat."""
 
@@ -62,7 +99,12 @@ class Item:
         self.usable_in: Sequence[State] = []
         self.cost: Optional[int] = None
 
-        # load effect and condition plugins if it hasn't been done already
+        self.load_plugins()
+        self.set_state(save_data)
+
+    @classmethod
+    def load_plugins(cls) -> None:
+        """Loads the effect and condition plugins, if not done already."""
         if not Item.effects_classes:
             Item.effects_classes = plugin.load_plugins(
                 paths.ITEM_EFFECT_PATH,
@@ -75,8 +117,6 @@ class Item:
                 interface=ItemCondition,
             )
 
-        self.set_state(save_data)
-
     def load(self, slug: str) -> None:
         """Loads and sets this item's attributes from the item.db database.
 
@@ -87,19 +127,20 @@ class Item:
 
         """
         try:
-            results = db.lookup(slug, table="item")
+            template = item_templates.get(slug)
         except KeyError:
             raise RuntimeError(f"Item {slug} not found")
+        results = db.lookup(slug, table="item")
 
-        self.slug = results.slug
-        self.name = T.translate(self.slug)
-        self.description = T.translate(f"{self.slug}_description")
+        self.slug = template.slug
+        self.name = template.name
+        self.description = template.description
         self.quantity = 1
 
         # item use notifications (translated!)
-        self.use_item = T.translate(results.use_item)
-        self.use_success = T.translate(results.use_success)
-        self.use_failure = T.translate(results.use_failure)
+        self.use_item = template.use_item
+        self.use_success = template.use_success
+        self.use_failure = template.use_failure
 
         # misc attributes (not translated!)
         self.world_menu = results.world_menu
@@ -109,8 +150,8 @@ class Item:
         self.category = results.category or ItemCategory.none
         self.sprite = results.sprite
         self.usable_in = results.usable_in
-        self.effects = self.parse_effects(results.effects)
-        self.conditions = self.parse_conditions(results.conditions)
+        self.effects = template.effects
+        self.conditions = template.conditions
         self.surface = graphics.load_and_scale(self.sprite)
         self.surface_size_original = self.surface.get_size()
 
@@ -118,8 +159,9 @@ class Item:
         self.animation = results.animation
         self.flip_axes = results.flip_axes
 
+    @classmethod
     def parse_effects(
-        self,
+        cls,
         raw: Sequence[str],
     ) -> Sequence[ItemEffect]:
         """
@@ -151,8 +193,9 @@ class Item:
 
         return effects
 
+    @classmethod
     def parse_conditions(
-        self,
+        cls,
         raw: Sequence[str],
     ) -> Sequence[ItemCondition]:
         """
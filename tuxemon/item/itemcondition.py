@@ -11,6 +11,7 @@ from tuxemon.tools import cast_dataclass_parameters
 
 if TYPE_CHECKING:
     from tuxemon.monster import Monster
+    from tuxemon.player import Player
 
 logger = logging.getLogger(__name__)
 
@@ -65,9 +66,13 @@ class ItemCondition:
     def __post_init__(self) -> None:
         self._op = self._op
         self.session = local_session
-        self.user = local_session.player
         cast_dataclass_parameters(self)
 
+    @property
+    def user(self) -> Player:
+        """The player, looked up when the condition is tested."""
+        return self.session.player
+
     def test(self, target: Monster) -> bool:
         """
         Return True if satisfied, or False if not.
@@ -12,6 +12,7 @@ from tuxemon.tools import cast_dataclass_parameters
 if TYPE_CHECKING:
     from tuxemon.item.item import Item
     from tuxemon.monster import Monster
+    from tuxemon.player import Player
 
 logger = logging.getLogger(__name__)
 
@@ -71,9 +72,13 @@ class ItemEffect:
 
     def __post_init__(self) -> None:
         self.session = local_session
-        self.user = local_session.player
         cast_dataclass_parameters(self)
 
+    @property
+    def user(self) -> Player:
+        """The player, looked up when the effect is applied."""
+        return self.session.player
+
     def apply(
         self, item: Item, target: Union[Monster, None]
     ) -> ItemEffectResult:
@@ -7,9 +7,11 @@ import gettext
 import logging
 import os
 import os.path
+import re
 from collections.abc import Callable, Generator, Iterable, Mapping, Sequence
+from functools import lru_cache
 from gettext import GNUTranslations
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from babel.messages.mofile import write_mo
 from babel.messages.pofile import read_po
@@ -19,6 +21,9 @@ from tuxemon.constants import paths
 from tuxemon.formula import convert_ft, convert_km, convert_lbs, convert_mi
 from tuxemon.session import Session
 
+if TYPE_CHECKING:
+    from tuxemon.monster import Monster
+
 logger = logging.getLogger(__name__)
 
 FALLBACK_LOCALE = "en_US"
@@ -303,10 +308,156 @@ class TranslatorPo:
             return self.translate(text)
 
 
+PLACEHOLDER_PATTERN = re.compile(r"\$\{\{(.*?)\}\}")
+MONSTER_PLACEHOLDER_PATTERN = re.compile(r"monster_(\d+)_(\w+)")
+
+
+def _is_metric(session: Session) -> bool:
+    unit_measure = session.player.game_variables.get(
+        "unit_measure", prepare.METRIC
+    )
+    return bool(unit_measure == prepare.METRIC)
+
+
+def _tuxepedia_count(session: Session, *statuses: db.SeenStatus) -> str:
+    return str(
+        sum(
+            1
+            for status in session.player.tuxepedia.values()
+            if status in statuses
+        )
+    )
+
+
+# placeholder => resolver, only called when the placeholder is in the text
+PLACEHOLDERS: dict[str, Callable[[Session], str]] = {
+    "name": lambda session: session.player.name,
+    "NAME": lambda session: session.player.name.upper(),
+    "currency": lambda session: "$",
+    "money": lambda session: str(session.player.money.get("player", 0)),
+    "tuxepedia_seen": lambda session: _tuxepedia_count(
+        session, db.SeenStatus.caught, db.SeenStatus.seen
+    ),
+    "tuxepedia_caught": lambda session: _tuxepedia_count(
+        session, db.SeenStatus.caught
+    ),
+    "map_name": lambda session: session.client.map_name,
+    "map_desc": lambda session: session.client.map_desc,
+    "north": lambda session: session.client.map_north,
+    "south": lambda session: session.client.map_south,
+    "east": lambda session: session.client.map_east,
+    "west": lambda session: session.client.map_west,
+    "length": lambda session: (
+        prepare.U_KM if _is_metric(session) else prepare.U_MI
+    ),
+    "weight": lambda session: (
+        prepare.U_KG if _is_metric(session) else prepare.U_LB
+    ),
+    "height": lambda session: (
+        prepare.U_CM if _is_metric(session) else prepare.U_FT
+    ),
+    "steps": lambda session: str(
+        convert_km(session.player.steps)
+        if _is_metric(session)
+        else convert_mi(session.player.steps)
+    ),
+}
+
+# monster_<index>_<field> => resolver, given the monster and the unit
+MONSTER_PLACEHOLDERS: dict[str, Callable[[Monster, bool], str]] = {
+    "name": lambda monster, metric: monster.name,
+    "desc": lambda monster, metric: monster.description,
+    "types": lambda monster, metric: " - ".join(
+        T.translate(_type.name) for _type in monster.types
+    ),
+    "category": lambda monster, metric: monster.category,
+    "shape": lambda monster, metric: T.translate(monster.shape),
+    "hp": lambda monster, metric: str(monster.current_hp),
+    "hp_max": lambda monster, metric: str(monster.hp),
+    "level": lambda monster, metric: str(monster.level),
+    "gender": lambda monster, metric: T.translate(f"gender_{monster.gender}"),
+    "bond": lambda monster, metric: str(monster.bond),
+    "txmn_id": lambda monster, metric: str(monster.txmn_id),
+    "warm": lambda monster, metric: T.translate(f"taste_{monster.taste_warm}"),
+    "cold": lambda monster, metric: T.translate(f"taste_{monster.taste_cold}"),
+    "moves": lambda monster, metric: " - ".join(
+        _move.name for _move in monster.moves
+    ),
+    "steps": lambda monster, metric: str(
+        convert_km(monster.steps) if metric else convert_mi(monster.steps)
+    ),
+    "weight": lambda monster, metric: str(
+        monster.weight if metric else convert_lbs(monster.weight)
+    ),
+    "height": lambda monster, metric: str(
+        monster.height if metric else convert_ft(monster.height)
+    ),
+    "armour": lambda monster, metric: str(monster.armour),
+    "dodge": lambda monster, metric: str(monster.dodge),
+    "melee": lambda monster, metric: str(monster.melee),
+    "ranged": lambda monster, metric: str(monster.ranged),
+    "speed": lambda monster, metric: str(monster.speed),
+}
+
+
+@lru_cache(maxsize=1024)
+def parse_template(text: str) -> tuple[str, ...]:
+    """
+    Splits a text on its ``${{var}}`` placeholders.
+
+    Parameters:
+        text: The text.
+
+    Returns:
+        The literal parts of the text at even indices, and the names of
+        the placeholders between them at odd indices.
+
+    """
+    return tuple(PLACEHOLDER_PATTERN.split(text))
+
+
+def resolve_placeholder(session: Session, name: str) -> Optional[str]:
+    """
+    Returns the in-session value of a placeholder.
+
+    Parameters:
+        session: Session containing the information to fill the variable.
+        name: Name of the placeholder, without ``${{`` and ``}}``.
+
+    Returns:
+        The value, or ``None`` if the placeholder is unknown.
+
+    """
+    resolver = PLACEHOLDERS.get(name)
+    if resolver is not None:
+        return resolver(session)
+
+    prefix, separator, key = name.partition(":")
+    if separator and prefix in ("var", "msgid"):
+        value = session.player.game_variables.get(key)
+        if value is None:
+            return None
+        return str(value) if prefix == "var" else T.translate(str(value))
+
+    match = MONSTER_PLACEHOLDER_PATTERN.fullmatch(name)
+    if match:
+        monsters = session.player.monsters
+        index = int(match.group(1))
+        monster_resolver = MONSTER_PLACEHOLDERS.get(match.group(2))
+        if monster_resolver is not None and index < len(monsters):
+            return monster_resolver(monsters[index], _is_metric(session))
+
+    return None
+
+
 def replace_text(session: Session, text: str) -> str:
     """
     Replaces ``${{var}}`` tiled variables with their in-session value.
 
+    The text is parsed once (and the result cached), and only the
+    placeholders present in the text are resolved. Unknown placeholders
+    are left as they are.
+
     Parameters:
         session: Session containing the information to fill the variables.
         text: Text whose references to variables should be substituted.
@@ -316,143 +467,17 @@ def replace_text(session: Session, text: str) -> str:
         'Red is running away!'
 
     """
-    player = session.player
-    client = session.client
-    unit_measure = player.game_variables.get("unit_measure", prepare.METRIC)
-
-    replacements = {
-        "${{name}}": player.name,
-        "${{NAME}}": player.name.upper(),
-        "${{currency}}": "$",
-        "${{money}}": str(player.money.get("player", 0)),
-        "${{tuxepedia_seen}}": str(
-            sum(
-                1
-                for status in player.tuxepedia.values()
-                if status in (db.SeenStatus.caught, db.SeenStatus.seen)
-            )
-        ),
-        "${{tuxepedia_caught}}": str(
-            sum(
-                1
-                for status in player.tuxepedia.values()
-                if status == db.SeenStatus.caught
-            )
-        ),
-        "${{map_name}}": client.map_name,
-        "${{map_desc}}": client.map_desc,
-        "${{north}}": client.map_north,
-        "${{south}}": client.map_south,
-        "${{east}}": client.map_east,
-        "${{west}}": client.map_west,
-    }
-
-    # Add unit-specific replacements
-    if unit_measure == prepare.METRIC:
-        replacements.update(
-            {
-                "${{length}}": prepare.U_KM,
-                "${{weight}}": prepare.U_KG,
-                "${{height}}": prepare.U_CM,
-                "${{steps}}": str(convert_km(player.steps)),
-            }
-        )
-    else:
-        replacements.update(
-            {
-                "${{length}}": prepare.U_MI,
-                "${{weight}}": prepare.U_LB,
-                "${{height}}": prepare.U_FT,
-                "${{steps}}": str(convert_mi(player.steps)),
-            }
-        )
-
-    # Add monster-specific replacements
-    for i, monster in enumerate(player.monsters):
-        monster_replacements = {
-            "${{monster_" + str(i) + "_name}}": monster.name,
-            "${{monster_" + str(i) + "_desc}}": monster.description,
-            "${{monster_"
-            + str(i)
-            + "_types}}": " - ".join(
-                T.translate(_type.name) for _type in monster.types
-            ),
-            "${{monster_" + str(i) + "_category}}": monster.category,
-            "${{monster_" + str(i) + "_shape}}": T.translate(monster.shape),
-            "${{monster_" + str(i) + "_hp}}": str(monster.current_hp),
-            "${{monster_" + str(i) + "_hp_max}}": str(monster.hp),
-            "${{monster_" + str(i) + "_level}}": str(monster.level),
-            "${{monster_"
-            + str(i)
-            + "_gender}}": T.translate(f"gender_{monster.gender}"),
-            "${{monster_" + str(i) + "_bond}}": str(monster.bond),
-            "${{monster_" + str(i) + "_txmn_id}}": str(monster.txmn_id),
-            "${{monster_"
-            + str(i)
-            + "_warm}}": T.translate(f"taste_{monster.taste_warm}"),
-            "${{monster_"
-            + str(i)
-            + "_cold}}": T.translate(f"taste_{monster.taste_cold}"),
-            "${{monster_"
-            + str(i)
-            + "_moves}}": " - ".join(_move.name for _move in monster.moves),
-        }
-
-        # Add unit-specific monster replacements
-        if unit_measure == prepare.METRIC:
-            monster_replacements.update(
-                {
-                    "${{monster_"
-                    + str(i)
-                    + "_steps}}": str(convert_km(monster.steps)),
-                    "${{monster_" + str(i) + "_weight}}": str(monster.weight),
-                    "${{monster_" + str(i) + "_height}}": str(monster.height),
-                }
-            )
-        else:
-            monster_replacements.update(
-                {
-                    "${{monster_"
-                    + str(i)
-                    + "_steps}}": str(convert_mi(monster.steps)),
-                    "${{monster_"
-                    + str(i)
-                    + "_weight}}": str(convert_lbs(monster.weight)),
-                    "${{monster_"
-                    + str(i)
-                    + "_height}}": str(convert_ft(monster.height)),
-                }
+    if "${{" in text:
+        parts = list(parse_template(text))
+        for index in range(1, len(parts), 2):
+            value = resolve_placeholder(session, parts[index])
+            parts[index] = (
+                "${{" + parts[index] + "}}" if value is None else value
             )
-
-        monster_replacements.update(
-            {
-                "${{monster_" + str(i) + "_armour}}": str(monster.armour),
-                "${{monster_" + str(i) + "_dodge}}": str(monster.dodge),
-                "${{monster_" + str(i) + "_melee}}": str(monster.melee),
-                "${{monster_" + str(i) + "_ranged}}": str(monster.ranged),
-                "${{monster_" + str(i) + "_speed}}": str(monster.speed),
-            }
-        )
-
-        replacements.update(monster_replacements)
-
-    # Add game variable replacements
-    for key, value in player.game_variables.items():
-        replacements.update(
-            {
-                "${{var:" + str(key) + "}}": str(value),
-                "${{msgid:" + str(key) + "}}": T.translate(str(value)),
-            }
-        )
-
-    # Replace placeholders in the text
-    for placeholder, replacement in replacements.items():
-        text = text.replace(placeholder, replacement)
+        text = "".join(parts)
 
     # Replace newline characters
-    text = text.replace(r"\n", "\n")
-
-    return text
+    return text.replace(r"\n", "\n")
 
 
 def process_translate_text(
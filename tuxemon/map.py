@@ -16,7 +16,7 @@ from tuxemon import prepare
 from tuxemon.compat.rect import ReadOnlyRect
 from tuxemon.db import Direction, Orientation
 from tuxemon.event import EventObject
-from tuxemon.graphics import scaled_image_loader
+from tuxemon.graphics import scaled_image_loader, tileset_cache
 from tuxemon.locale import T
 from tuxemon.math import Vector2, Vector3
 from tuxemon.tools import round_to_divisible
@@ -668,6 +668,7 @@ class TuxemonMap:
 
     def reload_tiles(self) -> None:
         """Reload the map tiles."""
+        tileset_cache.clear()
         data = pytmx.TiledMap(
             self.data.filename,
             image_loader=scaled_image_loader,
@@ -1,17 +1,25 @@
 # SPDX-License-Identifier: GPL-3.0
 # Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+import hashlib
 import logging
+import os
+import pickle
+import threading
 import uuid
-from collections.abc import Generator
+from collections import OrderedDict
+from collections.abc import Generator, Iterable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
 from math import cos, pi, sin
-from typing import Any, Optional
+from typing import Any, NamedTuple, Optional
 
 import pytmx
 import yaml
 from natsort import natsorted
+from pytmx.pytmx import TiledMap, default_image_loader
 
 from tuxemon import prepare
 from tuxemon.compat import Rect
+from tuxemon.constants import paths
 from tuxemon.db import Direction, Orientation, SurfaceKeys
 from tuxemon.event import EventObject, MapAction, MapCondition
 from tuxemon.graphics import scaled_image_loader
@@ -47,6 +55,25 @@ region_properties = [
     "key",
 ]
 
+MAP_ARTIFACT_VERSION = 1
+
+# actions moving the player to another map, with the index of the map name
+teleport_actions = {
+    "teleport": 0,
+    "transition_teleport": 0,
+    "delayed_teleport": 1,
+}
+
+
+class CompiledMap(NamedTuple):
+    """Collisions, surfaces and events extracted from a map."""
+
+    events: list[EventObject]
+    inits: list[EventObject]
+    surface_map: dict[tuple[int, int], dict[str, float]]
+    collision_map: dict[tuple[int, int], Optional[RegionProperties]]
+    collision_lines_map: set[tuple[tuple[int, int], Direction]]
+
 
 class YAMLEventLoader:
     """
@@ -141,7 +168,7 @@ class TMXMapLoader:
         # Makes mocking easier during tests
         self.image_loader = scaled_image_loader
 
-    def load(self, filename: str) -> TuxemonMap:
+    def load(self, filename: str, load_images: bool = True) -> TuxemonMap:
         """Load map data from a tmx map file.
 
         Loading the map data is done using the pytmx library.
@@ -166,24 +193,82 @@ class TMXMapLoader:
 
         Parameters:
             filename: The path to the tmx map file to load.
+            load_images: Whether to load the tile images. Without them, the
+                map can be parsed outside of the main thread; the images
+                are loaded later with ``reload_images``.
 
         Returns:
             The loaded map.
 
         """
-        data = pytmx.TiledMap(
+        data = self.load_data(filename, load_images)
+        return self.build(data, self.compile(data), filename)
+
+    def load_data(self, filename: str, load_images: bool = True) -> TiledMap:
+        """
+        Parses a tmx map file with pytmx.
+
+        Parameters:
+            filename: The path to the tmx map file to load.
+            load_images: Whether to load the tile images.
+
+        Returns:
+            The parsed map, with the tile size of the file.
+
+        """
+        return pytmx.TiledMap(
             filename=filename,
-            image_loader=self.image_loader,
+            image_loader=(
+                self.image_loader if load_images else default_image_loader
+            ),
             pixelalpha=True,
         )
-        tile_size = (data.tilewidth, data.tileheight)
+
+    @staticmethod
+    def build(
+        data: TiledMap, compiled: CompiledMap, filename: str
+    ) -> TuxemonMap:
+        """
+        Creates the map from the parsed file and its compiled data.
+
+        Parameters:
+            data: The parsed map.
+            compiled: The collisions, surfaces and events of the map.
+            filename: The path to the tmx map file.
+
+        Returns:
+            The loaded map.
+
+        """
         data.tilewidth, data.tileheight = prepare.TILE_SIZE
+        return TuxemonMap(
+            compiled.events,
+            compiled.inits,
+            compiled.surface_map,
+            compiled.collision_map,
+            compiled.collision_lines_map,
+            data,
+            data.properties,
+            filename,
+        )
+
+    def compile(self, data: TiledMap) -> CompiledMap:
+        """
+        Extracts the collisions, surfaces and events of a parsed map.
+
+        Parameters:
+            data: The parsed map, with the tile size of the file.
+
+        Returns:
+            The compiled data of the map.
+
+        """
+        tile_size = (data.tilewidth, data.tileheight)
         events = []
         inits = []
         surface_map: dict[tuple[int, int], dict[str, float]] = {}
         collision_map: dict[tuple[int, int], Optional[RegionProperties]] = {}
         collision_lines_map = set()
-        maps = data.properties
 
         # get all tiles which have properties and/or collisions
         gids_with_props = {}
@@ -249,15 +334,12 @@ class TMXMapLoader:
             elif obj_type == "init":
                 inits.append(self.load_event(obj, tile_size))
 
-        return TuxemonMap(
+        return CompiledMap(
             events,
             inits,
             surface_map,
             collision_map,
             collision_lines_map,
-            data,
-            maps,
-            filename,
         )
 
     def extract_tile_collisions(
@@ -398,3 +480,485 @@ class TMXMapLoader:
                 )
 
         return EventObject(event_id, obj.name, x, y, w, h, conditions, actions)
+
+
+def load_map(
+    path: str,
+    load_images: bool = True,
+    artifact_dir: Optional[str] = None,
+) -> TuxemonMap:
+    """
+    Load a map with the events of its YAML files.
+
+    The events of the map are extended with the ones of the YAML file with
+    the same name and of the YAML file of its scenario, if any.
+
+    When an artifact folder is given, the compiled data of the map is read
+    from its artifact if the source files didn't change, and the artifact
+    is (re)built otherwise. The tmx file is still parsed by pytmx, since
+    the tile layers are needed for rendering.
+
+    Parameters:
+        path: Path of the tmx map file.
+        load_images: Whether to load the tile images.
+        artifact_dir: Folder of the compiled map artifacts, ``None``
+            compiles the map every time.
+
+    Returns:
+        Loaded map.
+
+    """
+    loader = TMXMapLoader()
+    data = loader.load_data(path, load_images)
+    scenario = data.properties.get("scenario")
+    yaml_files = map_yaml_files(
+        path, None if scenario is None else str(scenario)
+    )
+
+    if artifact_dir is None:
+        compiled = compile_map(loader, data, yaml_files)
+    else:
+        artifact_path = get_artifact_path(artifact_dir, path)
+        key = artifact_key(path, yaml_files)
+        artifact = read_artifact(artifact_path, key)
+        if artifact is None:
+            compiled = compile_map(loader, data, yaml_files)
+            write_artifact(artifact_path, key, compiled)
+        else:
+            compiled = artifact
+
+    return loader.build(data, compiled, path)
+
+
+def compile_map(
+    loader: TMXMapLoader, data: TiledMap, yaml_files: Sequence[str]
+) -> CompiledMap:
+    """
+    Compiles a parsed map and merges the events of its YAML files.
+
+    Parameters:
+        loader: Loader used to compile the map.
+        data: The parsed map, with the tile size of the file.
+        yaml_files: Paths of the YAML files of the map.
+
+    Returns:
+        The compiled data of the map.
+
+    """
+    compiled = loader.compile(data)
+    events = {"event": compiled.events, "init": compiled.inits}
+
+    yaml_loader = YAMLEventLoader()
+
+    for yaml_file in yaml_files:
+        if os.path.exists(yaml_file):
+            yaml_data = yaml_loader.load_events(yaml_file, "event")
+            events["event"].extend(yaml_data["event"])
+            yaml_data = yaml_loader.load_events(yaml_file, "init")
+            events["init"].extend(yaml_data["init"])
+        else:
+            logger.warning(f"YAML file {yaml_file} not found")
+
+    return compiled
+
+
+def get_artifact_path(artifact_dir: str, path: str) -> str:
+    """
+    Returns the path of the compiled artifact of a map.
+
+    Parameters:
+        artifact_dir: Folder of the compiled map artifacts.
+        path: Path of the tmx map file.
+
+    Returns:
+        Path of the artifact, named after the map and its full path.
+
+    """
+    name = os.path.splitext(os.path.basename(path))[0]
+    digest = hashlib.sha1(os.path.abspath(path).encode()).hexdigest()
+    return os.path.join(artifact_dir, f"{name}_{digest[:12]}.map")
+
+
+def artifact_key(path: str, yaml_files: Sequence[str]) -> str:
+    """
+    Computes the key identifying the sources of a map.
+
+    Parameters:
+        path: Path of the tmx map file.
+        yaml_files: Paths of the YAML files of the map.
+
+    Returns:
+        Hex digest of the artifact version and of the content of every
+        source file.
+
+    """
+    digest = hashlib.sha1(f"{MAP_ARTIFACT_VERSION}".encode())
+    for source in (path, *yaml_files):
+        digest.update(f"{os.path.basename(source)}:".encode())
+        try:
+            with open(source, "rb") as fp:
+                digest.update(hashlib.sha1(fp.read()).digest())
+        except FileNotFoundError:
+            digest.update(b"missing")
+    return digest.hexdigest()
+
+
+def read_artifact(artifact_path: str, key: str) -> Optional[CompiledMap]:
+    """
+    Reads the compiled data of a map from its artifact.
+
+    Parameters:
+        artifact_path: Path of the artifact.
+        key: Key returned by :func:`artifact_key`.
+
+    Returns:
+        The compiled data, or ``None`` if the artifact is missing, invalid
+        or stale.
+
+    """
+    try:
+        with open(artifact_path, "rb") as fp:
+            payload = pickle.load(fp)
+    except FileNotFoundError:
+        return None
+    except (
+        OSError,
+        pickle.UnpicklingError,
+        EOFError,
+        AttributeError,
+        ImportError,
+    ) as e:
+        logger.warning(f"Invalid map artifact {artifact_path}: {e}")
+        return None
+
+    if payload.get("version") != MAP_ARTIFACT_VERSION:
+        logger.debug("map artifact has an old version: %s", artifact_path)
+        return None
+    if payload.get("key") != key:
+        logger.debug("map artifact is stale: %s", artifact_path)
+        return None
+    return CompiledMap(*payload["map"])
+
+
+def write_artifact(
+    artifact_path: str, key: str, compiled: CompiledMap
+) -> None:
+    """
+    Writes the compiled data of a map to its artifact.
+
+    Parameters:
+        artifact_path: Path of the artifact.
+        key: Key returned by :func:`artifact_key`.
+        compiled: The compiled data of the map.
+
+    """
+    payload = {
+        "version": MAP_ARTIFACT_VERSION,
+        "key": key,
+        "map": tuple(compiled),
+    }
+    tmp_path = f"{artifact_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(artifact_path), exist_ok=True)
+        with open(tmp_path, "wb") as fp:
+            pickle.dump(payload, fp, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, artifact_path)
+    except OSError as e:
+        logger.error(f"Unable to write map artifact {artifact_path}: {e}")
+
+
+def build_artifact(path: str, artifact_dir: str) -> bool:
+    """
+    Builds the artifact of a map, if it's missing or stale.
+
+    This is the unit of work of the batch build, so it can run in a
+    worker process.
+
+    Parameters:
+        path: Path of the tmx map file.
+        artifact_dir: Folder of the compiled map artifacts.
+
+    Returns:
+        Whether the artifact was (re)built.
+
+    """
+    loader = TMXMapLoader()
+    data = loader.load_data(path, load_images=False)
+    scenario = data.properties.get("scenario")
+    yaml_files = map_yaml_files(
+        path, None if scenario is None else str(scenario)
+    )
+    artifact_path = get_artifact_path(artifact_dir, path)
+    key = artifact_key(path, yaml_files)
+    if read_artifact(artifact_path, key) is not None:
+        return False
+    write_artifact(artifact_path, key, compile_map(loader, data, yaml_files))
+    return True
+
+
+def map_yaml_files(path: str, scenario: Optional[str]) -> list[str]:
+    """
+    Returns the YAML files containing the events of a map.
+
+    Parameters:
+        path: Path of the tmx map file.
+        scenario: Scenario of the map, if any.
+
+    Returns:
+        Paths of the YAML files, existing or not.
+
+    """
+    yaml_files = [path.replace(".tmx", ".yaml")]
+    if scenario:
+        yaml_files.append(prepare.fetch("maps", f"{scenario}.yaml"))
+    return yaml_files
+
+
+def teleport_destinations(txmn_map: TuxemonMap) -> list[str]:
+    """
+    Returns the maps reachable through the teleport events of a map.
+
+    Parameters:
+        txmn_map: The map.
+
+    Returns:
+        Paths of the destination maps, without the map itself.
+
+    """
+    destinations: list[str] = []
+    for event in txmn_map.events:
+        for action in event.acts:
+            index = teleport_actions.get(action.type)
+            if index is None or len(action.parameters) <= index:
+                continue
+            try:
+                path = prepare.fetch("maps", action.parameters[index])
+            except OSError:
+                continue
+            if path != txmn_map.filename and path not in destinations:
+                destinations.append(path)
+    return destinations
+
+
+class CachedMap:
+    """
+    A parsed map and the modification times of its source files.
+
+    Parameters:
+        txmn_map: The parsed map.
+        sources: Modification time of every source file (``None`` if the
+            file doesn't exist), taken before parsing.
+        images_loaded: Whether the tile images of the map are loaded.
+
+    """
+
+    def __init__(
+        self,
+        txmn_map: TuxemonMap,
+        sources: dict[str, Optional[int]],
+        images_loaded: bool,
+    ) -> None:
+        self.map = txmn_map
+        self.sources = sources
+        self.images_loaded = images_loaded
+
+    def is_stale(self) -> bool:
+        """Whether a source file changed since the map was parsed."""
+        return any(
+            get_mtime(path) != mtime for path, mtime in self.sources.items()
+        )
+
+    def load_images(self) -> None:
+        """Loads the tile images, must be called from the main thread."""
+        self.map.data.image_loader = scaled_image_loader
+        self.map.data.reload_images()
+        self.images_loaded = True
+
+    def build(self) -> TuxemonMap:
+        """
+        Returns a new map sharing the parsed data of the cached one.
+
+        The collision and surface maps are copied since they can be changed
+        by the events while the map is loaded.
+
+        """
+        txmn_map = self.map
+        return TuxemonMap(
+            list(txmn_map.events),
+            list(txmn_map.inits),
+            dict(txmn_map.surface_map),
+            dict(txmn_map.collision_map),
+            set(txmn_map.collision_lines_map),
+            txmn_map.data,
+            txmn_map.maps,
+            txmn_map.filename,
+        )
+
+
+def get_mtime(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class MapCache:
+    """
+    Keeps the recently parsed maps, so that going back and forth between
+    maps doesn't parse the same files again.
+
+    Entries are checked against the modification times of their source
+    files (tmx, yaml and scenario yaml). Maps can also be parsed ahead of
+    time in a background thread with :meth:`prefetch`; their tile images
+    are loaded on the main thread when the map is actually needed.
+
+    Parameters:
+        max_size: Maximum number of maps kept.
+
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._maps: OrderedDict[str, CachedMap] = OrderedDict()
+        self._pending: dict[str, Future[None]] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    def load(self, path: str) -> TuxemonMap:
+        """
+        Returns the map, parsing it only if it isn't cached or is stale.
+
+        Parameters:
+            path: Path of the tmx map file.
+
+        Returns:
+            Loaded map.
+
+        """
+        with self._lock:
+            future = self._pending.get(path)
+        if future is not None:
+            # it's already being parsed, waiting is faster than starting over
+            future.result()
+
+        cached = self.get(path)
+        if cached is None:
+            self.misses += 1
+            cached = self.parse(path, load_images=True)
+            self.put(path, cached)
+        else:
+            self.hits += 1
+        if not cached.images_loaded:
+            cached.load_images()
+        return cached.build()
+
+    def get(self, path: str) -> Optional[CachedMap]:
+        """
+        Returns the cached map, if any and still up to date.
+
+        Parameters:
+            path: Path of the tmx map file.
+
+        Returns:
+            The cached map or ``None``.
+
+        """
+        with self._lock:
+            cached = self._maps.get(path)
+            if cached is not None:
+                self._maps.move_to_end(path)
+        if cached is None or cached.is_stale():
+            return None
+        return cached
+
+    def put(self, path: str, cached: CachedMap) -> None:
+        """
+        Adds a map, evicting the least recently used ones if needed.
+
+        Parameters:
+            path: Path of the tmx map file.
+            cached: The parsed map.
+
+        """
+        with self._lock:
+            self._maps[path] = cached
+            self._maps.move_to_end(path)
+            while len(self._maps) > self.max_size:
+                self._maps.popitem(last=False)
+
+    @staticmethod
+    def parse(path: str, load_images: bool) -> CachedMap:
+        """
+        Parses a map and records the state of its source files.
+
+        Parameters:
+            path: Path of the tmx map file.
+            load_images: Whether to load the tile images.
+
+        Returns:
+            The parsed map.
+
+        """
+        sources = {path: get_mtime(path)}
+        artifact_dir = (
+            paths.MAP_ARTIFACT_DIR if prepare.CONFIG.map_artifacts else None
+        )
+        txmn_map = load_map(path, load_images, artifact_dir)
+        for yaml_file in map_yaml_files(path, txmn_map.scenario):
+            sources.setdefault(yaml_file, get_mtime(yaml_file))
+        return CachedMap(txmn_map, sources, load_images)
+
+    def prefetch(self, paths: Iterable[str]) -> None:
+        """
+        Parses maps in a background thread, without their tile images.
+
+        Parameters:
+            paths: Paths of the tmx map files.
+
+        """
+        for path in paths:
+            with self._lock:
+                if path in self._pending or path in self._maps:
+                    continue
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="map_prefetch"
+                    )
+                logger.debug(f"Prefetching map '{path}'")
+                self._pending[path] = self._executor.submit(
+                    self._prefetch, path
+                )
+
+    def _prefetch(self, path: str) -> None:
+        try:
+            self.put(path, self.parse(path, load_images=False))
+        except Exception:
+            logger.exception(f"Unable to prefetch map '{path}'")
+        finally:
+            with self._lock:
+                self._pending.pop(path, None)
+
+    def clear(self) -> None:
+        """Removes all the maps from the cache."""
+        with self._lock:
+            self._maps.clear()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Returns the counters of the cache.
+
+        Returns:
+            Number of maps, maps being prefetched, hits and misses.
+
+        """
+        return {
+            "maps": len(self._maps),
+            "pending": len(self._pending),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+map_cache = MapCache(prepare.MAP_CACHE_SIZE)
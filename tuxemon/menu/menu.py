@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import logging
 import math
+from collections import OrderedDict
 from collections.abc import Callable, Iterable, Sequence
 from functools import partial
 from typing import Any, Generic, Literal, Optional, TypeVar, Union
@@ -28,7 +29,7 @@ from tuxemon.sprite import (
     SpriteGroup,
     VisualSpriteList,
 )
-from tuxemon.ui.draw import GraphicBox
+from tuxemon.ui.draw import GraphicBox, shadow_text
 from tuxemon.ui.text import TextArea
 
 logger = logging.getLogger(__name__)
@@ -46,6 +47,150 @@ def layout_func(scale: float) -> Callable[[Sequence[float]], Sequence[float]]:
 layout = layout_func(prepare.SCALE)
 
 T = TypeVar("T", covariant=True)
+_I = TypeVar("_I")
+
+
+def get_page(items: Sequence[_I], page: int, page_size: int) -> Sequence[_I]:
+    """
+    Returns the items of a page, the pages wrapping around.
+
+    Parameters:
+        items: All the items.
+        page: The page.
+        page_size: Number of items per page.
+
+    Returns:
+        The items of the page.
+
+    """
+    page_count = max(1, math.ceil(len(items) / page_size))
+    start = page % page_count * page_size
+    return items[start : start + page_size]
+
+
+def get_neighbour_pages(page: int, page_count: int) -> list[int]:
+    """
+    Returns the pages next to a page, the pages wrapping around.
+
+    Parameters:
+        page: The page.
+        page_count: The number of pages.
+
+    Returns:
+        The next and the previous page, without duplicates nor the page
+        itself (e.g. a single page has no neighbours, two pages have one).
+
+    """
+    page_count = max(1, page_count)
+    page %= page_count
+    neighbours = []
+    for offset in (1, -1):
+        neighbour = (page + offset) % page_count
+        if neighbour != page and neighbour not in neighbours:
+            neighbours.append(neighbour)
+    return neighbours
+
+
+class MenuImageCache:
+    """
+    Keeps the most recently used menu images, already scaled.
+
+    Menus listing many entries (e.g. the PC boxes) show a thumbnail for
+    each of them. Loading and scaling the sprite again every time the menu
+    is opened or a page is turned is what makes them slow, so the scaled
+    images are kept and every caller gets its own cheap copy.
+
+    Parameters:
+        max_size: Maximum number of images kept.
+
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._images: OrderedDict[
+            tuple[str, float, float], baseimage.BaseImage
+        ] = OrderedDict()
+
+    def _load(
+        self, path: str, width: float, height: float
+    ) -> baseimage.BaseImage:
+        key = (path, width, height)
+        image = self._images.get(key)
+        if image is None:
+            self.misses += 1
+            image = pygame_menu.BaseImage(
+                image_path=tools.transform_resource_filename(path)
+            )
+            image.scale(width, height)
+            self._images[key] = image
+            while len(self._images) > self.max_size:
+                self._images.popitem(last=False)
+        else:
+            self.hits += 1
+            self._images.move_to_end(key)
+        return image
+
+    def get(
+        self,
+        path: str,
+        width: float = 1.0,
+        height: float = 1.0,
+        position: str = locals.POSITION_CENTER,
+    ) -> baseimage.BaseImage:
+        """
+        Returns a scaled image, loading it only if it isn't cached.
+
+        Parameters:
+            path: The path to the image file.
+            width: Horizontal scale factor.
+            height: Vertical scale factor.
+            position: The drawing position of the image.
+
+        Returns:
+            A copy of the scaled image, free to be modified.
+
+        """
+        image = self._load(path, width, height).copy()
+        image.set_drawing_position(position)
+        return image
+
+    def prefetch(
+        self, path: str, width: float = 1.0, height: float = 1.0
+    ) -> None:
+        """
+        Loads an image in the cache, so it's ready when it's needed.
+
+        Parameters:
+            path: The path to the image file.
+            width: Horizontal scale factor.
+            height: Vertical scale factor.
+
+        """
+        if (path, width, height) not in self._images:
+            self._load(path, width, height)
+
+    def clear(self) -> None:
+        """Removes all the images from the cache."""
+        self._images.clear()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Returns the counters of the cache.
+
+        Returns:
+            Number of images, hits and misses.
+
+        """
+        return {
+            "images": len(self._images),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+menu_image_cache = MenuImageCache(prepare.MENU_IMAGE_CACHE_SIZE)
 
 
 class PygameMenuState(state.State):
@@ -171,6 +316,21 @@ class PygameMenuState(state.State):
             drawing_position=position,
         )
 
+    def _create_thumbnail(
+        self, path: str, scale: float
+    ) -> baseimage.BaseImage:
+        """
+        Creates a scaled Pygame menu image, through the menu image cache.
+
+        Parameters:
+            path: The path to the image file.
+            scale: The scale factor of the image.
+
+        Returns:
+            pygame_menu.BaseImage: The scaled image.
+        """
+        return menu_image_cache.get(path, scale, scale)
+
     def update_selected_widget(self) -> None:
         """
         Updates the currently selected widget based on the menu's selection.
@@ -274,6 +434,104 @@ class PygameMenuState(state.State):
         return None
 
 
+class PygamePagedMenuState(PygameMenuState):
+    """
+    A Pygame menu state showing a long list one page at a time.
+
+    Only the widgets of the current page are built. Moving the cursor left
+    of the first column or right of the last one turns the page, and the
+    thumbnails of the neighbouring pages are loaded in the background, one
+    per frame, so turning the page doesn't have to wait for the disk.
+
+    Parameters:
+        page: The page to show.
+        page_count: The number of pages.
+        kwargs: Arguments of :class:`PygameMenuState`.
+
+    """
+
+    def __init__(self, page: int, page_count: int, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.columns: int = kwargs.get("columns", 1)
+        self.page_count = max(1, page_count)
+        self.page = page % self.page_count
+        self._prefetch: list[tuple[str, float]] = []
+
+    @property
+    def neighbour_pages(self) -> list[int]:
+        """The pages likeliest to be shown next, without duplicates."""
+        return get_neighbour_pages(self.page, self.page_count)
+
+    def get_last_column(self) -> int:
+        """
+        Returns the index of the rightmost column holding a widget.
+
+        A page with fewer widgets than columns doesn't fill the last
+        columns, so the layout of the widgets is used rather than the
+        number of columns of the menu.
+
+        Returns:
+            The index of the column.
+
+        """
+        columns = [
+            widget.get_col_row_index()[0]
+            for widget in self.menu.get_widgets()
+            if widget.is_selectable
+        ]
+        return max(columns, default=self.columns - 1)
+
+    def prefetch_thumbnails(
+        self, thumbnails: Iterable[str], scale: float
+    ) -> None:
+        """
+        Schedules the loading of thumbnails shown in other pages.
+
+        Parameters:
+            thumbnails: The paths of the images.
+            scale: The scale factor of the images.
+
+        """
+        self._prefetch.extend((path, scale) for path in thumbnails)
+
+    def change_page(self, page: int) -> None:
+        """
+        Shows another page, to be overridden by class descendants.
+
+        Parameters:
+            page: The page to show.
+
+        """
+        raise NotImplementedError
+
+    def update(self, time_delta: float) -> None:
+        super().update(time_delta)
+        if self._prefetch:
+            path, scale = self._prefetch.pop(0)
+            menu_image_cache.prefetch(path, scale, scale)
+
+    def process_event(self, event: PlayerInput) -> Optional[PlayerInput]:
+        if (
+            self.open
+            and event.pressed
+            and self.page_count > 1
+            and event.button in (buttons.LEFT, buttons.RIGHT)
+        ):
+            widget = self.menu.get_selected_widget()
+            if widget is not None:
+                column = widget.get_col_row_index()[0]
+                if event.button == buttons.LEFT and column == 0:
+                    self.change_page((self.page - 1) % self.page_count)
+                    return None
+                if (
+                    event.button == buttons.RIGHT
+                    and column == self.get_last_column()
+                ):
+                    self.change_page((self.page + 1) % self.page_count)
+                    return None
+        return super().process_event(event)
+
+
 class Menu(Generic[T], state.State):
     """
     A class to create menu objects.
@@ -599,19 +857,7 @@ class Menu(Generic[T], state.State):
         if not fg:
             fg = self.font_color
 
-        font_color = self.font.render(text, True, fg)
-        shadow_color = self.font.render(text, True, bg)
-
-        offset = layout((0.5, 0.5))
-        size = [
-            int(math.ceil(a + b))
-            for a, b in zip(offset, font_color.get_size())
-        ]
-        image = pygame.Surface(size, pygame.SRCALPHA)
-
-        image.blit(shadow_color, tuple(offset))
-        image.blit(font_color, (0, 0))
-        return image
+        return shadow_text(self.font, fg, bg, text)
 
     def load_graphics(self) -> None:
         """
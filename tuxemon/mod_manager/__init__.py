@@ -8,11 +8,17 @@ import pathlib
 import shutil
 import urllib.request
 import zipfile
+from collections.abc import Sequence
 from typing import Any, Optional
 
-import requests
-
+from tuxemon import prepare
 from tuxemon.constants import paths
+from tuxemon.mod_manager.downloader import (
+    TIMEOUT,
+    Downloader,
+    Release,
+    make_session,
+)
 from tuxemon.mod_manager.symlink_missing import symlink_missing
 
 logger = logging.getLogger(__name__)
@@ -41,6 +47,10 @@ class Manager:
 
         self.url = other_urls
         self.packages: list[Any] = []
+        self.session = make_session()
+        self.downloader = Downloader(
+            os.path.join(paths.CACHE_DIR, "downloaded_packages"), self.session
+        )
 
         if default_to_cache:
             self.packages = self.read_from_cache()
@@ -65,7 +75,7 @@ class Manager:
 
     def update(self, url: str) -> Any:
         """Returns the response from the server"""
-        packages = requests.get(url + "/api/packages")
+        packages = self.session.get(url + "/api/packages", timeout=TIMEOUT)
         return packages.json()
 
     def update_all(self) -> None:
@@ -82,6 +92,44 @@ class Manager:
 
         self.write_to_cache()
 
+    def get_release(
+        self, author: str, name: str, repo: str, release: Optional[float]
+    ) -> Release:
+        """
+        Gets a release of a package from the server.
+
+        Parameters:
+            author: Author of the package.
+            name: Name of the package.
+            repo: URL of the server.
+            release: The release, the latest one if None.
+
+        Returns:
+            The release, with its checksum if the server lists one.
+
+        """
+        r = self.session.get(
+            repo + f"/api/packages/{author}/{name}/releases", timeout=TIMEOUT
+        )
+        r.raise_for_status()
+        releases = r.json()
+        if release is None:
+            logging.info("Getting latest release...")
+            # Get latest release (largest number).
+            info = max(releases, key=lambda i: i["id"], default={"id": 0})
+        else:
+            info = next(
+                (i for i in releases if float(i["id"]) == float(release)),
+                {"id": release},
+            )
+
+        # Sanitize author, name and release
+        author = sanitize_paths(author)
+        name = sanitize_paths(name)
+        number = float(sanitize_paths(str(info["id"])))
+        url = repo + f"/packages/{author}/{name}/releases/{number}/download"
+        return Release(author, name, number, url, info.get("sha256"))
+
     def download_package(
         self,
         author: str,
@@ -92,122 +140,138 @@ class Manager:
         install_deps: bool = True,
         installed: Any = None,
     ) -> None:
-        """Downloads the specified package"""
-        if repo is None:
-            repo = self.get_package_repo(name)
-
-            # Remove trailing slash
-            if repo[-1] == "/":
-                repo = repo[:-1]
+        """
+        Downloads the specified package.
 
-        if release is None:
-            logging.info("Getting latest release...")
-            r = requests.get(repo + f"/api/packages/{author}/{name}/releases")
-            logger.debug(r.text, author, name)
-            logger.debug(repo + f"/api/packages/{author}/{name}/releases")
-            # Get latest release (largest number).
-            latest = 0
-            for i in r.json():
-                if i["id"] > latest:
-                    latest = i["id"]
-            release = latest
+        The package and its dependencies are downloaded in parallel.
 
-        # Sanitize author, name and release
-        author = sanitize_paths(author)
-        name = sanitize_paths(name)
-        release = float(sanitize_paths(str(release)))
-        logger.debug(
-            " ".join(
-                [
-                    author,
-                    name,
-                    str(release),
-                    repo,
-                    str(dont_extract),
-                    str(install_deps),
-                    str(installed),
-                ]
-            )
-        )
-        url = (
-            str(repo)
-            + f"/packages/{author}/{name}/releases/{release}/download"
-        )
+        Parameters:
+            author: Author of the package.
+            name: Name of the package.
+            release: The release, the latest one if None.
+            repo: URL of the server, found in the package list if None.
+            dont_extract: Whether to only download the packages.
+            install_deps: Whether to download the dependencies too.
+            installed: Packages ("author/name") not to download.
 
-        filename = os.path.join(
-            paths.CACHE_DIR, f"downloaded_packages/{name}.{release}.zip"
-        )
+        """
+        if repo is None:
+            repo = self.get_package_repo(name)
+        repo = str(repo).rstrip("/")
 
-        logging.info(f"Downloading release {release} of {author}/{name}")
+        packages = [(author, name, release)]
+        if install_deps:
+            packages += [
+                (dep_author, dep_name, None)
+                for dep_author, dep_name in self.resolve_dependencies(
+                    author, name, repo, done=installed
+                )
+            ]
+        self.install_packages(packages, repo, dont_extract)
+        logging.info("Done!")
 
-        # Based on answer from https://stackoverflow.com/a/16696317/14590202
-        with requests.get(url, stream=True) as r:
-            file_size = r.headers["content-length"]
-            downloaded_size = 0
-            r.raise_for_status()
-            with open(filename, "wb") as file:
-                for chunk in r.iter_content(chunk_size=8096):
-                    file.write(chunk)
-                    downloaded_size += 8096
-                    logger.debug(f"Downloaded {downloaded_size} bytes")
+    def resolve_dependencies(
+        self, author: str, name: str, repo: Any, done: Any = None
+    ) -> list[tuple[str, str]]:
+        """
+        Gets the hard dependencies of a package.
 
-        outfolder = os.path.join(paths.BASEDIR, "mods", name)
+        The server resolves the whole dependency graph at once. Packages
+        already in the mods folder are left out.
 
-        self.write_package_to_list(os.path.relpath(outfolder), name)
+        Parameters:
+            author: Author of the package.
+            name: Name of the package.
+            repo: URL of the server.
+            done: Packages ("author/name") to leave out.
 
-        if not dont_extract:
-            logging.info("Extracting...")
-            self.install_local_package(filename, name=name)
+        Returns:
+            The author and name of each dependency.
 
-        if install_deps:
-            # This function calls download_package, might cause issues
-            self.install_dependencies(
-                author=author,
-                name=name,
-                repo=repo,
-                dont_extract=dont_extract,
-                done=installed,
-            )
-        logging.info("Done!")
-
-    def install_dependencies(
-        self,
-        author: str,
-        name: str,
-        repo: Any,
-        symlink: bool = True,
-        **args: Any,
-    ) -> None:
-        """Recursively resolve dependencies and symlink them"""
-        logger.debug(author, name, repo)
+        """
         # Request dependencies for specified package
-        r = requests.get(
-            f"{repo}/api/packages/{author}/{name}/dependencies/?only_hard=1"
+        r = self.session.get(
+            f"{repo}/api/packages/{author}/{name}/dependencies/?only_hard=1",
+            timeout=TIMEOUT,
         )
         if r.status_code != 200:
             raise ValueError(
                 f"Requested {r.url}, received status code {r.status_code}"
             )
-        logger.debug(r.text, author, name)
+        logger.debug(f"Dependencies of {author}/{name}: {r.text}")
+        skipped = {f"{author}/{name}", *(done or ())}
+        dependencies: list[tuple[str, str]] = []
         dep_list = r.json()
-        # Resolve dependencies
         for dependency in dep_list:
             for entry in dep_list[dependency]:
                 for package in entry["packages"]:
-                    package = sanitize_paths(package)
+                    if package == "default" or package in skipped:
+                        continue
+                    skipped.add(package)
+                    dep_author, _, dep_name = package.partition("/")
                     if os.path.exists(
-                        os.path.join(paths.BASEDIR, "mods", package)
+                        os.path.join(
+                            paths.BASEDIR, "mods", sanitize_paths(dep_name)
+                        )
                     ):
                         continue
-                    if package == "default":
-                        continue
-                    self.download_package(
-                        package.split("/")[0],
-                        package.split("/")[1],
-                        release=None,
-                        repo=repo,
-                        install_deps=False,
-                    )
+                    dependencies.append((dep_author, dep_name))
+        return dependencies
+
+    def install_dependencies(
+        self,
+        author: str,
+        name: str,
+        repo: Any,
+        symlink: bool = True,
+        dont_extract: bool = False,
+        done: Any = None,
+        **args: Any,
+    ) -> None:
+        """Resolve dependencies and download them"""
+        dependencies = self.resolve_dependencies(author, name, repo, done)
+        self.install_packages(
+            [
+                (dep_author, dep_name, None)
+                for dep_author, dep_name in dependencies
+            ],
+            repo,
+            dont_extract,
+        )
+
+    def install_packages(
+        self,
+        packages: Sequence[tuple[str, str, Optional[float]]],
+        repo: str,
+        dont_extract: bool = False,
+    ) -> None:
+        """
+        Downloads packages in parallel, then installs them.
+
+        Parameters:
+            packages: Author, name and release (latest if None) of each
+                package.
+            repo: URL of the server.
+            dont_extract: Whether to only download the packages.
+
+        """
+
+        def fetch(package: tuple[str, str, Optional[float]]) -> str:
+            release = self.get_release(*package[:2], repo, package[2])
+            logging.info(
+                f"Downloading release {release.release} of "
+                f"{release.author}/{release.name}"
+            )
+            return self.downloader.fetch(release)
+
+        filenames = self.downloader.map(fetch, packages)
+        for (_, name, _), filename in zip(packages, filenames):
+            name = sanitize_paths(name)
+            outfolder = os.path.join(paths.BASEDIR, "mods", name)
+            self.write_package_to_list(os.path.relpath(outfolder), name)
+            if not dont_extract:
+                logging.info("Extracting...")
+                self.install_local_package(filename, name=name)
 
     def parse_mod_conf(self, content: Any) -> Any:
         """
@@ -230,7 +294,9 @@ class Manager:
         """Get specified package info. Always downloads the info from the server."""
         for char in '/\\?%*:|"<>.,;= ':
             name = name.replace(char, "_")
-        r = requests.get(repo + "/api/packages/{author}/{name}/")
+        r = self.session.get(
+            repo + "/api/packages/{author}/{name}/", timeout=TIMEOUT
+        )
 
     def get_package_repo(self, name: str) -> Any:
         """Reads the origin of an package.
@@ -283,6 +349,7 @@ class Manager:
             raise ValueError("Detected incorrect characters in path")
         shutil.rmtree(path, ignore_errors=True)
         self.remove_package_from_list(name)
+        prepare.ASSETS.invalidate()
 
     def install_local_package(
         self,
@@ -306,3 +373,4 @@ class Manager:
                     f"Zip contents are bigger than available disk space ({zipsize} > {free})"
                 )
             zipf.extractall(path=os.path.join(outfolder, name))
+        prepare.ASSETS.invalidate()
@@ -0,0 +1,279 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+"""
+Downloads of the package releases.
+
+All the requests go through one :class:`requests.Session`, so the
+connections to a server are pooled and reused. The releases are kept in a
+cache folder: a release already there (and matching its checksum) isn't
+downloaded again. When the server gives no checksum, the one computed at
+the end of the download is kept next to the release instead. A release is
+written to a ``.part`` file first, so an interrupted download is resumed
+with an HTTP range request the next time.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+from collections.abc import Callable, Iterable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Optional, TypeVar
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+POOL_SIZE = 8
+WORKERS = 4
+RETRIES = 3
+TIMEOUT = 30
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class ChecksumError(ValueError):
+    """A downloaded release doesn't match its checksum."""
+
+
+def make_session(pool_size: int = POOL_SIZE) -> requests.Session:
+    """
+    Makes a session pooling the connections to the servers.
+
+    Failed connections and server errors are retried a few times.
+
+    Parameters:
+        pool_size: Maximum number of connections kept per server.
+
+    Returns:
+        The session.
+
+    """
+    retries = Retry(
+        total=RETRIES,
+        backoff_factor=0.2,
+        status_forcelist=(500, 502, 503, 504),
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries
+    )
+    session = requests.Session()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def file_hash(path: str) -> str:
+    """
+    Computes the SHA-256 of a file.
+
+    Parameters:
+        path: Path of the file.
+
+    Returns:
+        The hexadecimal digest.
+
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as fp:
+        for chunk in iter(lambda: fp.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@dataclass(frozen=True)
+class Release:
+    """A release of a package, as listed by the server."""
+
+    author: str
+    name: str
+    release: float
+    url: str
+    sha256: Optional[str] = None
+
+    @property
+    def filename(self) -> str:
+        return f"{self.author}.{self.name}.{self.release}.zip"
+
+
+class Downloader:
+    """
+    Downloads releases into a cache folder.
+
+    Parameters:
+        cache_dir: Folder where the releases are kept.
+        session: Session used for the requests, a pooled one is made if
+            none is given.
+        workers: Maximum number of parallel downloads.
+
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        session: Optional[requests.Session] = None,
+        workers: int = WORKERS,
+    ) -> None:
+        self.cache_dir = cache_dir
+        self.session = session or make_session(max(workers, POOL_SIZE))
+        self.workers = workers
+
+    def path(self, release: Release) -> str:
+        return os.path.join(self.cache_dir, release.filename)
+
+    def hash_path(self, release: Release) -> str:
+        """Path of the checksum of a completed download."""
+        return self.path(release) + ".sha256"
+
+    def is_cached(self, release: Release) -> bool:
+        """
+        Whether a release is already in the cache.
+
+        The cached file is checked against the checksum of the release or,
+        if the server gives none, against the checksum kept when it was
+        downloaded. A cached file not matching its checksum, or without
+        any checksum to check, is removed.
+
+        Parameters:
+            release: The release.
+
+        Returns:
+            Whether the release doesn't need to be downloaded.
+
+        """
+        path = self.path(release)
+        if not os.path.exists(path):
+            return False
+        expected = release.sha256
+        if not expected:
+            try:
+                with open(self.hash_path(release)) as fp:
+                    expected = fp.read().strip()
+            except OSError:
+                expected = None
+        if not expected or file_hash(path) != expected.lower():
+            logger.warning(f"Cached {path} doesn't match its checksum")
+            self.remove(release)
+            return False
+        return True
+
+    def remove(self, release: Release) -> None:
+        """
+        Removes a release and its checksum from the cache.
+
+        Parameters:
+            release: The release.
+
+        """
+        for path in (self.path(release), self.hash_path(release)):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def fetch(self, release: Release) -> str:
+        """
+        Downloads a release, unless it's already in the cache.
+
+        Parameters:
+            release: The release.
+
+        Returns:
+            Path of the downloaded file.
+
+        Raises:
+            ChecksumError: If the download doesn't match the checksum of
+                the release.
+            OSError: If the download is incomplete, it can be resumed.
+
+        """
+        path = self.path(release)
+        if self.is_cached(release):
+            logger.debug(f"Using cached {path}")
+            return path
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        part = path + ".part"
+        offset = os.path.getsize(part) if os.path.exists(part) else 0
+        headers = {"Range": f"bytes={offset}-"} if offset else {}
+        response = self.session.get(
+            release.url, headers=headers, stream=True, timeout=TIMEOUT
+        )
+        if response.status_code == 416:
+            # the part file doesn't fit the release anymore
+            response.close()
+            os.remove(part)
+            return self.fetch(release)
+
+        with response:
+            response.raise_for_status()
+            if response.status_code == 206:
+                logger.info(f"Resuming {release.url} at {offset} bytes")
+                mode = "ab"
+            else:
+                offset = 0
+                mode = "wb"
+            expected = response.headers.get("content-length")
+            written = 0
+            with open(part, mode) as fp:
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    fp.write(chunk)
+                    written += len(chunk)
+            logger.debug(f"Downloaded {written} bytes of {release.url}")
+
+        if expected is not None and written != int(expected):
+            raise OSError(
+                f"Incomplete download of {release.url} "
+                f"({written} of {expected} bytes)"
+            )
+        digest = file_hash(part)
+        if release.sha256 and digest != release.sha256.lower():
+            os.remove(part)
+            raise ChecksumError(
+                f"Checksum of {release.url} is {digest}, "
+                f"expected {release.sha256}"
+            )
+        os.replace(part, path)
+        # written last, a release without it is downloaded again
+        with open(self.hash_path(release), "w") as fp:
+            fp.write(digest)
+        return path
+
+    def map(self, function: Callable[[T], R], items: Iterable[T]) -> list[R]:
+        """
+        Calls a function on each item, in parallel.
+
+        Parameters:
+            function: The function, usually doing requests.
+            items: The items.
+
+        Returns:
+            The results, in the order of the items.
+
+        """
+        items = list(items)
+        if len(items) <= 1:
+            return [function(item) for item in items]
+        workers = min(self.workers, len(items))
+        with ThreadPoolExecutor(
+            workers, thread_name_prefix="downloader"
+        ) as executor:
+            return list(executor.map(function, items))
+
+    def fetch_all(self, releases: Sequence[Release]) -> list[str]:
+        """
+        Downloads releases in parallel.
+
+        Parameters:
+            releases: The releases.
+
+        Returns:
+            Paths of the downloaded files, in the order of the releases.
+
+        """
+        return self.map(self.fetch, releases)
@@ -21,6 +21,7 @@ from tuxemon.db import (
     GenderType,
     MonsterEvolutionItemModel,
     MonsterHistoryItemModel,
+    MonsterModel,
     MonsterMovesetItemModel,
     MonsterShape,
     PlagueType,
@@ -30,10 +31,11 @@ from tuxemon.db import (
     TasteWarm,
     db,
 )
-from tuxemon.element import Element
+from tuxemon.element import Element, get_element
 from tuxemon.evolution import Evolution
 from tuxemon.locale import T
 from tuxemon.shape import Shape
+from tuxemon.slug_cache import SlugCache
 from tuxemon.sprite import Sprite
 from tuxemon.technique.technique import Technique, decode_moves, encode_moves
 
@@ -71,6 +73,89 @@ SIMPLE_PERSISTANCE_ATTRIBUTES = (
 )
 
 
+def get_sprite_path(sprite: str) -> str:
+    """
+    Get a sprite path.
+
+    Paths are set up by convention, so the file extension is unknown.
+    This adds the appropriate file extension if the sprite exists,
+    and returns a dummy image if it can't be found.
+
+    Returns:
+        Path to sprite or placeholder image.
+
+    """
+    try:
+        path = "%s.png" % sprite
+        full_path = tools.transform_resource_filename(path)
+        if full_path:
+            return full_path
+    except OSError:
+        pass
+
+    logger.error(f"Could not find monster sprite {sprite}")
+    return prepare.MISSING_IMAGE
+
+
+class MonsterTemplate:
+    """
+    What the monsters of a slug share, built once from the database.
+
+    Parameters:
+        results: The database entry of the monster.
+
+    """
+
+    __slots__ = (
+        "slug",
+        "name",
+        "description",
+        "category",
+        "types",
+        "front_battle_sprite",
+        "back_battle_sprite",
+        "menu_sprite_1",
+        "menu_sprite_2",
+        "combat_call",
+        "faint_call",
+    )
+
+    def __init__(self, results: MonsterModel) -> None:
+        self.slug = results.slug
+        self.name = T.translate(results.slug)
+        self.description = T.translate(f"{results.slug}_description")
+        self.category = T.translate(f"cat_{results.category}")
+        self.types = tuple(get_element(ele) for ele in results.types)
+
+        # Look up the monster's sprite image paths
+        self.front_battle_sprite = ""
+        self.back_battle_sprite = ""
+        self.menu_sprite_1 = ""
+        self.menu_sprite_2 = ""
+        if results.sprites:
+            self.front_battle_sprite = get_sprite_path(results.sprites.battle1)
+            self.back_battle_sprite = get_sprite_path(results.sprites.battle2)
+            self.menu_sprite_1 = get_sprite_path(results.sprites.menu1)
+            self.menu_sprite_2 = get_sprite_path(results.sprites.menu2)
+
+        # get sound slugs for this monster, defaulting to a generic type-based sound
+        self.combat_call = (
+            results.sounds.combat_call
+            if results.sounds
+            else f"sound_{self.types[0].name}_call"
+        )
+        self.faint_call = (
+            results.sounds.faint_call
+            if results.sounds
+            else f"sound_{self.types[0].name}_faint"
+        )
+
+
+monster_templates: SlugCache[MonsterTemplate] = SlugCache(
+    "monster", MonsterTemplate
+)
+
+
 # class definition for tuxemon flairs:
 class Flair:
     def __init__(self, category: str, name: str) -> None:
@@ -197,16 +282,17 @@ class Monster:
 
         """
         try:
-            results = db.lookup(slug, table="monster")
+            template = monster_templates.get(slug)
         except KeyError:
             raise RuntimeError(f"Monster {slug} not found")
+        results = db.lookup(slug, table="monster")
 
         self.level = random.randint(2, 5)
-        self.slug = results.slug
-        self.name = T.translate(results.slug)
-        self.description = T.translate(f"{results.slug}_description")
+        self.slug = template.slug
+        self.name = template.name
+        self.description = template.description
         self.cat = results.category
-        self.category = T.translate(f"cat_{self.cat}")
+        self.category = template.category
         self.shape = results.shape or MonsterShape.default
         self.stage = results.stage or EvolutionStage.standalone
         self.taste_cold = self.set_taste_cold(self.taste_cold)
@@ -215,7 +301,7 @@ class Monster:
         self.bond = self.bond
 
         # types
-        self.types = [Element(ele) for ele in results.types]
+        self.types = list(template.types)
         self.default_types = self.types[:]
 
         self.randomly = results.randomly or self.randomly
@@ -241,28 +327,12 @@ class Monster:
         self.evolutions.extend(results.evolutions or [])
         self.history.extend(results.history or [])
 
-        # Look up the monster's sprite image paths
-        if results.sprites:
-            self.front_battle_sprite = self.get_sprite_path(
-                results.sprites.battle1
-            )
-            self.back_battle_sprite = self.get_sprite_path(
-                results.sprites.battle2
-            )
-            self.menu_sprite_1 = self.get_sprite_path(results.sprites.menu1)
-            self.menu_sprite_2 = self.get_sprite_path(results.sprites.menu2)
-
-        # get sound slugs for this monster, defaulting to a generic type-based sound
-        self.combat_call = (
-            results.sounds.combat_call
-            if results.sounds
-            else f"sound_{self.types[0].name}_call"
-        )
-        self.faint_call = (
-            results.sounds.faint_call
-            if results.sounds
-            else f"sound_{self.types[0].name}_faint"
-        )
+        self.front_battle_sprite = template.front_battle_sprite
+        self.back_battle_sprite = template.back_battle_sprite
+        self.menu_sprite_1 = template.menu_sprite_1
+        self.menu_sprite_2 = template.menu_sprite_2
+        self.combat_call = template.combat_call
+        self.faint_call = template.faint_call
 
     def learn(
         self,
@@ -617,24 +687,11 @@ class Monster:
         """
         Get a sprite path.
 
-        Paths are set up by convention, so the file extension is unknown.
-        This adds the appropriate file extension if the sprite exists,
-        and returns a dummy image if it can't be found.
-
         Returns:
             Path to sprite or placeholder image.
 
         """
-        try:
-            path = "%s.png" % sprite
-            full_path = tools.transform_resource_filename(path)
-            if full_path:
-                return full_path
-        except OSError:
-            pass
-
-        logger.error(f"Could not find monster sprite {sprite}")
-        return prepare.MISSING_IMAGE
+        return get_sprite_path(sprite)
 
     def load_sprites(self) -> bool:
         """
@@ -11,11 +11,11 @@ from typing import TYPE_CHECKING, Any, Optional, TypedDict
 
 from tuxemon import prepare, surfanim
 from tuxemon.battle import Battle, decode_battle, encode_battle
-from tuxemon.boxes import ItemBoxes, MonsterBoxes
+from tuxemon.boxes import InventoryIndex, ItemBoxes, MonsterBoxes
 from tuxemon.compat import Rect
 from tuxemon.db import Direction, ElementType, EntityFacing, SeenStatus, db
 from tuxemon.entity import Entity
-from tuxemon.graphics import load_and_scale
+from tuxemon.graphics import load_and_scale, load_atlas_frames
 from tuxemon.item.item import Item, decode_items, encode_items
 from tuxemon.locale import T
 from tuxemon.map import dirs2, dirs3, get_coords_ext, get_direction, proj
@@ -57,6 +57,51 @@ class NPCState(TypedDict):
     tile_pos: tuple[int, int]
 
 
+def npc_sprite_files(sprite_name: str) -> list[str]:
+    """
+    Returns the images of the standing sprites and walk cycles of an NPC.
+
+    Parameters:
+        sprite_name: Sprite name of the NPC template.
+
+    Returns:
+        Paths of the images, relative to the mod folders, for each facing:
+        the standing image and the two walk frames.
+
+    """
+    files = []
+    for facing in EntityFacing:
+        walk = f"sprites/{sprite_name}_{facing.value}_walk"
+        files += [
+            f"sprites/{sprite_name}_{facing.value}.png",
+            f"{walk}.{str(0).zfill(3)}.png",
+            f"{walk}.{str(1).zfill(3)}.png",
+        ]
+    return files
+
+
+def load_npc_sprite_images(
+    sprite_name: str,
+) -> dict[str, pygame.surface.Surface]:
+    """
+    Loads the images of an NPC from its atlas, if there is an up to date one.
+
+    Parameters:
+        sprite_name: Sprite name of the NPC template.
+
+    Returns:
+        The images by relative path, empty without an atlas.
+
+    """
+    relative_paths = npc_sprite_files(sprite_name)
+    try:
+        files = [prepare.fetch(path) for path in relative_paths]
+    except OSError:
+        return {}
+    frames = load_atlas_frames(f"npc_{sprite_name}", files)
+    return dict(zip(relative_paths, frames or ()))
+
+
 def tile_distance(tile0: Iterable[float], tile1: Iterable[float]) -> float:
     x0, y0 = tile0
     x1, y1 = tile1
@@ -93,41 +138,7 @@ class NPC(Entity[NPCState]):
         # This is the NPC's name to be used in dialog
         self.name = T.translate(self.slug)
 
-        # general
-        self.behavior: Optional[str] = "wander"  # not used for now
-        self.game_variables: dict[str, Any] = {}  # Tracks the game state
-        self.battles: list[Battle] = []  # Tracks the battles
-        self.forfeit: bool = False
-        # Tracks Tuxepedia (monster seen or caught)
-        self.tuxepedia: dict[str, SeenStatus] = {}
-        self.contacts: dict[str, str] = {}
-        self.money: dict[str, int] = {}  # Tracks money
-        # list of ways player can interact with the Npc
-        self.interactions: Sequence[str] = []
-        # menu labels (world menu)
-        self.menu_save: bool = True
-        self.menu_load: bool = True
-        self.menu_player: bool = True
-        self.menu_monsters: bool = True
-        self.menu_bag: bool = True
-        self.menu_missions: bool = True
-        # This is a list of tuxemon the npc has. Do not modify directly
-        self.monsters: list[Monster] = []
-        # The player's items.
-        self.items: list[Item] = []
-        self.missions: list[Mission] = []
-        self.economy: Optional[Economy] = None
-        # Variables for long-term item and monster storage
-        # Keeping these separate so other code can safely
-        # assume that all values are lists
-        self.monster_boxes = MonsterBoxes()
-        self.item_boxes = ItemBoxes()
-        self.pending_evolutions: list[tuple[Monster, Monster]] = []
-        # nr tuxemon fight
-        self.max_position: int = 1
-        self.speed = 10  # To determine combat order (not related to movement!)
-        self.moves: Sequence[Technique] = []  # list of techniques
-        self.steps: float = 0.0
+        self._initialize_attributes()
 
         # pathfinding and waypoint related
         self.pathfinding: Optional[tuple[int, int]] = None
@@ -174,6 +185,54 @@ class NPC(Entity[NPCState]):
             )
         )
 
+    def _initialize_attributes(self) -> None:
+        """
+        Initializes the state of the npc that doesn't depend on the world.
+
+        This is the party, the bag, the boxes and the game variables, what
+        a trainer needs to battle even without a map (see
+        :class:`tuxemon.states.combat.headless.HeadlessTrainer`).
+
+        """
+        # general
+        self.behavior: Optional[str] = "wander"  # not used for now
+        self.game_variables: dict[str, Any] = {}  # Tracks the game state
+        self.battles: list[Battle] = []  # Tracks the battles
+        self.forfeit: bool = False
+        # Tracks Tuxepedia (monster seen or caught)
+        self.tuxepedia: dict[str, SeenStatus] = {}
+        self.contacts: dict[str, str] = {}
+        self.money: dict[str, int] = {}  # Tracks money
+        # list of ways player can interact with the Npc
+        self.interactions: Sequence[str] = []
+        # menu labels (world menu)
+        self.menu_save: bool = True
+        self.menu_load: bool = True
+        self.menu_player: bool = True
+        self.menu_monsters: bool = True
+        self.menu_bag: bool = True
+        self.menu_missions: bool = True
+        # This is a list of tuxemon the npc has. Do not modify directly
+        self.monsters: list[Monster] = []
+        # The player's items.
+        self.items: list[Item] = []
+        # indexes of the party and the bag, see monster_index and item_index
+        self._monster_index: InventoryIndex[Monster] = InventoryIndex()
+        self._item_index: InventoryIndex[Item] = InventoryIndex()
+        self.missions: list[Mission] = []
+        self.economy: Optional[Economy] = None
+        # Variables for long-term item and monster storage
+        # Keeping these separate so other code can safely
+        # assume that all values are lists
+        self.monster_boxes = MonsterBoxes()
+        self.item_boxes = ItemBoxes()
+        self.pending_evolutions: list[tuple[Monster, Monster]] = []
+        # nr tuxemon fight
+        self.max_position: int = 1
+        self.speed = 10  # To determine combat order (not related to movement!)
+        self.moves: Sequence[Technique] = []  # list of techniques
+        self.steps: float = 0.0
+
     def get_state(self, session: Session) -> NPCState:
         """
         Prepares a dictionary of the npc to be saved to a file.
@@ -256,6 +315,11 @@ class NPC(Entity[NPCState]):
             self.interactive_obj = True
 
         self.standing = {}
+        atlas_images = (
+            {}
+            if self.interactive_obj
+            else load_npc_sprite_images(self.template.sprite_name)
+        )
         for standing_type in list(EntityFacing):
             # if the template slug is interactive_obj, then it needs _front
             if self.interactive_obj:
@@ -265,8 +329,10 @@ class NPC(Entity[NPCState]):
                 filename = (
                     f"{self.template.sprite_name}_{standing_type.value}.png"
                 )
-                path = os.path.join("sprites", filename)
-            self.standing[standing_type] = load_and_scale(path)
+                path = f"sprites/{filename}"
+            self.standing[standing_type] = atlas_images.get(
+                path
+            ) or load_and_scale(path)
         # The player's sprite size in pixels
         self.playerWidth, self.playerHeight = self.standing[
             EntityFacing.front
@@ -290,7 +356,7 @@ class NPC(Entity[NPCState]):
 
                 frames: list[tuple[pygame.surface.Surface, float]] = []
                 for image in images:
-                    surface = load_and_scale(image)
+                    surface = atlas_images.get(image) or load_and_scale(image)
                     frames.append((surface, frame_duration))
 
                 _surfanim = surfanim.SurfaceAnimation(frames, loop=True)
@@ -609,6 +675,32 @@ class NPC(Entity[NPCState]):
         r"""WIP guesswork ¯\_(ツ)_/¯"""
         self.update_location = True
 
+    @property
+    def monster_index(self) -> InventoryIndex[Monster]:
+        """Index of the party by instance ID and slug."""
+        return self._monster_index.sync(self.monsters)
+
+    @property
+    def item_index(self) -> InventoryIndex[Item]:
+        """Index of the bag by instance ID and slug."""
+        return self._item_index.sync(self.items)
+
+    def check_index(self) -> list[str]:
+        """
+        Checks that the indexes of the party, the bag and the boxes match
+        their contents.
+
+        Returns:
+            The inconsistencies found, empty if the indexes are correct.
+
+        """
+        return (
+            self.monster_index.check(self.monsters)
+            + self.item_index.check(self.items)
+            + self.monster_boxes.check_index()
+            + self.item_boxes.check_index()
+        )
+
     ####################################################
     #                   Monsters                       #
     ####################################################
@@ -631,7 +723,12 @@ class NPC(Entity[NPCState]):
             if self.monster_boxes.is_box_full(kennel):
                 self.monster_boxes.create_and_merge_box(kennel)
         else:
+            index = self.monster_index
             self.monsters.insert(slot, monster)
+            # inserting elsewhere than at the end reorders the party, the
+            # index is rebuilt on next use
+            if self.monsters[-1] is monster:
+                index.added(monster)
 
     def find_monster(self, monster_slug: str) -> Optional[Monster]:
         """
@@ -644,11 +741,7 @@ class NPC(Entity[NPCState]):
             Monster found.
 
         """
-        for monster in self.monsters:
-            if monster.slug == monster_slug:
-                return monster
-
-        return None
+        return self.monster_index.get_by_slug(monster_slug)
 
     def find_monster_by_id(self, instance_id: uuid.UUID) -> Optional[Monster]:
         """
@@ -661,9 +754,7 @@ class NPC(Entity[NPCState]):
             Monster found, or None.
 
         """
-        return next(
-            (m for m in self.monsters if m.instance_id == instance_id), None
-        )
+        return self.monster_index.get_by_id(instance_id)
 
     def release_monster(self, monster: Monster) -> bool:
         """
@@ -677,7 +768,9 @@ class NPC(Entity[NPCState]):
             return False
 
         if monster in self.monsters:
+            index = self.monster_index
             self.monsters.remove(monster)
+            index.removed(monster)
             return True
         else:
             return False
@@ -691,7 +784,9 @@ class NPC(Entity[NPCState]):
 
         """
         if monster in self.monsters:
+            index = self.monster_index
             self.monsters.remove(monster)
+            index.removed(monster)
 
     def switch_monsters(self, index_1: int, index_2: int) -> None:
         """
@@ -706,6 +801,8 @@ class NPC(Entity[NPCState]):
             self.monsters[index_2],
             self.monsters[index_1],
         )
+        # the first monster of a slug may have changed
+        self.monster_index.invalidate()
 
     def has_tech(self, tech: Optional[str]) -> bool:
         """
@@ -752,7 +849,9 @@ class NPC(Entity[NPCState]):
         if len(self.items) >= prepare.MAX_TYPES_BAG:
             self.item_boxes.add_item(locker, item)
         else:
+            index = self.item_index
             self.items.append(item)
+            index.added(item)
 
     def remove_item(self, item: Item) -> None:
         """
@@ -760,27 +859,23 @@ class NPC(Entity[NPCState]):
 
         """
         if item in self.items:
+            index = self.item_index
             self.items.remove(item)
+            index.removed(item)
 
     def find_item(self, item_slug: str) -> Optional[Item]:
         """
         Finds an item in the npc's bag.
 
         """
-        for itm in self.items:
-            if itm.slug == item_slug:
-                return itm
-
-        return None
+        return self.item_index.get_by_slug(item_slug)
 
     def find_item_by_id(self, instance_id: uuid.UUID) -> Optional[Item]:
         """
         Finds an item in the npc's bag which has the given id.
 
         """
-        return next(
-            (m for m in self.items if m.instance_id == instance_id), None
-        )
+        return self.item_index.get_by_id(instance_id)
 
     ####################################################
     #                    Missions                      #
@@ -0,0 +1,195 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+"""
+Loading ahead of time of the assets a state is going to need.
+
+Listing, reading and decoding the files is done by a worker thread. The
+images must be converted to the display format on the main thread, so
+they are handed over to :meth:`AssetPrefetcher.update`, which converts a
+few of them each frame into the surface cache. Sounds are handed over to
+the sound manager. Loading the assets afterwards doesn't touch the disk.
+
+Once everything is loaded, the warm up functions are called on the main
+thread, still a few each frame, to build what is made from the assets
+(e.g. the animated sprites of the techniques).
+"""
+from __future__ import annotations
+
+import logging
+import os
+import queue
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any, Optional
+
+import pygame
+
+from tuxemon import prepare
+from tuxemon.animation_entity import animation_files
+from tuxemon.atlas import animation_atlas_name, find_atlas
+from tuxemon.graphics import (
+    cache_scaled_image,
+    scaled_image_key,
+    surface_cache,
+)
+
+if TYPE_CHECKING:
+    from tuxemon.audio import SoundManager
+
+logger = logging.getLogger(__name__)
+
+WarmUp = Callable[[], Any]
+
+
+class AssetPrefetcher:
+    """
+    Loads animations and sounds in a background thread.
+
+    Parameters:
+        sound_manager: Sound manager getting the sounds.
+        budget: Seconds of each frame spent by :meth:`update`.
+
+    """
+
+    def __init__(
+        self,
+        sound_manager: Optional[SoundManager] = None,
+        budget: float = prepare.PREFETCH_FRAME_BUDGET,
+    ) -> None:
+        self.sound_manager = sound_manager
+        self.budget = budget
+        self._loaded: queue.SimpleQueue[tuple[str, str, Any]] = (
+            queue.SimpleQueue()
+        )
+        self._warm_ups: deque[WarmUp] = deque()
+        self._thread: Optional[threading.Thread] = None
+        self._cancelled = threading.Event()
+
+    def start(
+        self,
+        animations: Iterable[str],
+        sounds: Iterable[str] = (),
+        warm_ups: Iterable[WarmUp] = (),
+    ) -> None:
+        """
+        Starts loading assets.
+
+        Parameters:
+            animations: Slugs of the animations.
+            sounds: Slugs of the sounds.
+            warm_ups: Functions called on the main thread once the assets
+                are loaded.
+
+        """
+        self._warm_ups.extend(warm_ups)
+        self._thread = threading.Thread(
+            target=self._load,
+            args=(
+                list(dict.fromkeys(animations)),
+                list(dict.fromkeys(sounds)),
+            ),
+            name="prefetch",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def cancel(self) -> None:
+        """Stops loading, the assets already loaded are kept."""
+        self._cancelled.set()
+        self._warm_ups.clear()
+
+    @property
+    def loading(self) -> bool:
+        """Whether the worker thread is still loading files."""
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def done(self) -> bool:
+        """Whether everything is loaded and warmed up."""
+        return not self.loading and self._loaded.empty() and not self._warm_ups
+
+    def _load(self, animations: list[str], sounds: list[str]) -> None:
+        """Reads and decodes the files, on the worker thread."""
+        for slug in animations:
+            try:
+                files = animation_files(slug)
+            except (RuntimeError, OSError) as e:
+                logger.warning(f"Unable to prefetch animation {slug}: {e}")
+                continue
+            if files:
+                directory = os.path.dirname(files[0])
+                atlas = find_atlas(
+                    animation_atlas_name(directory, slug), files
+                )
+                if atlas is not None:
+                    # the frames are loaded from the atlas
+                    files = [atlas[0]]
+            for filename in files:
+                if self._cancelled.is_set():
+                    return
+                if scaled_image_key(filename) in surface_cache:
+                    continue
+                try:
+                    image = pygame.image.load(filename)
+                except (OSError, pygame.error) as e:
+                    logger.warning(f"Unable to prefetch {filename}: {e}")
+                    continue
+                self._loaded.put(("image", filename, image))
+
+        if self.sound_manager is None or not pygame.mixer.get_init():
+            return
+        for slug in sounds:
+            if self._cancelled.is_set():
+                return
+            if not slug or slug in self.sound_manager.sounds:
+                continue
+            filename = self.sound_manager.get_sound_filename(slug)
+            if filename is None:
+                continue
+            try:
+                sound = pygame.mixer.Sound(filename)
+            except (MemoryError, pygame.error) as e:
+                logger.warning(f"Unable to prefetch sound {slug}: {e}")
+                continue
+            self._loaded.put(("sound", slug, sound))
+
+    def update(self) -> None:
+        """
+        Does the main thread work, for at most the budget of a frame.
+
+        Should be called every frame until :attr:`done`.
+
+        """
+        deadline = time.perf_counter() + self.budget
+        while time.perf_counter() < deadline and self._step():
+            pass
+
+    def finish(self) -> None:
+        """Blocks until everything is loaded and warmed up."""
+        if self._thread is not None:
+            self._thread.join()
+        while self._step():
+            pass
+
+    def _step(self) -> bool:
+        """Handles one loaded asset or warm up, returns False if none."""
+        try:
+            kind, name, asset = self._loaded.get_nowait()
+        except queue.Empty:
+            if self.loading or not self._warm_ups:
+                return False
+            warm_up = self._warm_ups.popleft()
+            try:
+                warm_up()
+            except Exception:
+                logger.exception(f"Prefetch warm up {warm_up} failed")
+            return True
+        if self._cancelled.is_set():
+            pass
+        elif kind == "image":
+            cache_scaled_image(name, asset)
+        elif self.sound_manager is not None:
+            self.sound_manager.preload_sound(name, asset)
+        return True
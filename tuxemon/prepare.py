@@ -12,6 +12,7 @@ import re
 from typing import TYPE_CHECKING
 
 from tuxemon import config
+from tuxemon.asset_index import AssetIndex
 from tuxemon.constants import paths
 
 if TYPE_CHECKING:
@@ -185,6 +186,22 @@ BG_MOVES: str = ITEM_MENU
 BG_SHOP: str = ITEM_MENU
 BG_MONSTERS: str = "gfx/ui/monster/monster_menu_bg.png"
 
+# Number of tilesets kept in memory across map changes
+TILESET_CACHE_SIZE: int = 32
+# Number of parsed maps kept in memory
+MAP_CACHE_SIZE: int = 16
+# Number of rendered glyphs and of text layouts kept in memory
+GLYPH_CACHE_SIZE: int = 1024
+TEXT_LAYOUT_CACHE_SIZE: int = 256
+# Number of rendered labels (menus, HUD) kept in memory
+LABEL_CACHE_SIZE: int = 512
+# Number of scaled menu images (e.g. PC box thumbnails) kept in memory
+MENU_IMAGE_CACHE_SIZE: int = 256
+# Number of monsters or items shown on each page of a PC box
+PC_BOX_PAGE_SIZE: int = 12
+# Seconds of each frame spent on the prefetched assets (e.g. in combat)
+PREFETCH_FRAME_BUDGET: float = 0.004
+
 # Native resolution is similar to the old gameboy resolution. This is
 # used for scaling.
 NATIVE_RESOLUTION: tuple[int, int] = (240, 160)
@@ -386,11 +403,15 @@ else:
 
 # Reference user save dir
 SAVE_PATH = os.path.join(paths.USER_GAME_SAVE_DIR, "slot")
-SAVE_METHOD = "JSON"
+SAVE_METHOD = "COMPACT"
+# SAVE_METHOD = "JSON"
 # SAVE_METHOD = "CBOR"
 
 DEV_TOOLS = CONFIG.dev_tools
 
+# Resolved paths of the files provided by the mods
+ASSETS = AssetIndex(CONFIG.mods, paths.ASSET_CACHE_DIR)
+
 
 def pygame_init() -> None:
     """Eventually refactor out of prepare."""
@@ -408,9 +429,14 @@ def pygame_init() -> None:
     from tuxemon.locale import T
 
     T.collect_languages(CONFIG.recompile_translations)
-    from tuxemon.db import db
+    from tuxemon.db import db, has
 
-    db.load()
+    # assets are checked by the build step, trust them unless asked not to
+    has.strict = CONFIG.strict_validation
+    if CONFIG.db_snapshot:
+        db.load_cached(paths.DB_SNAPSHOT_PATH)
+    else:
+        db.load()
 
     logger.debug("pygame init")
     pg.init()
@@ -459,31 +485,25 @@ def init() -> None:
         pygame_init()
 
 
-# Fetches a resource file
-# note: this has the potential of being a bottle neck doing to all the checking of paths
-# eventually, this should be configured at game launch, or in a config file instead
-# of looking all over creation for the required files.
 def fetch(*args: str) -> str:
-    relative_path = os.path.join(*args)
+    """
+    Returns the absolute path of a resource provided by the mods.
+
+    Paths are resolved through the asset index, which is built once by
+    walking the mod folders (see :class:`tuxemon.asset_index.AssetIndex`).
 
-    for mod_name in CONFIG.mods:
-        # when assets are in folder with the source
-        path = os.path.join(paths.mods_folder, mod_name, relative_path)
-        logger.debug("searching asset: %s", path)
-        if os.path.exists(path):
-            return path
-
-        # when assets are in a system path (like for os packages and android)
-        for root_path in paths.system_installed_folders:
-            path = os.path.join(root_path, "mods", mod_name, relative_path)
-            logger.debug("searching asset: %s", path)
-            if os.path.exists(path):
-                return path
-
-        # mods folder is in same folder as the launch script
-        path = os.path.join(paths.BASEDIR, "mods", mod_name, relative_path)
-        logger.debug("searching asset: %s", path)
-        if os.path.exists(path):
-            return path
-
-    raise OSError(f"cannot load file {relative_path}")
+    Parameters:
+        args: Components of the path, relative to a mod folder.
+
+    Returns:
+        The absolute path of the resource.
+
+    Raises:
+        OSError: If no mod provides the resource.
+
+    """
+    relative_path = os.path.join(*args)
+    path = ASSETS.find(relative_path)
+    if path is None:
+        raise OSError(f"cannot load file {relative_path}")
+    return path
@@ -5,12 +5,21 @@ from __future__ import annotations
 import base64
 import datetime
 import importlib
+import io
 import json
 import logging
 import os
 from collections.abc import Callable, Mapping
 from operator import itemgetter
-from typing import Any, Literal, NewType, Optional, TextIO, TypeVar
+from typing import (
+    Any,
+    Literal,
+    NewType,
+    Optional,
+    TextIO,
+    TypedDict,
+    TypeVar,
+)
 
 import pygame
 
@@ -18,13 +27,24 @@ from tuxemon import prepare
 from tuxemon.client import LocalPygameClient
 from tuxemon.npc import NPCState
 from tuxemon.save_upgrader import SAVE_VERSION, upgrade_save
+from tuxemon.save_writer import (
+    SaveCallback,
+    dump_compact,
+    dump_state,
+    encode_png,
+    is_compact,
+    load_compact,
+    save_writer,
+    write_file,
+)
 from tuxemon.session import Session
 from tuxemon.states.world.worldstate import WorldState
 
 try:
     import cbor
 except ImportError:
-    prepare.SAVE_METHOD = "JSON"
+    if prepare.SAVE_METHOD == "CBOR":
+        prepare.SAVE_METHOD = "JSON"
 
 
 T = TypeVar("T")
@@ -34,12 +54,18 @@ logger = logging.getLogger(__name__)
 
 slot_number: Optional[int] = None
 TIME_FORMAT = "%Y-%m-%d %H:%M"
+METADATA_VERSION = 1
+THUMBNAIL_SCALE = 4
 config = prepare.CONFIG
 
 EncodedScreenshot = NewType("EncodedScreenshot", str)
 
 
-class SaveData(NPCState):
+class _SaveDataOptional(TypedDict, total=False):
+    screenshot_format: str
+
+
+class SaveData(NPCState, _SaveDataOptional):
     screenshot: EncodedScreenshot
     screenshot_width: int
     screenshot_height: int
@@ -47,6 +73,25 @@ class SaveData(NPCState):
     version: int
 
 
+class SaveMetadata(TypedDict, total=False):
+    """
+    Summary of a save, stored in a small file next to it.
+
+    ``save_size`` and ``save_mtime_ns`` identify the save the metadata was
+    made for, ``error`` is only set for saves which can't be loaded.
+    """
+
+    version: int
+    time: str
+    player_name: str
+    current_map: str
+    player_steps: float
+    thumbnail: str
+    save_size: int
+    save_mtime_ns: int
+    error: str
+
+
 def capture_screenshot(client: LocalPygameClient) -> pygame.surface.Surface:
     """
     Capture a screenshot.
@@ -170,12 +215,191 @@ def json_load(
     )
 
 
+def get_metadata_path(slot: int) -> str:
+    return f"{get_save_path(slot)}.meta"
+
+
+def make_thumbnail(screenshot: pygame.surface.Surface) -> str:
+    """
+    Makes the thumbnail of a screenshot shown by the save menus.
+
+    Parameters:
+        screenshot: The screenshot.
+
+    Returns:
+        The base64 encoded PNG of the scaled down screenshot.
+
+    """
+    width, height = screenshot.get_size()
+    thumbnail = pygame.transform.smoothscale(
+        screenshot,
+        (
+            max(1, width // THUMBNAIL_SCALE),
+            max(1, height // THUMBNAIL_SCALE),
+        ),
+    )
+    data = io.BytesIO()
+    pygame.image.save(thumbnail, data, "png")
+    return base64.b64encode(data.getvalue()).decode()
+
+
+def load_thumbnail(metadata: SaveMetadata) -> Optional[pygame.surface.Surface]:
+    """
+    Returns the thumbnail of a save, if any.
+
+    Parameters:
+        metadata: Metadata of the save.
+
+    Returns:
+        The thumbnail image.
+
+    """
+    if "thumbnail" not in metadata:
+        return None
+    data = io.BytesIO(base64.b64decode(metadata["thumbnail"]))
+    return pygame.image.load(data, "thumbnail.png")
+
+
+def decode_screenshot(
+    save_data: SaveData,
+) -> Optional[pygame.surface.Surface]:
+    """
+    Returns the screenshot of a save, if any.
+
+    Compact saves store it as PNG, the other ones as raw RGB pixels.
+
+    Parameters:
+        save_data: The save data.
+
+    Returns:
+        The screenshot.
+
+    """
+    if "screenshot" not in save_data:
+        return None
+    data = base64.b64decode(save_data["screenshot"])
+    if save_data.get("screenshot_format") == "png":
+        return pygame.image.load(io.BytesIO(data), "screenshot.png")
+    return pygame.image.frombuffer(
+        data,
+        (save_data["screenshot_width"], save_data["screenshot_height"]),
+        "RGB",
+    )
+
+
+def make_metadata(save_data: SaveData) -> SaveMetadata:
+    """
+    Makes the metadata of a save.
+
+    Parameters:
+        save_data: The save data.
+
+    Returns:
+        The metadata, without the state of the save file.
+
+    """
+    metadata: SaveMetadata = {
+        "version": METADATA_VERSION,
+        "time": save_data["time"],
+        "player_name": save_data["player_name"],
+        "current_map": save_data.get("current_map", ""),
+        "player_steps": save_data.get("player_steps", 0.0),
+    }
+    screenshot = decode_screenshot(save_data)
+    if screenshot is not None:
+        metadata["thumbnail"] = make_thumbnail(screenshot)
+    return metadata
+
+
+def write_metadata(slot: int, metadata: SaveMetadata) -> None:
+    """
+    Writes the metadata of a save next to it.
+
+    The metadata is bound to the current state of the save file, so it's
+    ignored if the save is later replaced by another tool.
+
+    Parameters:
+        slot: The save slot.
+        metadata: The metadata of the save.
+
+    """
+    stat = os.stat(get_save_path(slot))
+    metadata["save_size"] = stat.st_size
+    metadata["save_mtime_ns"] = stat.st_mtime_ns
+    metadata_path = get_metadata_path(slot)
+    try:
+        with open(metadata_path + ".tmp", "w") as fp:
+            json.dump(metadata, fp, separators=(",", ":"))
+        os.replace(metadata_path + ".tmp", metadata_path)
+    except OSError as e:
+        logger.error(f"Unable to write save metadata {metadata_path}: {e}")
+
+
+def load_metadata(slot: int) -> Optional[SaveMetadata]:
+    """
+    Loads the metadata of a save, without reading the save itself.
+
+    Saves without metadata (or with stale metadata) are loaded once, and
+    their metadata is written for the next time.
+
+    Parameters:
+        slot: The save slot.
+
+    Returns:
+        The metadata, or ``None`` if there's no save in the slot.
+
+    """
+    save_path = get_save_path(slot)
+    save_writer.wait(save_path)
+    try:
+        stat = os.stat(save_path)
+    except OSError:
+        return None
+
+    metadata: Optional[SaveMetadata] = None
+    try:
+        with open(get_metadata_path(slot)) as fp:
+            metadata = json.load(fp)
+    except OSError:
+        pass
+    except ValueError as e:
+        logger.warning(f"Invalid save metadata for slot {slot}: {e}")
+
+    if (
+        metadata is not None
+        and metadata.get("version") == METADATA_VERSION
+        and metadata.get("save_size") == stat.st_size
+        and metadata.get("save_mtime_ns") == stat.st_mtime_ns
+    ):
+        return metadata
+
+    save_data = load(slot)
+    if save_data is None:
+        return None
+    if "error" in save_data:
+        return {
+            "player_name": save_data["player_name"],
+            "error": save_data["error"],  # type: ignore[typeddict-item]
+        }
+    metadata = make_metadata(save_data)
+    write_metadata(slot, metadata)
+    return metadata
+
+
 def open_save_file(save_path: str) -> Optional[dict[str, Any]]:
     package: dict[str, Any] = {}
+    save_writer.wait(save_path)
     try:
         try:
-            if config.compress_save is None and prepare.SAVE_METHOD == "CBOR":
-                package = cbor.load(save_path)
+            if config.compress_save is None:
+                with open(save_path, "rb") as fp:
+                    data = fp.read()
+                if is_compact(data):
+                    package = load_compact(data)
+                elif prepare.SAVE_METHOD == "CBOR":
+                    package = cbor.loads(data)
+                else:
+                    package = json.loads(data)
                 return package
             else:
                 package = json_load(save_path)
@@ -188,19 +412,68 @@ def open_save_file(save_path: str) -> Optional[dict[str, Any]]:
         return None
 
 
+def save_compact(
+    save_data: SaveData,
+    slot: int,
+    callback: Optional[SaveCallback] = None,
+) -> None:
+    """
+    Saves the game state in the compact format, in the background.
+
+    The state is serialized right away, the rest of the work (encoding the
+    screenshot, compressing, writing the save and its metadata) is done by
+    the save writer thread.
+
+    Parameters:
+        save_data: The data to save.
+        slot: The save slot to save the data to.
+        callback: Called on the game thread once the save is written.
+
+    """
+    save_path = get_save_path(slot)
+    state = {k: v for k, v in save_data.items() if k != "screenshot"}
+    metadata = make_metadata(state)  # type: ignore[arg-type]
+    serialized_state = dump_state(state)
+    pixels = base64.b64decode(save_data.get("screenshot", ""))
+    size = (
+        save_data.get("screenshot_width", 0),
+        save_data.get("screenshot_height", 0),
+    )
+
+    def write() -> None:
+        png = b""
+        if pixels:
+            screenshot = pygame.image.frombuffer(pixels, size, "RGB")
+            png = encode_png(screenshot)
+            metadata["thumbnail"] = make_thumbnail(screenshot)
+        write_file(save_path, dump_compact(serialized_state, png))
+        write_metadata(slot, metadata)
+
+    logger.info("Saving data to save file: %s", save_path)
+    save_writer.submit(save_path, write, callback)
+
+
 def save(
     save_data: SaveData,
     slot: int,
+    callback: Optional[SaveCallback] = None,
 ) -> None:
     """
-    Saves the current game state to a file using gzip compressed JSON.
+    Saves the current game state to a file.
+
+    Compact saves are written in the background, the other formats are
+    written before returning.
 
     Parameters:
         save_data: The data to save.
         slot: The save slot to save the data to.
+        callback: Called on the game thread once the save is written, with
+            the error if the save failed.
 
     """
-    # Save a screenshot of the current frame
+    if config.compress_save is None and prepare.SAVE_METHOD == "COMPACT":
+        save_compact(save_data, slot, callback)
+        return
 
     save_path = get_save_path(slot)
     save_path_tmp = save_path + ".tmp"
@@ -211,7 +484,8 @@ def save(
 
     logger.info("Saving data to save file: %s", save_path)
     if config.compress_save is None and prepare.SAVE_METHOD == "CBOR":
-        cbor.dump(save_data, save_path_tmp)
+        with open(save_path_tmp, "wb") as fp:
+            cbor.dump(save_data, fp)
     else:
         json_dump(save_data, save_path_tmp, json_kwargs=json_kwargs)
 
@@ -219,6 +493,9 @@ def save(
     # the save_data
     # We use a temporal file plus atomic replacement instead
     os.replace(save_path_tmp, save_path)
+    write_metadata(slot, make_metadata(save_data))
+    if callback is not None:
+        callback(None)
 
 
 def load(slot: int) -> Optional[SaveData]:
@@ -250,11 +527,10 @@ def load(slot: int) -> Optional[SaveData]:
 def get_index_of_latest_save() -> Optional[int]:
     times = []
     for slot_index in range(3):
-        save_path = get_save_path(slot_index + 1)
-        save_data = open_save_file(save_path)
-        if save_data is not None:
+        metadata = load_metadata(slot_index + 1)
+        if metadata is not None and "time" in metadata:
             time_of_save = datetime.datetime.strptime(
-                save_data["time"],
+                metadata["time"],
                 TIME_FORMAT,
             )
             times.append((slot_index, time_of_save))
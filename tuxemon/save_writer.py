@@ -0,0 +1,250 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+"""
+Compact save format and background writing of the saves.
+
+A compact save is made of a small header, the screenshot as PNG and the
+game state as minified JSON compressed with zlib::
+
+    MAGIC | version (1 byte) | PNG size (4 bytes) | PNG | zlib(JSON)
+
+The state is serialized on the game thread, so later changes to the game
+can't leak into the save. Encoding the screenshot, compressing and writing
+the file are done by :class:`SaveWriter` in a background thread.
+"""
+from __future__ import annotations
+
+import base64
+import io
+import json
+import logging
+import os
+import struct
+import threading
+import zlib
+from collections.abc import Callable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Optional
+
+import pygame
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"TUXSAVE"
+COMPACT_VERSION = 1
+COMPRESSION_LEVEL = 6
+_HEADER = struct.Struct(">BI")
+
+SaveCallback = Callable[[Optional[BaseException]], None]
+
+
+def is_compact(data: bytes) -> bool:
+    return data.startswith(MAGIC)
+
+
+def encode_png(surface: pygame.surface.Surface) -> bytes:
+    """
+    Encodes an image as PNG.
+
+    Parameters:
+        surface: The image.
+
+    Returns:
+        The PNG file contents.
+
+    """
+    data = io.BytesIO()
+    pygame.image.save(surface, data, "png")
+    return data.getvalue()
+
+
+def dump_state(state: Mapping[str, Any]) -> bytes:
+    """
+    Serializes the game state, without the screenshot.
+
+    Parameters:
+        state: The save data.
+
+    Returns:
+        The minified JSON.
+
+    """
+    return json.dumps(
+        state, separators=(",", ":"), ensure_ascii=False
+    ).encode()
+
+
+def dump_compact(state: bytes, screenshot: bytes = b"") -> bytes:
+    """
+    Builds a compact save.
+
+    Parameters:
+        state: The serialized state, see :func:`dump_state`.
+        screenshot: The screenshot as PNG, if any.
+
+    Returns:
+        The save file contents.
+
+    """
+    return b"".join(
+        (
+            MAGIC,
+            _HEADER.pack(COMPACT_VERSION, len(screenshot)),
+            screenshot,
+            zlib.compress(state, COMPRESSION_LEVEL),
+        )
+    )
+
+
+def load_compact(data: bytes) -> dict[str, Any]:
+    """
+    Reads a compact save.
+
+    The screenshot is returned base64 encoded as ``screenshot``, with
+    ``screenshot_format`` set to ``"png"``.
+
+    Parameters:
+        data: The save file contents.
+
+    Returns:
+        The save data.
+
+    Raises:
+        ValueError: If the save is invalid or from a newer version.
+
+    """
+    if not is_compact(data):
+        raise ValueError("Not a compact save")
+    offset = len(MAGIC)
+    try:
+        version, png_size = _HEADER.unpack_from(data, offset)
+    except struct.error as e:
+        raise ValueError(f"Invalid save header: {e}") from e
+    if version > COMPACT_VERSION:
+        raise ValueError(f"Unsupported compact save version {version}")
+    offset += _HEADER.size
+    screenshot = data[offset : offset + png_size]
+    try:
+        state: dict[str, Any] = json.loads(
+            zlib.decompress(data[offset + png_size :])
+        )
+    except zlib.error as e:
+        raise ValueError(f"Invalid save data: {e}") from e
+    if screenshot:
+        state["screenshot"] = base64.b64encode(screenshot).decode()
+        state["screenshot_format"] = "png"
+    return state
+
+
+def write_file(path: str, data: bytes) -> None:
+    """
+    Writes a file atomically, through a temporary file.
+
+    Parameters:
+        path: Path of the file.
+        data: Contents of the file.
+
+    """
+    path_tmp = path + ".tmp"
+    with open(path_tmp, "wb") as fp:
+        fp.write(data)
+    os.replace(path_tmp, path)
+
+
+class SaveWriter:
+    """
+    Writes the saves in a background thread.
+
+    Writes are done in order, by a single thread. Completion callbacks are
+    run by :meth:`poll` on the thread calling it, which should be the game
+    thread so they can safely open dialogs and such.
+
+    """
+
+    def __init__(self) -> None:
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: dict[str, Future[None]] = {}
+        self._callbacks: list[tuple[Future[None], SaveCallback]] = []
+        self._lock = threading.Lock()
+
+    def submit(
+        self,
+        path: str,
+        write: Callable[[], None],
+        callback: Optional[SaveCallback] = None,
+    ) -> Future[None]:
+        """
+        Schedules the writing of a save.
+
+        Parameters:
+            path: Path of the save file.
+            write: Function writing the save.
+            callback: Called by :meth:`poll` once the save is written, with
+                the exception raised while writing, if any.
+
+        Returns:
+            The future of the write.
+
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix="save_writer"
+                )
+            future = self._executor.submit(self._write, path, write)
+            self._pending[path] = future
+        if callback is not None:
+            self._callbacks.append((future, callback))
+        return future
+
+    def _write(self, path: str, write: Callable[[], None]) -> None:
+        try:
+            write()
+        except Exception:
+            logger.exception(f"Unable to write save '{path}'")
+            raise
+        logger.info(f"Save written: {path}")
+
+    def wait(self, path: str) -> None:
+        """
+        Blocks until the pending write of a save, if any, is done.
+
+        Parameters:
+            path: Path of the save file.
+
+        """
+        with self._lock:
+            future = self._pending.get(path)
+        if future is not None:
+            future.exception()
+            with self._lock:
+                if self._pending.get(path) is future:
+                    del self._pending[path]
+
+    def flush(self) -> None:
+        """Blocks until all the pending writes are done."""
+        with self._lock:
+            paths = list(self._pending)
+        for path in paths:
+            self.wait(path)
+
+    def poll(self) -> None:
+        """Runs the callbacks of the finished writes."""
+        if not self._callbacks:
+            return
+        pending = []
+        for future, callback in self._callbacks:
+            if future.done():
+                callback(future.exception())
+            else:
+                pending.append((future, callback))
+        self._callbacks = pending
+
+    @property
+    def busy(self) -> bool:
+        """Whether a save is still being written."""
+        with self._lock:
+            return any(not f.done() for f in self._pending.values())
+
+
+save_writer = SaveWriter()
@@ -0,0 +1,85 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+"""
+Objects built once per database entry and shared by every instance.
+
+Monsters, techniques and items are created from their database entry by
+slug. The part that only depends on the entry (translated texts, effect
+and condition objects, elements, ...) is the same for every instance of a
+slug, so it's built once into a template and the instances refer to it::
+
+    technique_templates = SlugCache("technique", TechniqueTemplate)
+    template = technique_templates.get("technique_fireball")
+
+A template is rebuilt when its entry is replaced in the database (e.g.
+the database is loaded again) or when the language changes. Templates are
+shared, they must not be modified.
+"""
+from __future__ import annotations
+
+import logging
+from collections.abc import Callable
+from typing import Any, Generic, TypeVar
+
+from tuxemon.db import TableName, db
+from tuxemon.locale import T
+
+logger = logging.getLogger(__name__)
+
+TemplateType = TypeVar("TemplateType")
+
+
+class SlugCache(Generic[TemplateType]):
+    """
+    Templates of the entries of a database table, by slug.
+
+    Parameters:
+        table: Table of the entries.
+        build: Builds the template of an entry.
+
+    """
+
+    def __init__(
+        self,
+        table: TableName,
+        build: Callable[[Any], TemplateType],
+    ) -> None:
+        self.table = table
+        self.build = build
+        self._templates: dict[
+            str, tuple[Any, Callable[[str], str], TemplateType]
+        ] = {}
+
+    def get(self, slug: str) -> TemplateType:
+        """
+        Returns the template of an entry, building it if needed.
+
+        Parameters:
+            slug: Slug of the entry.
+
+        Returns:
+            The template.
+
+        Raises:
+            KeyError: If the entry isn't in the database.
+
+        """
+        model = db.lookup(slug, table=self.table)
+        cached = self._templates.get(slug)
+        if (
+            cached is not None
+            and cached[0] is model
+            and cached[1] is T.translate
+        ):
+            return cached[2]
+        logger.debug("building %s template: %s", self.table, slug)
+        template = self.build(model)
+        self._templates[slug] = (model, T.translate, template)
+        return template
+
+    def clear(self) -> None:
+        """Forgets the templates, they are built again when needed."""
+        self._templates.clear()
+
+    def __len__(self) -> int:
+        return len(self._templates)
@@ -35,9 +35,8 @@ from __future__ import annotations
 
 import logging
 import random
-from collections.abc import Iterable, MutableMapping, Sequence
+from collections.abc import MutableMapping, Sequence
 from functools import partial
-from itertools import chain
 from typing import Any, Literal, Optional, Union
 
 import pygame
@@ -51,7 +50,6 @@ from tuxemon.combat import (
     award_experience,
     award_money,
     battlefield,
-    defeated,
     fainted,
     get_awake_monsters,
     get_winners,
@@ -63,7 +61,6 @@ from tuxemon.db import (
     BattleGraphicsModel,
     ItemCategory,
     PlagueType,
-    TargetType,
 )
 from tuxemon.item.item import Item
 from tuxemon.locale import T
@@ -72,6 +69,7 @@ from tuxemon.monster import Monster
 from tuxemon.npc import NPC
 from tuxemon.platform.const import buttons
 from tuxemon.platform.events import PlayerInput
+from tuxemon.prefetch import AssetPrefetcher
 from tuxemon.session import local_session
 from tuxemon.sprite import Sprite
 from tuxemon.states.monster import MonsterMenuState
@@ -88,6 +86,7 @@ from .combat_classes import (
     EnqueuedAction,
     MethodAnimationCache,
 )
+from .combat_rules import CombatRules
 
 logger = logging.getLogger(__name__)
 
@@ -130,7 +129,7 @@ class WaitForInputState(state.State):
         return None
 
 
-class CombatState(CombatAnimations):
+class CombatState(CombatRules, CombatAnimations):
     """The state-menu responsible for all combat related tasks and functions.
         .. image:: images/combat/monster_drawing01.png
 
@@ -159,6 +158,8 @@ class CombatState(CombatAnimations):
         self.phase: Optional[CombatPhase] = None
         self._damage_map: list[DamageReport] = []
         self._method_cache = MethodAnimationCache()
+        self._capture_devices: dict[str, Item] = {}
+        self._released_sprites: set[Sprite] = set()
         self._action_queue = ActionQueue()
         self._decision_queue: list[Monster] = []
         self._pending_queue: list[EnqueuedAction] = []
@@ -178,11 +179,77 @@ class CombatState(CombatAnimations):
         self._combat_variables: dict[str, Any] = {}
 
         super().__init__(players, graphics)
+        self._prefetcher = AssetPrefetcher(self.client.sound_manager)
+        self.prefetch_assets()
         self.is_trainer_battle = combat_type == "trainer"
         self.show_combat_dialog()
         self.transition_phase("begin")
         self.task(partial(setattr, self, "phase", "ready"), 3)
 
+    def prefetch_assets(self) -> None:
+        """
+        Starts loading the animations and sounds the battle may need.
+
+        Every technique, status and item either side could use, and the
+        capture devices, are loaded in the background during the intro.
+        The animated sprites are then built ahead of their first use.
+
+        """
+        methods: list[tuple[Union[Technique, Condition, Item], bool]] = []
+        sounds: list[str] = []
+        for player in self.players:
+            # same flipping as play_animation
+            flipped = not player.isplayer
+            for monster in player.monsters:
+                methods.extend((tech, flipped) for tech in monster.moves)
+                methods.extend((status, False) for status in monster.status)
+                capture_device = self.get_capture_device(
+                    monster.capture_device
+                )
+                if (capture_device, False) not in methods:
+                    methods.append((capture_device, False))
+                sounds += [monster.combat_call, monster.faint_call]
+            methods.extend((item, False) for item in player.items)
+
+        methods = [
+            (method, flip) for method, flip in methods if method.animation
+        ]
+        sounds += [
+            method.sfx
+            for method, _ in methods
+            if isinstance(method, (Technique, Condition))
+        ]
+        self._prefetcher.start(
+            [method.animation for method, _ in methods if method.animation],
+            sounds,
+            [
+                partial(self._method_cache.get, method, flip)
+                for method, flip in methods
+            ],
+        )
+
+    def get_capture_device(self, slug: str) -> Item:
+        """
+        Returns the capture device shown when monsters are released.
+
+        One item is kept per capture device, so its animation (which is
+        cached per item) is built once, ahead of time by
+        :meth:`prefetch_assets`, and reused by every release.
+
+        Parameters:
+            slug: Slug of the capture device.
+
+        Returns:
+            The capture device.
+
+        """
+        capture_device = self._capture_devices.get(slug)
+        if capture_device is None:
+            capture_device = Item()
+            capture_device.load(slug)
+            self._capture_devices[slug] = capture_device
+        return capture_device
+
     @staticmethod
     def is_task_finished(task: Union[Task, Animation]) -> bool:
         """
@@ -231,6 +298,8 @@ class CombatState(CombatAnimations):
         This method is responsible for updating the text animation and the combat phase.
         """
         super().update(time_delta)
+        if not self._prefetcher.done:
+            self._prefetcher.update()
         self._text_animation_time_left -= time_delta
         self.update_text_animation()
         self.update_combat_phase()
@@ -400,9 +469,13 @@ class CombatState(CombatAnimations):
 
         """
         message = None
-        if phase == "begin" or phase == "ready" or phase == "pre action phase":
+        if phase == "begin" or phase == "ready":
             pass
 
+        elif phase == "pre action phase":
+            # what is left is loaded now, rather than in the middle of a move
+            self._prefetcher.finish()
+
         elif phase == "housekeeping phase":
             self._turn += 1
             # fill all battlefield positions, but on round 1, don't ask
@@ -432,31 +505,7 @@ class CombatState(CombatAnimations):
             self._action_queue.sort()
 
         elif phase == "post action phase":
-            # remove actions from fainted users from the pending queue
-            self._pending_queue = [
-                pend
-                for pend in self._pending_queue
-                if pend.user
-                and isinstance(pend.user, Monster)
-                and not (fainted(pend.user) or fainted(pend.target))
-            ]
-
-            # apply condition effects to the monsters
-            for monster in self.active_monsters:
-                # Check if there are pending actions (e.g. counterattacks)
-                while self._pending_queue:
-                    pend = self._pending_queue.pop(0)
-                    self.enqueue_action(pend.user, pend.method, pend.target)
-
-                for condition in monster.status:
-                    # validate condition
-                    if condition.validate(monster):
-                        condition.combat_state = self
-                        # update counter nr turns
-                        condition.nr_turn += 1
-                        self.enqueue_action(None, condition, monster)
-                    # avoid multiple effect condition
-                    monster.set_stats()
+            self.enqueue_post_actions()
 
         elif phase == "resolve match" or phase == "ran away":
             pass
@@ -617,11 +666,23 @@ class CombatState(CombatAnimations):
             removed: Monster that was previously in play, if any.
 
         """
-        capture_device = Item()
-        capture_device.load(monster.capture_device)
+        capture_device = self.get_capture_device(monster.capture_device)
         sprite = self._method_cache.get(capture_device, False)
+        if sprite in self._released_sprites:
+            # the same capture device is already being released (e.g. both
+            # monsters of a double battle), each release needs its sprite
+            sprite = self._method_cache.load_method_animation(
+                capture_device, False
+            )
         if not sprite:
             raise ValueError(f"Sprite not found for item {capture_device}")
+        assert sprite.animation
+        self._released_sprites.add(sprite)
+        # same delay as animate_monster_release
+        self.task(
+            partial(self._released_sprites.discard, sprite),
+            1.3 + sprite.animation.duration,
+        )
 
         self.monsters_in_play[player].append(monster)
         self.animate_monster_release(player, monster, sprite)
@@ -746,39 +807,6 @@ class CombatState(CombatAnimations):
         rect.bottomright = rect_screen.w, rect_screen.h
         return rect
 
-    def enqueue_damage(
-        self, attacker: Monster, defender: Monster, damage: int
-    ) -> None:
-        """
-        Add damages to damage map.
-
-        Parameters:
-            attacker: Monster.
-            defender: Monster.
-            damage: Quantity of damage.
-
-        """
-        damage_map = DamageReport(attacker, defender, damage)
-        self._damage_map.append(damage_map)
-
-    def enqueue_action(
-        self,
-        user: Union[NPC, Monster, None],
-        technique: Union[Item, Technique, Condition, None],
-        target: Monster,
-    ) -> None:
-        """
-        Add some technique or status to the action queue.
-
-        Parameters:
-            user: The user of the technique.
-            technique: The technique used.
-            target: The target of the action.
-
-        """
-        action = EnqueuedAction(user, technique, target)
-        self._action_queue.enqueue(action, self._turn)
-
     def remove_monster_from_play(
         self,
         monster: Monster,
@@ -794,23 +822,6 @@ class CombatState(CombatAnimations):
         self.remove_monster_actions_from_queue(monster)
         self.animate_monster_faint(monster)
 
-    def remove_monster_actions_from_queue(self, monster: Monster) -> None:
-        """
-        Remove all queued actions for a particular monster.
-
-        This is used mainly for removing actions after monster is fainted.
-
-        Parameters:
-            monster: Monster whose actions will be removed.
-
-        """
-        action_queue = self._action_queue.queue
-        action_queue[:] = [
-            action
-            for action in action_queue
-            if action.user is not monster and action.target is not monster
-        ]
-
     def perform_action(
         self,
         user: Union[Monster, NPC, None],
@@ -846,9 +857,7 @@ class CombatState(CombatAnimations):
         # is synchronized with the damage shake motion
         hit_delay = 0.0
         # monster uses move
-        method.advance_round()
-        method.combat_state = self
-        result_tech = method.use(user, target)
+        result_tech = self.use_technique(user, method, target)
         context = {
             "user": user.name,
             "name": method.name,
@@ -861,19 +870,11 @@ class CombatState(CombatAnimations):
             params = {"name": target.name.upper()}
             message = T.format("combat_call_tuxemon", params)
         # check statuses
-        if user.status:
-            user.status[0].combat_state = self
-            user.status[0].phase = "perform_action_tech"
-            result_status = user.status[0].use(user)
-            if result_status.extras:
-                templates = [
-                    T.translate(extra) for extra in result_status.extras
-                ]
-                template = "\n".join(templates)
-                message += "\n" + template
-            if result_status.conditions:
-                status = random.choice(result_status.conditions)
-                user.apply_status(status)
+        result_status = self.use_user_status(user)
+        if result_status and result_status.extras:
+            templates = [T.translate(extra) for extra in result_status.extras]
+            template = "\n".join(templates)
+            message += "\n" + template
 
         if result_tech["success"] and method.use_success:
             template = getattr(method, "use_success")
@@ -1003,10 +1004,7 @@ class CombatState(CombatAnimations):
 
     def _handle_condition(self, condition: Condition, target: Monster) -> None:
         action_time = 0.0
-        condition.combat_state = self
-        condition.phase = "perform_action_status"
-        condition.advance_round()
-        result = condition.use(target)
+        result = self.use_condition(condition, target)
         context = {
             "name": condition.name,
             "target": target.name,
@@ -1194,19 +1192,14 @@ class CombatState(CombatAnimations):
         Parameters:
             monster: Monster that was defeated.
         """
-        if monster.status:
-            monster.status[0].combat_state = self
-            monster.status[0].phase = "check_party_hp"
-            result_status = monster.status[0].use(monster)
-            if result_status.extras:
-                templates = [
-                    T.translate(extra) for extra in result_status.extras
-                ]
-                extra = "\n".join(templates)
-                action_time = compute_text_animation_time(extra)
-                self.text_animations_queue.append(
-                    (partial(self.alert, extra), action_time)
-                )
+        result_status = self.use_status_effects(monster)
+        if result_status and result_status.extras:
+            templates = [T.translate(extra) for extra in result_status.extras]
+            extra = "\n".join(templates)
+            action_time = compute_text_animation_time(extra)
+            self.text_animations_queue.append(
+                (partial(self.alert, extra), action_time)
+            )
 
     def handle_monster_defeat(self, monster: Monster) -> None:
         """
@@ -1220,225 +1213,11 @@ class CombatState(CombatAnimations):
         self.faint_monster(monster)
         self.award_experience_and_money(monster)
         # Remove monster from damage map
-        self._damage_map = [
-            element
-            for element in self._damage_map
-            if element.defense != monster and element.attack != monster
-        ]
-
-    @property
-    def active_players(self) -> Iterable[NPC]:
-        """
-        Generator of any non-defeated players/trainers.
-
-        Returns:
-            Iterable with active players.
-
-        """
-        for player in self.players:
-            if not defeated(player):
-                yield player
-
-    @property
-    def human_players(self) -> Iterable[NPC]:
-        for player in self.players:
-            if player.isplayer:
-                yield player
-
-    @property
-    def ai_players(self) -> Iterable[NPC]:
-        yield from set(self.active_players) - set(self.human_players)
-
-    @property
-    def active_monsters(self) -> Sequence[Monster]:
-        """
-        List of any non-defeated monsters on battlefield.
-
-        Returns:
-            Sequence of active monsters.
-        """
-        return list(chain.from_iterable(self.monsters_in_play.values()))
-
-    @property
-    def monsters_in_play_right(self) -> Sequence[Monster]:
-        """
-        List of any monsters in battle (right side).
-        """
-        return self.monsters_in_play[self.players[0]]
-
-    @property
-    def monsters_in_play_left(self) -> Sequence[Monster]:
-        """
-        List of any monsters in battle (left side).
-        """
-        return self.monsters_in_play[self.players[1]]
-
-    @property
-    def all_monsters_right(self) -> Sequence[Monster]:
-        """
-        List of all monsters on the right side of the battle that have not fainted.
-        """
-        return [
-            monster
-            for monster in self.players[0].monsters
-            if not fainted(monster)
-        ]
-
-    @property
-    def all_monsters_left(self) -> Sequence[Monster]:
-        """
-        List of all monsters on the left side of the battle that have not fainted.
-        """
-        return [
-            monster
-            for monster in self.players[1].monsters
-            if not fainted(monster)
-        ]
-
-    @property
-    def defeated_players(self) -> Sequence[NPC]:
-        """
-        List of defeated players/trainers.
-        """
-        return [p for p in self.players if defeated(p)]
-
-    @property
-    def remaining_players(self) -> Sequence[NPC]:
-        """
-        List of non-defeated players/trainers. WIP.
-
-        Right now, this is similar to Combat.active_players, but it may change
-        in the future.
-        For implementing teams, this would need to be different than
-        active_players.
-
-        Use to check for match winner.
-
-        Returns:
-            Sequence of remaining players.
-        """
-        # TODO: perhaps change this to remaining "parties", or "teams",
-        # instead of player/trainer
-        return [p for p in self.players if not defeated(p)]
-
-    def get_targets_from_map(
-        self, target_type: str, user: Monster, target: Monster
-    ) -> list[Monster]:
-        """
-        Get the targets from the target map.
-
-        Parameters:
-            target_type: The type of target (e.g. "own_monster", etc.)
-            user: The Monster object that used the technique.
-            target: The Monster object being targeted by the technique.
-        Returns:
-            A list of Monster objects.
-        """
-        target_map = {
-            "enemy_monster": [target],
-            "enemy_team": self.get_own_monsters(target),
-            "enemy_trainer": self.get_party(target),
-            "own_monster": [user],
-            "own_team": self.get_own_monsters(user),
-            "own_trainer": self.get_party(user),
-        }
-
-        return list(target_map.get(target_type, []))
-
-    def get_targets(
-        self, tech: Technique, user: Monster, target: Monster
-    ) -> list[Monster]:
-        """
-        Get the targets.
-
-        Parameters:
-            tech: The Technique object that is being applied.
-            user: The Monster object that used the technique.
-            target: The Monster object being targeted by the technique.
-
-        Returns:
-            A list of Monster objects.
-        """
-        targets: set[Monster] = set()
-        for target_type in list(TargetType):
-            if tech.target[target_type]:
-                targets.update(
-                    self.get_targets_from_map(target_type, user, target)
-                )
-
-        if not targets:
-            logger.error(f"{tech.name} has all its targets set to False")
-
-        return list(targets)
-
-    def get_opponent_monsters(self, monster: Monster) -> Sequence[Monster]:
-        """
-        Get the sequence of the monster's opponent side.
-
-        Parameters:
-            monster: The Monster object.
-
-        Returns:
-            A sequence of Monster objects.
-        """
-        if monster in self.monsters_in_play_right:
-            return self.monsters_in_play_left
-        else:
-            return self.monsters_in_play_right
-
-    def get_own_monsters(self, monster: Monster) -> Sequence[Monster]:
-        """
-        Get the sequence of the monster's own side.
-
-        Parameters:
-            monster: The Monster object.
-
-        Returns:
-            A sequence of Monster objects.
-        """
-        if monster in self.monsters_in_play_right:
-            return self.monsters_in_play_right
-        else:
-            return self.monsters_in_play_left
-
-    def get_party(self, monster: Monster) -> Sequence[Monster]:
-        """
-        Get the sequence of the not fainted monster's own party.
-
-        Parameters:
-            monster: The Monster object.
-
-        Returns:
-            A sequence of Monster objects.
-        """
-        if monster in self.monsters_in_play_right:
-            return self.all_monsters_right
-        else:
-            return self.all_monsters_left
-
-    def clean_combat(self) -> None:
-        """Clean combat."""
-        for player in self.players:
-            player.max_position = 1
-            for mon in player.monsters:
-                # reset status stats
-                mon.set_stats()
-                mon.end_combat()
-                # reset type
-                mon.reset_types()
-                # reset technique stats
-                for tech in mon.moves:
-                    tech.set_stats()
-
-        # clear action queue
-        self._action_queue.clear_queue()
-        self._action_queue.clear_history()
-        self._pending_queue = []
-        self._damage_map = []
-        self._combat_variables = {}
+        self.drop_damages(monster)
 
     def end_combat(self) -> None:
         """End the combat."""
+        self._prefetcher.cancel()
         self.clean_combat()
 
         # fade music out
@@ -0,0 +1,439 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+"""
+Rules of the combat, without any graphics.
+
+:class:`CombatRules` is shared by the combat state and by the headless
+combat used for simulations (see :mod:`tuxemon.states.combat.headless`),
+so both play by the same rules. Anything drawing, animating or talking to
+the player stays in the combat state.
+"""
+from __future__ import annotations
+
+import logging
+import random
+from collections.abc import Iterable, Sequence
+from itertools import chain
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from tuxemon.combat import defeated, fainted
+from tuxemon.condition.condition import Condition
+from tuxemon.db import TargetType
+from tuxemon.item.item import Item
+from tuxemon.monster import Monster
+from tuxemon.npc import NPC
+from tuxemon.technique.technique import Technique
+
+from .combat_classes import ActionQueue, DamageReport, EnqueuedAction
+
+if TYPE_CHECKING:
+    from tuxemon.condition.condeffect import CondEffectResult
+    from tuxemon.technique.techeffect import TechEffectResult
+
+logger = logging.getLogger(__name__)
+
+
+class CombatRules:
+    """
+    Combat logic shared by the interactive and the headless combats.
+
+    The subclasses set up the attributes below.
+
+    """
+
+    players: list[NPC]
+    monsters_in_play: dict[NPC, list[Monster]]
+    is_trainer_battle: bool
+    _action_queue: ActionQueue
+    _pending_queue: list[EnqueuedAction]
+    _damage_map: list[DamageReport]
+    _turn: int
+    _random_tech_hit: dict[Monster, float]
+    _combat_variables: dict[str, Any]
+
+    def enqueue_damage(
+        self, attacker: Monster, defender: Monster, damage: int
+    ) -> None:
+        """
+        Add damages to damage map.
+
+        Parameters:
+            attacker: Monster.
+            defender: Monster.
+            damage: Quantity of damage.
+
+        """
+        damage_map = DamageReport(attacker, defender, damage)
+        self._damage_map.append(damage_map)
+
+    def enqueue_action(
+        self,
+        user: Union[NPC, Monster, None],
+        technique: Union[Item, Technique, Condition, None],
+        target: Monster,
+    ) -> None:
+        """
+        Add some technique or status to the action queue.
+
+        Parameters:
+            user: The user of the technique.
+            technique: The technique used.
+            target: The target of the action.
+
+        """
+        action = EnqueuedAction(user, technique, target)
+        self._action_queue.enqueue(action, self._turn)
+
+    def remove_monster_actions_from_queue(self, monster: Monster) -> None:
+        """
+        Remove all queued actions for a particular monster.
+
+        This is used mainly for removing actions after monster is fainted.
+
+        Parameters:
+            monster: Monster whose actions will be removed.
+
+        """
+        action_queue = self._action_queue.queue
+        action_queue[:] = [
+            action
+            for action in action_queue
+            if action.user is not monster and action.target is not monster
+        ]
+
+    def use_technique(
+        self, user: Monster, method: Technique, target: Monster
+    ) -> TechEffectResult:
+        """
+        Applies a technique.
+
+        Parameters:
+            user: Monster using the technique.
+            method: Technique used.
+            target: Monster targeted by the technique.
+
+        Returns:
+            The result of the technique.
+
+        """
+        method.advance_round()
+        method.combat_state = self  # type: ignore[assignment]
+        return method.use(user, target)
+
+    def use_user_status(self, user: Monster) -> Optional[CondEffectResult]:
+        """
+        Applies the status of a monster which just used a technique.
+
+        Conditions given by the status are applied to the monster.
+
+        Parameters:
+            user: Monster which used a technique.
+
+        Returns:
+            The result of the status, if the monster has one.
+
+        """
+        if not user.status:
+            return None
+        user.status[0].combat_state = self  # type: ignore[assignment]
+        user.status[0].phase = "perform_action_tech"
+        result_status = user.status[0].use(user)
+        if result_status.conditions:
+            status = random.choice(result_status.conditions)
+            user.apply_status(status)
+        return result_status
+
+    def use_condition(
+        self, condition: Condition, target: Monster
+    ) -> CondEffectResult:
+        """
+        Applies a condition enqueued in the post action phase.
+
+        Parameters:
+            condition: Condition applied.
+            target: Monster having the condition.
+
+        Returns:
+            The result of the condition.
+
+        """
+        condition.combat_state = self  # type: ignore[assignment]
+        condition.phase = "perform_action_status"
+        condition.advance_round()
+        return condition.use(target)
+
+    def use_status_effects(
+        self, monster: Monster
+    ) -> Optional[CondEffectResult]:
+        """
+        Applies the status of a monster, once its HP are checked.
+
+        Parameters:
+            monster: Monster whose status is applied.
+
+        Returns:
+            The result of the status, if the monster has one.
+
+        """
+        if not monster.status:
+            return None
+        monster.status[0].combat_state = self  # type: ignore[assignment]
+        monster.status[0].phase = "check_party_hp"
+        return monster.status[0].use(monster)
+
+    def enqueue_post_actions(self) -> None:
+        """
+        Enqueues the pending actions (e.g. counterattacks) and the effects
+        of the conditions of the monsters.
+
+        """
+        # remove actions from fainted users from the pending queue
+        self._pending_queue = [
+            pend
+            for pend in self._pending_queue
+            if pend.user
+            and isinstance(pend.user, Monster)
+            and not (fainted(pend.user) or fainted(pend.target))
+        ]
+
+        # apply condition effects to the monsters
+        for monster in self.active_monsters:
+            # Check if there are pending actions (e.g. counterattacks)
+            while self._pending_queue:
+                pend = self._pending_queue.pop(0)
+                self.enqueue_action(pend.user, pend.method, pend.target)
+
+            for condition in monster.status:
+                # validate condition
+                if condition.validate(monster):
+                    condition.combat_state = self  # type: ignore[assignment]
+                    # update counter nr turns
+                    condition.nr_turn += 1
+                    self.enqueue_action(None, condition, monster)
+                # avoid multiple effect condition
+                monster.set_stats()
+
+    def drop_damages(self, monster: Monster) -> None:
+        """
+        Removes a fainted monster from the damage map.
+
+        Parameters:
+            monster: Monster that was defeated.
+
+        """
+        self._damage_map = [
+            element
+            for element in self._damage_map
+            if element.defense != monster and element.attack != monster
+        ]
+
+    @property
+    def active_players(self) -> Iterable[NPC]:
+        """
+        Generator of any non-defeated players/trainers.
+
+        Returns:
+            Iterable with active players.
+
+        """
+        for player in self.players:
+            if not defeated(player):
+                yield player
+
+    @property
+    def human_players(self) -> Iterable[NPC]:
+        for player in self.players:
+            if player.isplayer:
+                yield player
+
+    @property
+    def ai_players(self) -> Iterable[NPC]:
+        yield from set(self.active_players) - set(self.human_players)
+
+    @property
+    def active_monsters(self) -> Sequence[Monster]:
+        """
+        List of any non-defeated monsters on battlefield.
+
+        Returns:
+            Sequence of active monsters.
+        """
+        return list(chain.from_iterable(self.monsters_in_play.values()))
+
+    @property
+    def monsters_in_play_right(self) -> Sequence[Monster]:
+        """
+        List of any monsters in battle (right side).
+        """
+        return self.monsters_in_play[self.players[0]]
+
+    @property
+    def monsters_in_play_left(self) -> Sequence[Monster]:
+        """
+        List of any monsters in battle (left side).
+        """
+        return self.monsters_in_play[self.players[1]]
+
+    @property
+    def all_monsters_right(self) -> Sequence[Monster]:
+        """
+        List of all monsters on the right side of the battle that have not fainted.
+        """
+        return [
+            monster
+            for monster in self.players[0].monsters
+            if not fainted(monster)
+        ]
+
+    @property
+    def all_monsters_left(self) -> Sequence[Monster]:
+        """
+        List of all monsters on the left side of the battle that have not fainted.
+        """
+        return [
+            monster
+            for monster in self.players[1].monsters
+            if not fainted(monster)
+        ]
+
+    @property
+    def defeated_players(self) -> Sequence[NPC]:
+        """
+        List of defeated players/trainers.
+        """
+        return [p for p in self.players if defeated(p)]
+
+    @property
+    def remaining_players(self) -> Sequence[NPC]:
+        """
+        List of non-defeated players/trainers. WIP.
+
+        Right now, this is similar to Combat.active_players, but it may change
+        in the future.
+        For implementing teams, this would need to be different than
+        active_players.
+
+        Use to check for match winner.
+
+        Returns:
+            Sequence of remaining players.
+        """
+        # TODO: perhaps change this to remaining "parties", or "teams",
+        # instead of player/trainer
+        return [p for p in self.players if not defeated(p)]
+
+    def get_targets_from_map(
+        self, target_type: str, user: Monster, target: Monster
+    ) -> list[Monster]:
+        """
+        Get the targets from the target map.
+
+        Parameters:
+            target_type: The type of target (e.g. "own_monster", etc.)
+            user: The Monster object that used the technique.
+            target: The Monster object being targeted by the technique.
+        Returns:
+            A list of Monster objects.
+        """
+        target_map = {
+            "enemy_monster": [target],
+            "enemy_team": self.get_own_monsters(target),
+            "enemy_trainer": self.get_party(target),
+            "own_monster": [user],
+            "own_team": self.get_own_monsters(user),
+            "own_trainer": self.get_party(user),
+        }
+
+        return list(target_map.get(target_type, []))
+
+    def get_targets(
+        self, tech: Technique, user: Monster, target: Monster
+    ) -> list[Monster]:
+        """
+        Get the targets.
+
+        Parameters:
+            tech: The Technique object that is being applied.
+            user: The Monster object that used the technique.
+            target: The Monster object being targeted by the technique.
+
+        Returns:
+            A list of Monster objects.
+        """
+        targets: set[Monster] = set()
+        for target_type in list(TargetType):
+            if tech.target[target_type]:
+                targets.update(
+                    self.get_targets_from_map(target_type, user, target)
+                )
+
+        if not targets:
+            logger.error(f"{tech.name} has all its targets set to False")
+
+        return list(targets)
+
+    def get_opponent_monsters(self, monster: Monster) -> Sequence[Monster]:
+        """
+        Get the sequence of the monster's opponent side.
+
+        Parameters:
+            monster: The Monster object.
+
+        Returns:
+            A sequence of Monster objects.
+        """
+        if monster in self.monsters_in_play_right:
+            return self.monsters_in_play_left
+        else:
+            return self.monsters_in_play_right
+
+    def get_own_monsters(self, monster: Monster) -> Sequence[Monster]:
+        """
+        Get the sequence of the monster's own side.
+
+        Parameters:
+            monster: The Monster object.
+
+        Returns:
+            A sequence of Monster objects.
+        """
+        if monster in self.monsters_in_play_right:
+            return self.monsters_in_play_right
+        else:
+            return self.monsters_in_play_left
+
+    def get_party(self, monster: Monster) -> Sequence[Monster]:
+        """
+        Get the sequence of the not fainted monster's own party.
+
+        Parameters:
+            monster: The Monster object.
+
+        Returns:
+            A sequence of Monster objects.
+        """
+        if monster in self.monsters_in_play_right:
+            return self.all_monsters_right
+        else:
+            return self.all_monsters_left
+
+    def clean_combat(self) -> None:
+        """Clean combat."""
+        for player in self.players:
+            player.max_position = 1
+            for mon in player.monsters:
+                # reset status stats
+                mon.set_stats()
+                mon.end_combat()
+                # reset type
+                mon.reset_types()
+                # reset technique stats
+                for tech in mon.moves:
+                    tech.set_stats()
+
+        # clear action queue
+        self._action_queue.clear_queue()
+        self._action_queue.clear_history()
+        self._pending_queue = []
+        self._damage_map = []
+        self._combat_variables = {}
@@ -0,0 +1,472 @@
+# SPDX-License-Identifier: GPL-3.0
+# Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
+"""
+Headless combat, to simulate battles without a client.
+
+The battle runs with the same rules as :class:`CombatState` (see
+:class:`CombatRules`), the same techniques, conditions and AI, but without
+sprites, animations, dialogs or a session. Both sides are controlled by the
+AI and a whole battle is played by a single call to
+:meth:`HeadlessCombat.run`.
+
+Effects which need a running game (e.g. giving money to the player) can't
+work here: they are counted as errors and the action is skipped.
+"""
+from __future__ import annotations
+
+import logging
+import random
+import uuid
+from collections import Counter, defaultdict
+from collections.abc import Callable, Sequence
+from functools import partial
+from typing import Any, NamedTuple, Optional, Union
+
+from tuxemon.ai import AI
+from tuxemon.combat import (
+    alive_party,
+    award_experience,
+    fainted,
+    get_awake_monsters,
+    get_winners,
+)
+from tuxemon.condition.condition import Condition
+from tuxemon.item.item import Item
+from tuxemon.monster import Monster
+from tuxemon.npc import NPC
+from tuxemon.technique.technique import Technique
+
+from .combat_classes import ActionQueue, DamageReport, EnqueuedAction
+from .combat_rules import CombatRules
+
+logger = logging.getLogger(__name__)
+
+MAX_TURNS = 100
+# Raised by what needs a running game: the session has no client or world
+# (AttributeError) and the states looked up aren't there (ValueError)
+NO_GAME_ERRORS = (AttributeError, ValueError)
+
+PartyMember = tuple[str, int]
+
+# kind and slug of the objects already skipped, to log them once
+_skipped: set[tuple[str, str]] = set()
+
+
+class HeadlessTrainer(NPC):
+    """
+    Trainer of a headless combat.
+
+    The trainer has the party, bag, boxes and variables of any NPC, but no
+    world, template or sprites: it can't be placed on a map.
+
+    Parameters:
+        slug: Slug of the trainer.
+        monsters: The party of the trainer.
+        items: The items of the trainer.
+
+    """
+
+    def __init__(
+        self,
+        slug: str,
+        monsters: Sequence[Monster],
+        items: Sequence[Item] = (),
+    ) -> None:
+        self.slug = slug
+        self.name = slug
+        self.instance_id = uuid.uuid4()
+        self.isplayer = False
+        self._initialize_attributes()
+        self.items = list(items)
+        for monster in monsters:
+            monster.owner = self
+            self.monsters.append(monster)
+
+
+class BattleResult(NamedTuple):
+    """
+    Outcome of a headless combat.
+
+    ``winner`` is the index of the winning side, ``None`` for a draw (or a
+    battle stopped after too many turns). ``techniques`` counts the uses,
+    successes and damage of every technique, by side.
+    """
+
+    winner: Optional[int]
+    turns: int
+    experience: int
+    techniques: dict[tuple[int, str], Counter[str]]
+    errors: int
+
+
+class HeadlessCombat(CombatRules):
+    """
+    Combat between two AI trainers, without any graphics.
+
+    Parameters:
+        players: The two trainers.
+        combat_type: Whether it's a trainer battle or a wild encounter.
+        max_turns: Number of turns after which the battle is a draw.
+
+    """
+
+    def __init__(
+        self,
+        players: tuple[NPC, NPC],
+        combat_type: str = "trainer",
+        max_turns: int = MAX_TURNS,
+    ) -> None:
+        self.players = list(players)
+        self.monsters_in_play: defaultdict[NPC, list[Monster]] = defaultdict(
+            list
+        )
+        self.is_trainer_battle = combat_type == "trainer"
+        self.max_turns = max_turns
+        self._action_queue = ActionQueue()
+        self._pending_queue: list[EnqueuedAction] = []
+        self._damage_map: list[DamageReport] = []
+        self._turn = 0
+        self._random_tech_hit: dict[Monster, float] = {}
+        self._combat_variables: dict[str, Any] = {}
+        self._monster_sprite_map: dict[Monster, Any] = {}
+        self._new_tuxepedia = False
+        self._run = False
+        self._experience = 0
+        self._errors = 0
+        self._techniques: dict[tuple[int, str], Counter[str]] = defaultdict(
+            Counter
+        )
+
+    def run(self) -> BattleResult:
+        """
+        Plays the whole battle.
+
+        Returns:
+            The outcome of the battle.
+
+        """
+        winner: Optional[int] = None
+        while self._turn < self.max_turns:
+            self.housekeeping_phase()
+            self.decision_phase()
+            self._action_queue.sort()
+            self.handle_action_queue()
+            self.enqueue_post_actions()
+            self.handle_action_queue()
+
+            remaining = self.remaining_players
+            if self._run or len(remaining) == 1:
+                if len(remaining) == 1:
+                    winner = self.players.index(remaining[0])
+                break
+            if not remaining:
+                break
+
+        self.clean_combat()
+        return BattleResult(
+            winner=winner,
+            turns=self._turn,
+            experience=self._experience,
+            techniques=dict(self._techniques),
+            errors=self._errors,
+        )
+
+    def housekeeping_phase(self) -> None:
+        """Starts a turn, filling the free positions of the battlefield."""
+        self._turn += 1
+        for player in list(self.active_players):
+            if len(alive_party(player)) == 1:
+                player.max_position = 1
+            positions_available = player.max_position - len(
+                self.monsters_in_play[player]
+            )
+            available = get_awake_monsters(
+                player, self.monsters_in_play[player], self._turn
+            )
+            for _ in range(positions_available):
+                monster = next(available, None)
+                if monster is not None:
+                    self.add_monster_into_play(player, monster)
+
+    def decision_phase(self) -> None:
+        """Lets the AI choose the action of every monster in play."""
+        for player in self.players:
+            for monster in self.monsters_in_play[player]:
+                self._random_tech_hit[monster] = random.random()
+                for tech in monster.moves:
+                    tech.recharge()
+                self.guard(
+                    partial(AI, self, monster, player),  # type: ignore[arg-type]
+                    "ai",
+                    monster.slug,
+                )
+
+    def handle_action_queue(self) -> None:
+        """Performs the enqueued actions, the last one first."""
+        while not self._action_queue.is_empty():
+            action = self._action_queue.pop()
+            self.perform_action(*action)
+            self.check_party_hp()
+
+    def perform_action(
+        self,
+        user: Union[Monster, NPC, None],
+        method: Union[Technique, Item, Condition, None],
+        target: Monster,
+    ) -> None:
+        """
+        Perform the action.
+
+        Parameters:
+            user: Monster or NPC that does the action.
+            method: Technique or item or condition used.
+            target: Monster that receives the action.
+
+        """
+        if isinstance(method, Technique) and isinstance(user, Monster):
+            self.guard(
+                partial(self._handle_monster_technique, user, method, target),
+                "technique",
+                method.slug,
+            )
+        if isinstance(method, Item) and isinstance(user, NPC):
+            method.combat_state = self  # type: ignore[assignment]
+            self.guard(partial(method.use, user, target), "item", method.slug)
+        if isinstance(method, Condition):
+            self.guard(
+                partial(self.use_condition, method, target),
+                "condition",
+                method.slug,
+            )
+
+    def _handle_monster_technique(
+        self, user: Monster, method: Technique, target: Monster
+    ) -> None:
+        result = self.use_technique(user, method, target)
+        self.use_user_status(user)
+        if result["should_tackle"]:
+            self.enqueue_damage(user, target, result["damage"])
+
+        side = self.side(user)
+        stats = self._techniques[(side, method.slug)]
+        stats["uses"] += 1
+        stats["successes"] += bool(result["success"])
+        stats["damage"] += result["damage"]
+
+    def check_party_hp(self) -> None:
+        """Applies the status effects, then removes the fainted monsters."""
+        for party in self.monsters_in_play.values():
+            for monster in list(party):
+                self.guard(
+                    partial(self.use_status_effects, monster),
+                    "condition",
+                    monster.status[0].slug if monster.status else "",
+                )
+                if fainted(monster):
+                    self.handle_monster_defeat(monster)
+
+    def handle_monster_defeat(self, monster: Monster) -> None:
+        """
+        Removes a fainted monster and counts the experience earned.
+
+        Parameters:
+            monster: Monster that was defeated.
+
+        """
+        self.remove_monster_actions_from_queue(monster)
+        monster.faint()
+        for winner in get_winners(monster, self._damage_map):
+            self._experience += award_experience(
+                monster, winner, self._damage_map
+            )
+        self.drop_damages(monster)
+        self.remove_monster(monster)
+
+    def add_monster_into_play(
+        self,
+        player: NPC,
+        monster: Monster,
+        removed: Optional[Monster] = None,
+    ) -> None:
+        """
+        Add a monster to the battleground.
+
+        Parameters:
+            player: Player who adds the monster, if any.
+            monster: Added monster.
+            removed: Monster that was previously in play, if any.
+
+        """
+        self.monsters_in_play[player].append(monster)
+        for mon in self.active_monsters:
+            mon.status = [sta for sta in mon.status if not sta.bond]
+        if removed is not None and removed.status:
+            removed.status[0].combat_state = self  # type: ignore[assignment]
+            removed.status[0].phase = "add_monster_into_play"
+            removed.status[0].use(removed)
+
+    def remove_monster_from_play(self, monster: Monster) -> None:
+        """
+        Remove monster from play without fainting it.
+
+        Parameters:
+            monster: Monster removed.
+
+        """
+        self.remove_monster_actions_from_queue(monster)
+        self.remove_monster(monster)
+
+    def remove_monster(self, monster: Monster) -> None:
+        for monsters in self.monsters_in_play.values():
+            if monster in monsters:
+                monsters.remove(monster)
+
+    def task(self, task: Callable[[], Any], interval: float = 0) -> None:
+        """Runs right away what the combat state would delay."""
+        task()
+
+    def reset_status_icons(self) -> None:
+        """There are no icons to update."""
+
+    def side(self, monster: Monster) -> int:
+        return 0 if monster.owner is self.players[0] else 1
+
+    def guard(self, action: Callable[[], Any], kind: str, slug: str) -> None:
+        """
+        Runs a part of the combat, skipping it if it needs a running game.
+
+        Only the errors of a missing client, world or session are caught
+        (see :data:`NO_GAME_ERRORS`), each object skipped is logged once.
+        Any other error is a bug and is raised.
+
+        Parameters:
+            action: What to run.
+            kind: Kind of the object run, for the log.
+            slug: Slug of the object run, for the log.
+
+        """
+        try:
+            action()
+        except NO_GAME_ERRORS as e:
+            self._errors += 1
+            if (kind, slug) not in _skipped:
+                _skipped.add((kind, slug))
+                logger.warning(
+                    f"Skipped {kind} '{slug}' in headless combat: {e}"
+                )
+
+
+def make_monster(slug: str, level: int) -> Monster:
+    """
+    Creates a monster the way the game gives them to trainers.
+
+    Parameters:
+        slug: Slug of the monster.
+        level: Level of the monster.
+
+    Returns:
+        The monster, with the moves learned up to its level.
+
+    """
+    monster = Monster()
+    monster.load_from_db(slug)
+    monster.set_level(level)
+    monster.set_moves(level)
+    monster.current_hp = monster.hp
+    return monster
+
+
+def simulate_battle(
+    seed: int,
+    parties: tuple[Sequence[PartyMember], Sequence[PartyMember]],
+    max_turns: int = MAX_TURNS,
+) -> BattleResult:
+    """
+    Plays a trainer battle between two parties.
+
+    The random generator is seeded before the monsters are created, so the
+    same seed and parties always give the same battle.
+
+    Parameters:
+        seed: Seed of the random generator.
+        parties: Slug and level of the monsters of each side.
+        max_turns: Number of turns after which the battle is a draw.
+
+    Returns:
+        The outcome of the battle.
+
+    """
+    random.seed(seed)
+    players = (
+        HeadlessTrainer("left", [make_monster(*m) for m in parties[0]]),
+        HeadlessTrainer("right", [make_monster(*m) for m in parties[1]]),
+    )
+    return HeadlessCombat(players, max_turns=max_turns).run()
+
+
+class MatchupResult(NamedTuple):
+    """
+    Outcome of the battles between two parties.
+
+    ``wins`` is by side. ``techniques`` counts, for every technique, its
+    uses, successes and damage, the battles where it was used and the ones
+    won by the side using it.
+    """
+
+    parties: tuple[tuple[PartyMember, ...], tuple[PartyMember, ...]]
+    battles: int
+    wins: tuple[int, int]
+    draws: int
+    turns: int
+    errors: int
+    techniques: dict[str, Counter[str]]
+
+
+def simulate_matchup(
+    parties: tuple[Sequence[PartyMember], Sequence[PartyMember]],
+    battles: int,
+    seed: int = 0,
+    max_turns: int = MAX_TURNS,
+) -> MatchupResult:
+    """
+    Plays several battles between two parties.
+
+    The parties swap sides every other battle, so that the side playing
+    first doesn't bias the results.
+
+    Parameters:
+        parties: Slug and level of the monsters of each side.
+        battles: Number of battles.
+        seed: Seed of the first battle, the next ones use the next seeds.
+        max_turns: Number of turns after which a battle is a draw.
+
+    Returns:
+        The outcome of the battles.
+
+    """
+    wins = [0, 0]
+    draws = turns = errors = 0
+    techniques: dict[str, Counter[str]] = defaultdict(Counter)
+    for index in range(battles):
+        swapped = index % 2 == 1
+        sides = (parties[1], parties[0]) if swapped else parties
+        result = simulate_battle(seed + index, sides, max_turns)
+        turns += result.turns
+        errors += result.errors
+        if result.winner is None:
+            draws += 1
+        else:
+            wins[result.winner ^ swapped] += 1
+        for (side, slug), stats in result.techniques.items():
+            techniques[slug].update(stats)
+            techniques[slug]["battles"] += 1
+            techniques[slug]["wins"] += result.winner == side
+    return MatchupResult(
+        parties=(tuple(parties[0]), tuple(parties[1])),
+        battles=battles,
+        wins=(wins[0], wins[1]),
+        draws=draws,
+        turns=turns,
+        errors=errors,
+        techniques=dict(techniques),
+    )
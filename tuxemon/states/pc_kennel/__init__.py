@@ -17,7 +17,11 @@ from tuxemon import prepare
 from tuxemon.db import PlagueType
 from tuxemon.locale import T
 from tuxemon.menu.interface import MenuItem
-from tuxemon.menu.menu import PygameMenuState
+from tuxemon.menu.menu import (
+    PygameMenuState,
+    PygamePagedMenuState,
+    get_page,
+)
 from tuxemon.session import local_session
 from tuxemon.state import State
 from tuxemon.states.monster import MonsterMenuState
@@ -41,13 +45,15 @@ def fix_measure(measure: int, percentage: float) -> int:
 HIDDEN = "hidden_kennel"
 HIDDEN_LIST = [HIDDEN]
 MAX_BOX = prepare.MAX_KENNEL
+PAGE_SIZE = prepare.PC_BOX_PAGE_SIZE
+THUMBNAIL_SCALE = prepare.SCALE * 0.5
 
 
-class MonsterTakeState(PygameMenuState):
+class MonsterTakeState(PygamePagedMenuState):
     """Menu for the Monster Take state.
 
     Shows all tuxemon currently in a storage kennel, and selecting one puts it
-    into your current party."""
+    into your current party. Large kennels are shown one page at a time."""
 
     def add_menu_items(
         self,
@@ -169,12 +175,12 @@ class MonsterTakeState(PygameMenuState):
             self.client.push_state("MonsterInfoState", kwargs=params)
 
         # it prints monsters inside the screen: image + button
-        _sorted = sorted(items, key=lambda x: x.slug)
-        for monster in _sorted:
+        for monster in items:
             label = T.translate(monster.name).upper()
             iid = monster.instance_id.hex
-            new_image = self._create_image(monster.front_battle_sprite)
-            new_image.scale(prepare.SCALE * 0.5, prepare.SCALE * 0.5)
+            new_image = self._create_thumbnail(
+                monster.front_battle_sprite, THUMBNAIL_SCALE
+            )
             menu.add.banner(
                 new_image,
                 partial(kennel_options, iid),
@@ -198,11 +204,12 @@ class MonsterTakeState(PygameMenuState):
 
         # menu
         box_label = T.translate(self.box_name).upper()
-        menu.set_title(
-            T.format(f"{box_label}: {len(self.box)}/{MAX_BOX}")
-        ).center_content()
+        title = f"{box_label}: {len(self.box)}/{MAX_BOX}"
+        if self.page_count > 1:
+            title += f" ({self.page + 1}/{self.page_count})"
+        menu.set_title(T.format(title)).center_content()
 
-    def __init__(self, box_name: str) -> None:
+    def __init__(self, box_name: str, page: int = 0) -> None:
         width, height = prepare.SCREEN_SIZE
 
         theme = self._setup_theme(prepare.BG_PC_KENNEL)
@@ -218,13 +225,21 @@ class MonsterTakeState(PygameMenuState):
         self.player = local_session.player
         self.monster_boxes = self.player.monster_boxes
         self.box = self.monster_boxes.get_monsters(self.box_name)
+        monsters = sorted(self.box, key=lambda x: x.slug)
+        page_count = math.ceil(len(monsters) / PAGE_SIZE)
+        page_monsters = get_page(monsters, page, PAGE_SIZE)
 
         # Widgets are like a pygame_menu label, image, etc.
         num_widgets = 3
-        rows = math.ceil(len(self.box) / columns) * num_widgets
+        rows = math.ceil(len(page_monsters) / columns) * num_widgets
 
         super().__init__(
-            height=height, width=width, columns=columns, rows=rows
+            page=page,
+            page_count=page_count,
+            height=height,
+            width=width,
+            columns=columns,
+            rows=rows,
         )
 
         self.menu._column_max_width = [
@@ -233,13 +248,24 @@ class MonsterTakeState(PygameMenuState):
             fix_measure(self.menu._width, 0.33),
         ]
 
-        menu_items_map = []
-        for monster in self.box:
-            menu_items_map.append(monster)
-
-        self.add_menu_items(self.menu, menu_items_map)
+        self.add_menu_items(self.menu, page_monsters)
         self.reset_theme()
 
+        # the neighbouring pages are the likeliest to be shown next
+        for neighbour in self.neighbour_pages:
+            self.prefetch_thumbnails(
+                (
+                    monster.front_battle_sprite
+                    for monster in get_page(monsters, neighbour, PAGE_SIZE)
+                ),
+                THUMBNAIL_SCALE,
+            )
+
+    def change_page(self, page: int) -> None:
+        self.client.replace_state(
+            "MonsterTakeState", box_name=self.box_name, page=page
+        )
+
 
 class MonsterBoxState(PygameMenuState):
     """Menu to choose a tuxemon box."""
@@ -17,7 +17,11 @@ from tuxemon import prepare
 from tuxemon.item import item
 from tuxemon.locale import T
 from tuxemon.menu.interface import MenuItem
-from tuxemon.menu.menu import PygameMenuState
+from tuxemon.menu.menu import (
+    PygameMenuState,
+    PygamePagedMenuState,
+    get_page,
+)
 from tuxemon.menu.quantity import QuantityMenu
 from tuxemon.session import local_session
 from tuxemon.state import State
@@ -41,12 +45,13 @@ def fix_measure(measure: int, percentage: float) -> int:
 
 HIDDEN_LOCKER = "hidden_locker"
 HIDDEN_LIST_LOCKER = [HIDDEN_LOCKER]
+PAGE_SIZE = prepare.PC_BOX_PAGE_SIZE
 
 
-class ItemTakeState(PygameMenuState):
+class ItemTakeState(PygamePagedMenuState):
     """
     Shows all items currently in a storage locker, and selecting one puts it
-    into your bag.
+    into your bag. Large lockers are shown one page at a time.
     """
 
     def add_menu_items(
@@ -185,14 +190,10 @@ class ItemTakeState(PygameMenuState):
             )
 
         # it prints items inside the screen: image + button
-        _sorted = sorted(items, key=lambda x: x.slug)
-        sum_total = []
-        for itm in _sorted:
-            sum_total.append(itm.quantity)
+        for itm in items:
             label = T.translate(itm.name).upper() + " x" + str(itm.quantity)
             iid = itm.instance_id.hex
-            new_image = self._create_image(itm.sprite)
-            new_image.scale(prepare.SCALE, prepare.SCALE)
+            new_image = self._create_thumbnail(itm.sprite, prepare.SCALE)
             menu.add.banner(
                 new_image,
                 partial(locker_options, iid),
@@ -208,10 +209,13 @@ class ItemTakeState(PygameMenuState):
 
         # menu
         box_label = T.translate(self.box_name).upper()
-        label = f"{box_label} ({len(self.box)} types - {sum(sum_total)} items)"
+        total = sum(itm.quantity for itm in self.box)
+        label = f"{box_label} ({len(self.box)} types - {total} items)"
+        if self.page_count > 1:
+            label += f" ({self.page + 1}/{self.page_count})"
         menu.set_title(label).center_content()
 
-    def __init__(self, box_name: str) -> None:
+    def __init__(self, box_name: str, page: int = 0) -> None:
         width, height = prepare.SCREEN_SIZE
 
         theme = self._setup_theme(prepare.BG_PC_LOCKER)
@@ -226,13 +230,21 @@ class ItemTakeState(PygameMenuState):
         self.box_name = box_name
         self.player = local_session.player
         self.box = self.player.item_boxes.get_items(self.box_name)
+        items = sorted(self.box, key=lambda x: x.slug)
+        page_count = math.ceil(len(items) / PAGE_SIZE)
+        page_items = get_page(items, page, PAGE_SIZE)
 
         # Widgets are like a pygame_menu label, image, etc.
         num_widgets = 2
-        rows = math.ceil(len(self.box) / columns) * num_widgets
+        rows = math.ceil(len(page_items) / columns) * num_widgets
 
         super().__init__(
-            height=height, width=width, columns=columns, rows=rows
+            page=page,
+            page_count=page_count,
+            height=height,
+            width=width,
+            columns=columns,
+            rows=rows,
         )
 
         self.menu._column_max_width = [
@@ -241,13 +253,21 @@ class ItemTakeState(PygameMenuState):
             fix_measure(self.menu._width, 0.33),
         ]
 
-        menu_items_map = []
-        for item in self.box:
-            menu_items_map.append(item)
-
-        self.add_menu_items(self.menu, menu_items_map)
+        self.add_menu_items(self.menu, page_items)
         self.reset_theme()
 
+        # the neighbouring pages are the likeliest to be shown next
+        for neighbour in self.neighbour_pages:
+            self.prefetch_thumbnails(
+                (itm.sprite for itm in get_page(items, neighbour, PAGE_SIZE)),
+                prepare.SCALE,
+            )
+
+    def change_page(self, page: int) -> None:
+        self.client.replace_state(
+            "ItemTakeState", box_name=self.box_name, page=page
+        )
+
 
 class ItemBoxState(PygameMenuState):
     """Menu to choose an item box."""
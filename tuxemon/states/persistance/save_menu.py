@@ -4,7 +4,6 @@ from __future__ import annotations
 
 import logging
 import os
-from base64 import b64decode
 from typing import Optional
 
 import pygame
@@ -15,6 +14,7 @@ from tuxemon.locale import T
 from tuxemon.menu.interface import MenuItem
 from tuxemon.menu.menu import PopUpMenu
 from tuxemon.save import get_save_path
+from tuxemon.save_writer import save_writer
 from tuxemon.session import local_session
 from tuxemon.ui import text
 
@@ -36,6 +36,8 @@ class SaveMenuState(PopUpMenu[None]):
         empty_image = None
         rect = self.client.screen.get_rect()
         slot_rect = Rect(0, 0, rect.width * 0.80, rect.height // 6)
+        # The saves being written in the background must show up
+        save_writer.flush()
         for i in range(self.number_of_slots):
             # Check to see if a save exists for the current slot
             save_path = get_save_path(i + 1)
@@ -70,20 +72,12 @@ class SaveMenuState(PopUpMenu[None]):
     ) -> pygame.surface.Surface:
         slot_image = pygame.Surface(rect.size, pygame.SRCALPHA)
 
-        # Try and load the save game and draw details about the save
-        save_data = save.load(slot_num)
+        # Only the metadata is read, the save itself is never parsed here
+        save_data = save.load_metadata(slot_num)
         assert save_data
-        if "screenshot" in save_data:
-            screenshot = b64decode(save_data["screenshot"])
-            size = (
-                save_data["screenshot_width"],
-                save_data["screenshot_height"],
-            )
-            thumb_image = pygame.image.frombuffer(
-                screenshot,
-                size,
-                "RGB",
-            ).convert()
+        thumbnail = save.load_thumbnail(save_data)
+        if thumbnail is not None:
+            thumb_image = thumbnail.convert()
             thumb_rect = thumb_image.get_rect().fit(rect)
             thumb_image = pygame.transform.smoothscale(
                 thumb_image,
@@ -161,7 +155,7 @@ class SaveMenuState(PopUpMenu[None]):
             var_menu.append(("keep", _keep, negative_answer))
             tools.open_choice_dialog(local_session, var_menu, True)
 
-        save_data = save.load(self.selected_index + 1)
+        save_data = save.load_metadata(self.selected_index + 1)
         if save_data:
             ask_confirmation()
         else:
@@ -2,6 +2,26 @@
 # Copyright (c) 2014-2025 William Edwards <shadowapex@gmail.com>, Benjamin Bean <superman2k5@gmail.com>
 from __future__ import annotations
 
+import heapq
+from array import array
+from collections import OrderedDict
+from collections.abc import (
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+    Sequence,
+)
+from typing import TYPE_CHECKING, Any, Optional
+from uuid import UUID
+
+from tuxemon.map import RegionProperties
+
+if TYPE_CHECKING:
+    from tuxemon.entity import Entity
+    from tuxemon.npc import NPC
+
 
 class BoundaryChecker:
     """
@@ -61,3 +81,492 @@ class BoundaryChecker:
 
     def __repr__(self) -> str:
         return f"BoundaryChecker(invalid_x={self.invalid_x}, invalid_y={self.invalid_y})"
+
+
+class EntityIndex:
+    """
+    Indexes of the entities of the world by slug, instance id and tile.
+
+    The world adds and removes the entities, and every entity reports its
+    tile changes, so the indexes are always up to date and a lookup never
+    needs to scan all the entities.
+    """
+
+    def __init__(self) -> None:
+        self.by_slug: dict[str, list[NPC]] = {}
+        self.by_iid: dict[UUID, NPC] = {}
+        self.by_tile: dict[tuple[int, int], list[NPC]] = {}
+        self._entities: dict[int, NPC] = {}
+        self._tiles: dict[int, tuple[int, int]] = {}
+
+    def __contains__(self, entity: object) -> bool:
+        return id(entity) in self._tiles
+
+    def __len__(self) -> int:
+        return len(self._tiles)
+
+    def add(self, entity: NPC) -> None:
+        """
+        Adds an entity, at its current tile.
+
+        Parameters:
+            entity: The entity.
+
+        """
+        if entity in self:
+            return
+        self._entities[id(entity)] = entity
+        self._tiles[id(entity)] = entity.tile_pos
+        self.by_slug.setdefault(entity.slug, []).append(entity)
+        self.by_iid[entity.instance_id] = entity
+        self.by_tile.setdefault(entity.tile_pos, []).append(entity)
+
+    def remove(self, entity: NPC) -> None:
+        """
+        Removes an entity, if it's in the index.
+
+        Parameters:
+            entity: The entity.
+
+        """
+        tile_pos = self._tiles.pop(id(entity), None)
+        if tile_pos is None:
+            return
+        del self._entities[id(entity)]
+        _remove_from(self.by_slug, entity.slug, entity)
+        self.by_iid.pop(entity.instance_id, None)
+        _remove_from(self.by_tile, tile_pos, entity)
+
+    def move(self, entity: Entity[Any]) -> None:
+        """
+        Moves an entity to its current tile, if it's in the index.
+
+        Parameters:
+            entity: The entity.
+
+        """
+        npc = self._entities.get(id(entity))
+        if npc is None:
+            return
+        tile_pos = self._tiles[id(entity)]
+        if tile_pos == npc.tile_pos:
+            return
+        _remove_from(self.by_tile, tile_pos, npc)
+        self._tiles[id(entity)] = npc.tile_pos
+        self.by_tile.setdefault(npc.tile_pos, []).append(npc)
+
+    def clear(self) -> None:
+        """Removes all the entities."""
+        self.by_slug = {}
+        self.by_iid = {}
+        self.by_tile = {}
+        self._entities = {}
+        self._tiles = {}
+
+    def get_slug(self, slug: str) -> Optional[NPC]:
+        """
+        Returns the first added entity with a slug.
+
+        Parameters:
+            slug: The entity slug.
+
+        """
+        entities = self.by_slug.get(slug)
+        return entities[0] if entities else None
+
+    def get_iid(self, iid: UUID) -> Optional[NPC]:
+        """
+        Returns the entity with an instance id.
+
+        Parameters:
+            iid: The entity instance ID.
+
+        """
+        return self.by_iid.get(iid)
+
+    def get_tile(self, coords: tuple[int, int]) -> list[NPC]:
+        """
+        Returns the entities on a tile.
+
+        Parameters:
+            coords: Coordinates of the tile.
+
+        Returns:
+            The entities, in the order they entered the tile.
+
+        """
+        return self.by_tile.get(coords, [])
+
+    def in_rect(self, x: int, y: int, width: int, height: int) -> list[NPC]:
+        """
+        Returns the entities within a rectangle of tiles.
+
+        Parameters:
+            x: Left tile of the rectangle.
+            y: Top tile of the rectangle.
+            width: Width of the rectangle, in tiles.
+            height: Height of the rectangle, in tiles.
+
+        Returns:
+            The entities, in no particular order.
+
+        """
+        if width * height < len(self.by_tile):
+            tiles: Iterable[tuple[int, int]] = (
+                (tx, ty)
+                for ty in range(y, y + height)
+                for tx in range(x, x + width)
+            )
+        else:
+            tiles = [
+                (tx, ty)
+                for tx, ty in self.by_tile
+                if x <= tx < x + width and y <= ty < y + height
+            ]
+        return [
+            entity for tile in tiles for entity in self.by_tile.get(tile, ())
+        ]
+
+    def in_radius(self, center: tuple[int, int], radius: float) -> list[NPC]:
+        """
+        Returns the entities within a distance of a tile.
+
+        Parameters:
+            center: Coordinates of the tile.
+            radius: Maximum euclidean distance, in tiles.
+
+        Returns:
+            The entities, in no particular order.
+
+        """
+        reach = int(radius)
+        cx, cy = center
+        return [
+            entity
+            for entity in self.in_rect(
+                cx - reach, cy - reach, 2 * reach + 1, 2 * reach + 1
+            )
+            if (entity.tile_pos[0] - cx) ** 2 + (entity.tile_pos[1] - cy) ** 2
+            <= radius**2
+        ]
+
+
+def _remove_from(index: dict[Any, list[NPC]], key: Any, entity: NPC) -> None:
+    entities = index[key]
+    entities.remove(entity)
+    if not entities:
+        del index[key]
+
+
+class CollisionIndex(Mapping[tuple[int, int], Optional[RegionProperties]]):
+    """
+    Collisions of the map, of the blocking surfaces and of the entities.
+
+    The index is a read-only view over three layers, looked up by
+    priority: the collision map of the map, the surfaces with a moverate
+    of 0 and the tiles occupied by entities. The collision map is read
+    directly, the blocking surfaces are kept up to date when surfaces
+    change and the entities are read from the entity index, so that a
+    lookup never needs to rebuild anything.
+
+    A tile which isn't in the index is free. A tile mapped to ``None`` is
+    blocked, otherwise its region properties tell how it can be entered
+    and left.
+
+    The version is increased whenever the map, a surface or a collision
+    changes (entity moves excluded), for the caches depending on them.
+    """
+
+    def __init__(self, entities: EntityIndex) -> None:
+        self.version = 0
+        self.collision_map: MutableMapping[
+            tuple[int, int], Optional[RegionProperties]
+        ] = {}
+        self.surface_map: MutableMapping[tuple[int, int], dict[str, float]] = (
+            {}
+        )
+        self._surfaces: dict[tuple[int, int], RegionProperties] = {}
+        self.entities = entities
+
+    def set_maps(
+        self,
+        collision_map: MutableMapping[
+            tuple[int, int], Optional[RegionProperties]
+        ],
+        surface_map: MutableMapping[tuple[int, int], dict[str, float]],
+    ) -> None:
+        """
+        Uses the collision and surface maps of a newly loaded map.
+
+        Parameters:
+            collision_map: The collision map.
+            surface_map: The surface map.
+
+        """
+        self.version += 1
+        self.collision_map = collision_map
+        self.surface_map = surface_map
+        self._surfaces = {}
+        for coords, surface in surface_map.items():
+            self._update_surface(coords, surface)
+
+    def set_surface(
+        self, coords: tuple[int, int], surface: dict[str, float]
+    ) -> None:
+        """
+        Changes the surface of a tile.
+
+        Parameters:
+            coords: Coordinates of the tile.
+            surface: The new surface properties (label and moverate).
+
+        """
+        self.version += 1
+        self.surface_map[coords] = surface
+        self._surfaces.pop(coords, None)
+        self._update_surface(coords, surface)
+
+    def set_collision(
+        self, coords: tuple[int, int], region: Optional[RegionProperties]
+    ) -> None:
+        """
+        Changes the collision of a tile.
+
+        Parameters:
+            coords: Coordinates of the tile.
+            region: The new region properties, ``None`` blocks the tile.
+
+        """
+        self.version += 1
+        self.collision_map[coords] = region
+
+    def _update_surface(
+        self, coords: tuple[int, int], surface: dict[str, float]
+    ) -> None:
+        for label, value in surface.items():
+            if float(value) == 0:
+                self._surfaces[coords] = RegionProperties(
+                    [], [], [], None, label
+                )
+
+    def __getitem__(
+        self, coords: tuple[int, int]
+    ) -> Optional[RegionProperties]:
+        if coords in self.collision_map:
+            return self.collision_map[coords]
+        surface = self._surfaces.get(coords)
+        if surface is not None:
+            return surface
+        entities = self.entities.get_tile(coords)
+        if entities:
+            return RegionProperties([], [], [], entities[-1], None)
+        raise KeyError(coords)
+
+    def __contains__(self, coords: object) -> bool:
+        return (
+            coords in self.collision_map
+            or coords in self._surfaces
+            or coords in self.entities.by_tile
+        )
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        yield from self.collision_map
+        for coords in self._surfaces:
+            if coords not in self.collision_map:
+                yield coords
+        for coords in self.entities.by_tile:
+            if (
+                coords not in self.collision_map
+                and coords not in self._surfaces
+            ):
+                yield coords
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __bool__(self) -> bool:
+        return True
+
+
+class Pathfinder:
+    """
+    A* search over the tiles of a map, with a cache of the recent paths.
+
+    The search uses the Manhattan distance as heuristic and a binary heap
+    as open set. Costs and parents are kept in flat arrays indexed by
+    ``y * width + x``, so no object is allocated per visited tile.
+
+    Cached paths are dropped when the collision index version changes,
+    and they are checked step by step against the current exits before
+    being reused, since entities may have moved in the meantime.
+
+    Parameters:
+        max_size: Maximum number of cached paths.
+
+    """
+
+    def __init__(self, max_size: int = 64) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.map_size = (0, 0)
+        self._version = -1
+        self._paths: OrderedDict[
+            tuple[tuple[int, int], tuple[int, int]],
+            list[tuple[int, int]],
+        ] = OrderedDict()
+
+    def set_map_size(self, map_size: tuple[int, int]) -> None:
+        """
+        Sets the size of the map and forgets the cached paths.
+
+        Parameters:
+            map_size: The size of the map (width, height).
+
+        """
+        self.map_size = map_size
+        self.clear()
+
+    def clear(self) -> None:
+        """Forgets the cached paths."""
+        self._paths.clear()
+
+    def find(
+        self,
+        start: tuple[int, int],
+        dest: tuple[int, int],
+        get_exits: Callable[[tuple[int, int]], Sequence[tuple[int, int]]],
+        version: int,
+    ) -> Optional[list[tuple[int, int]]]:
+        """
+        Finds the shortest path between two tiles.
+
+        Parameters:
+            start: Initial tile position.
+            dest: Target tile position.
+            get_exits: Returns the tiles which can be moved into from a
+                tile.
+            version: Version of the collision index.
+
+        Returns:
+            The tile positions of the steps, from the destination to the
+            first step (the start is excluded), if a path exists. ``None``
+            otherwise.
+
+        """
+        if version != self._version:
+            self._version = version
+            self.clear()
+
+        key = (start, dest)
+        path = self._paths.get(key)
+        if path is not None and self._is_valid(start, path, get_exits):
+            self._paths.move_to_end(key)
+            self.hits += 1
+            return list(path)
+
+        self.misses += 1
+        path = self.search(start, dest, get_exits)
+        if path is None:
+            self._paths.pop(key, None)
+            return None
+        self._paths[key] = path
+        self._paths.move_to_end(key)
+        while len(self._paths) > self.max_size:
+            self._paths.popitem(last=False)
+        return list(path)
+
+    def search(
+        self,
+        start: tuple[int, int],
+        dest: tuple[int, int],
+        get_exits: Callable[[tuple[int, int]], Sequence[tuple[int, int]]],
+    ) -> Optional[list[tuple[int, int]]]:
+        """
+        A* search, without the cache.
+
+        Parameters:
+            start: Initial tile position.
+            dest: Target tile position.
+            get_exits: Returns the tiles which can be moved into from a
+                tile.
+
+        Returns:
+            The tile positions of the steps, from the destination to the
+            first step, if a path exists. ``None`` otherwise.
+
+        """
+        width, height = self.map_size
+        if not (
+            0 <= start[0] < width
+            and 0 <= start[1] < height
+            and 0 <= dest[0] < width
+            and 0 <= dest[1] < height
+        ):
+            return None
+        if start == dest:
+            return []
+
+        size = width * height
+        cost = array("i", [-1]) * size
+        parent = array("i", [-1]) * size
+        dest_x, dest_y = dest
+        start_index = start[1] * width + start[0]
+        dest_index = dest_y * width + dest_x
+        cost[start_index] = 0
+        open_set = [(0, 0, start_index)]
+
+        while open_set:
+            _, node_cost, index = heapq.heappop(open_set)
+            if index == dest_index:
+                break
+            if node_cost > cost[index]:
+                # already reached with a lower cost
+                continue
+            next_cost = node_cost + 1
+            for x, y in get_exits((index % width, index // width)):
+                next_index = y * width + x
+                known_cost = cost[next_index]
+                if known_cost == -1 or next_cost < known_cost:
+                    cost[next_index] = next_cost
+                    parent[next_index] = index
+                    estimate = abs(dest_x - x) + abs(dest_y - y)
+                    heapq.heappush(
+                        open_set, (next_cost + estimate, next_cost, next_index)
+                    )
+        else:
+            return None
+
+        path = []
+        index = dest_index
+        while index != start_index:
+            path.append((index % width, index // width))
+            index = parent[index]
+        return path
+
+    @staticmethod
+    def _is_valid(
+        start: tuple[int, int],
+        path: Sequence[tuple[int, int]],
+        get_exits: Callable[[tuple[int, int]], Sequence[tuple[int, int]]],
+    ) -> bool:
+        position = start
+        for step in reversed(path):
+            if step not in get_exits(position):
+                return False
+            position = step
+        return True
+
+    def stats(self) -> dict[str, int]:
+        """
+        Returns the counters of the cache.
+
+        Returns:
+            Number of cached paths, hits and misses.
+
+        """
+        return {
+            "paths": len(self._paths),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
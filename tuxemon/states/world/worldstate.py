@@ -4,16 +4,13 @@ from __future__ import annotations
 
 import itertools
 import logging
-import os
 import uuid
-from collections import defaultdict
 from collections.abc import Mapping, MutableMapping, Sequence
 from dataclasses import dataclass
 from functools import partial
 from typing import (
     TYPE_CHECKING,
     Any,
-    DefaultDict,
     Optional,
     Union,
     no_type_check,
@@ -22,13 +19,12 @@ from typing import (
 import pygame
 from pygame.rect import Rect
 
-from tuxemon import networking, prepare, state
+from tuxemon import graphics, networking, prepare, state
 from tuxemon.camera import Camera, project
 from tuxemon.db import Direction
 from tuxemon.entity import Entity
 from tuxemon.graphics import ColorLike
 from tuxemon.map import (
-    PathfindNode,
     RegionProperties,
     TuxemonMap,
     dirs2,
@@ -36,12 +32,17 @@ from tuxemon.map import (
     pairs,
     proj,
 )
-from tuxemon.map_loader import TMXMapLoader, YAMLEventLoader
+from tuxemon.map_loader import map_cache, teleport_destinations
 from tuxemon.math import Vector2
 from tuxemon.platform.const import buttons, events, intentions
 from tuxemon.platform.events import PlayerInput
 from tuxemon.session import local_session
-from tuxemon.states.world.world_classes import BoundaryChecker
+from tuxemon.states.world.world_classes import (
+    BoundaryChecker,
+    CollisionIndex,
+    EntityIndex,
+    Pathfinder,
+)
 from tuxemon.states.world.world_menus import WorldMenuState
 from tuxemon.surfanim import SurfaceAnimation
 from tuxemon.teleporter import Teleporter
@@ -125,6 +126,9 @@ class WorldState(state.State):
         from tuxemon.player import Player
 
         self.boundary_checker = BoundaryChecker()
+        self.entity_index = EntityIndex()
+        self.collision_index = CollisionIndex(self.entity_index)
+        self.pathfinder = Pathfinder()
         self.teleporter = Teleporter()
         # Provide access to the screen surface
         self.screen = self.client.screen
@@ -420,6 +424,9 @@ class WorldState(state.State):
                 return None
 
             if event.pressed and event.button == intentions.RELOAD_MAP:
+                prepare.ASSETS.invalidate()
+                graphics.surface_cache.clear()
+                map_cache.clear()
                 self.current_map.reload_tiles()
                 return None
 
@@ -650,6 +657,7 @@ class WorldState(state.State):
         # Maybe in the future the world should have a dict of entities instead?
         if isinstance(entity, NPC):
             self.npcs.append(entity)
+            self.entity_index.add(entity)
 
     def get_entity(self, slug: str) -> Optional[NPC]:
         """
@@ -659,7 +667,7 @@ class WorldState(state.State):
             slug: The entity slug.
 
         """
-        return next((npc for npc in self.npcs if npc.slug == slug), None)
+        return self.entity_index.get_slug(slug)
 
     def get_entity_by_iid(self, iid: uuid.UUID) -> Optional[NPC]:
         """
@@ -669,7 +677,7 @@ class WorldState(state.State):
             iid: The entity instance ID.
 
         """
-        return next((npc for npc in self.npcs if npc.instance_id == iid), None)
+        return self.entity_index.get_iid(iid)
 
     def get_entity_pos(self, pos: tuple[int, int]) -> Optional[NPC]:
         """
@@ -679,7 +687,8 @@ class WorldState(state.State):
             pos: The entity position.
 
         """
-        return next((npc for npc in self.npcs if npc.tile_pos == pos), None)
+        entities = self.entity_index.get_tile(pos)
+        return entities[0] if entities else None
 
     def remove_entity(self, slug: str) -> None:
         """
@@ -693,6 +702,35 @@ class WorldState(state.State):
         if npc:
             npc.remove_collision()
             self.npcs.remove(npc)
+            self.entity_index.remove(npc)
+
+    def get_entities_in_rect(
+        self, x: int, y: int, width: int, height: int
+    ) -> list[NPC]:
+        """
+        Get the entities within a rectangle of tiles.
+
+        Parameters:
+            x: Left tile of the rectangle.
+            y: Top tile of the rectangle.
+            width: Width of the rectangle, in tiles.
+            height: Height of the rectangle, in tiles.
+
+        """
+        return self.entity_index.in_rect(x, y, width, height)
+
+    def get_entities_in_radius(
+        self, pos: tuple[int, int], radius: float
+    ) -> list[NPC]:
+        """
+        Get the entities within a distance of a tile.
+
+        Parameters:
+            pos: The tile position.
+            radius: Maximum distance, in tiles.
+
+        """
+        return self.entity_index.in_radius(pos, radius)
 
     def get_all_entities(self) -> Sequence[NPC]:
         """
@@ -802,65 +840,18 @@ class WorldState(state.State):
         """
         Return dictionary for collision testing.
 
-        Returns a dictionary where keys are (x, y) tile tuples
+        Returns a mapping where keys are (x, y) tile tuples
         and the values are tiles or NPCs.
 
-        # NOTE:
-        This will not respect map changes to collisions
-        after the map has been loaded!
+        The mapping is the collision index of the world, which is kept up
+        to date when entities move and when surfaces or collisions change,
+        so it's not rebuilt on every call.
 
         Returns:
-            A dictionary of collision tiles.
+            A mapping of collision tiles.
 
         """
-        collision_dict: DefaultDict[
-            tuple[int, int], Optional[RegionProperties]
-        ] = defaultdict(lambda: RegionProperties([], [], [], None, None))
-
-        # Get all the NPCs' tile positions
-        for npc in self.get_all_entities():
-            collision_dict[npc.tile_pos] = self._get_region_properties(
-                npc.tile_pos, npc
-            )
-
-        # Add surface map entries to the collision dictionary
-        for coords, surface in self.surface_map.items():
-            for label, value in surface.items():
-                if float(value) == 0:
-                    collision_dict[coords] = self._get_region_properties(
-                        coords, label
-                    )
-
-        collision_dict.update({k: v for k, v in self.collision_map.items()})
-
-        return dict(collision_dict)
-
-    def _get_region_properties(
-        self, coords: tuple[int, int], entity_or_label: Union[NPC, str]
-    ) -> RegionProperties:
-        region = self.collision_map.get(coords)
-        if region:
-            if isinstance(entity_or_label, str):
-                return RegionProperties(
-                    region.enter_from,
-                    region.exit_from,
-                    region.endure,
-                    None,
-                    entity_or_label,
-                )
-            else:
-                return RegionProperties(
-                    region.enter_from,
-                    region.exit_from,
-                    region.endure,
-                    entity_or_label,
-                    region.key,
-                )
-        else:
-            if isinstance(entity_or_label, str):
-                return RegionProperties([], [], [], None, entity_or_label)
-            else:
-                return RegionProperties([], [], [], entity_or_label, None)
+        return self.collision_index
 
     def pathfind(
         self,
@@ -879,18 +870,15 @@ class WorldState(state.State):
             ``None`` otherwise.
 
         """
-        pathnode = self.pathfind_r(dest, [PathfindNode(start)], set())
-
-        if pathnode:
-            # traverse the node to get the path
-            path = []
-            while pathnode:
-                path.append(pathnode.get_value())
-                pathnode = pathnode.get_parent()
-
-            return path[:-1]
+        collision_map = self.get_collision_map()
+        path = self.pathfinder.find(
+            start,
+            dest,
+            partial(self.get_exits, collision_map=collision_map),
+            self.collision_index.version,
+        )
 
-        else:
+        if path is None:
             character = self.get_entity_pos(start)
             assert character
             logger.error(
@@ -899,45 +887,7 @@ class WorldState(state.State):
                 + "Are you sure that an obstacle-free path exists?"
             )
 
-            return None
-
-    def pathfind_r(
-        self,
-        dest: tuple[int, int],
-        queue: list[PathfindNode],
-        known_nodes: set[tuple[int, int]],
-    ) -> Optional[PathfindNode]:
-        """
-        Breadth first search algorithm.
-
-        Parameters:
-            dest: Target tile position.
-            queue: Queue of nodes to explore.
-            known_nodes: Already explored nodes.
-
-        Returns:
-            A node with the path if it exist. ``None`` otherwise.
-
-        """
-        # The collisions shouldn't have changed whilst we were calculating,
-        # so it saves time to reuse the map.
-        collision_map = self.get_collision_map()
-        known_nodes.add(queue[0].get_value())
-        while queue:
-            node = queue.pop(0)
-            if node.get_value() == dest:
-                return node
-            else:
-                for adj_pos in self.get_exits(
-                    node.get_value(),
-                    collision_map,
-                    known_nodes,
-                ):
-                    if adj_pos not in known_nodes:
-                        known_nodes.add(adj_pos)
-                        queue.append(PathfindNode(adj_pos, node))
-
-        return None
+        return path
 
     def get_explicit_tile_exits(
         self,
@@ -1276,11 +1226,13 @@ class WorldState(state.State):
         self.current_map = map_data
         self.collision_map = map_data.collision_map
         self.surface_map = map_data.surface_map
+        self.collision_index.set_maps(self.collision_map, self.surface_map)
         self.collision_lines_map = map_data.collision_lines_map
         self.map_size = map_data.size
         self.map_area = map_data.area
 
         self.boundary_checker.update_boundaries(self.map_size)
+        self.pathfinder.set_map_size(self.map_size)
         self.client.load_map(map_data)
         self.clear_npcs()
 
@@ -1290,6 +1242,7 @@ class WorldState(state.State):
         """
         self.npcs = []
         self.npcs_off_map = []
+        self.entity_index.clear()
 
     def update_player_state(self) -> None:
         """
@@ -1306,6 +1259,9 @@ class WorldState(state.State):
         """
         Returns map data as a dictionary to be used for map changing.
 
+        Maps are kept in the map cache, and the maps reachable from the
+        loaded one are parsed in the background.
+
         Parameters:
             path: Path of the map to load.
 
@@ -1313,30 +1269,8 @@ class WorldState(state.State):
             Loaded map.
 
         """
-        txmn_map = TMXMapLoader().load(path)
-        yaml_files = [path.replace(".tmx", ".yaml")]
-
-        if txmn_map.scenario:
-            _scenario = prepare.fetch("maps", f"{txmn_map.scenario}.yaml")
-            yaml_files.append(_scenario)
-
-        _events = list(txmn_map.events)
-        _inits = list(txmn_map.inits)
-        events = {"event": _events, "init": _inits}
-
-        yaml_loader = YAMLEventLoader()
-
-        for yaml_file in yaml_files:
-            if os.path.exists(yaml_file):
-                yaml_data = yaml_loader.load_events(yaml_file, "event")
-                events["event"].extend(yaml_data["event"])
-                yaml_data = yaml_loader.load_events(yaml_file, "init")
-                events["init"].extend(yaml_data["init"])
-            else:
-                logger.warning(f"YAML file {yaml_file} not found")
-
-        txmn_map.events = events["event"]
-        txmn_map.inits = events["init"]
+        txmn_map = map_cache.load(path)
+        map_cache.prefetch(teleport_destinations(txmn_map))
         return txmn_map
 
     @no_type_check  # only used by multiplayer which is disabled
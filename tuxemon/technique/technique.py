@@ -9,9 +9,10 @@ from typing import TYPE_CHECKING, Any, ClassVar, Optional
 
 from tuxemon import plugin
 from tuxemon.constants import paths
-from tuxemon.db import ElementType, Range, db
-from tuxemon.element import Element
+from tuxemon.db import ElementType, Range, TechniqueModel, db
+from tuxemon.element import Element, get_element
 from tuxemon.locale import T
+from tuxemon.slug_cache import SlugCache
 from tuxemon.technique.techcondition import TechCondition
 from tuxemon.technique.techeffect import TechEffect, TechEffectResult
 
@@ -27,12 +28,94 @@ SIMPLE_PERSISTANCE_ATTRIBUTES = (
 )
 
 
+class TechniqueTemplate:
+    """
+    What the techniques of a slug share, built once from the database.
+
+    Parameters:
+        results: The database entry of the technique.
+
+    """
+
+    __slots__ = (
+        "slug",
+        "name",
+        "description",
+        "use_tech",
+        "use_success",
+        "use_failure",
+        "types",
+        "effects",
+        "conditions",
+        "target",
+    )
+
+    def __init__(self, results: TechniqueModel) -> None:
+        self.slug = results.slug
+        self.name = T.translate(self.slug)
+        self.description = T.translate(f"{self.slug}_description")
+        # technique use notifications (translated!)
+        self.use_tech = T.maybe_translate(results.use_tech)
+        self.use_success = T.maybe_translate(results.use_success)
+        self.use_failure = T.maybe_translate(results.use_failure)
+        self.types = tuple(get_element(ele) for ele in results.types)
+        Technique.load_plugins()
+        self.effects = tuple(Technique.parse_effects(results.effects))
+        self.conditions = tuple(Technique.parse_conditions(results.conditions))
+        self.target = results.target.model_dump()
+
+
+technique_templates: SlugCache[TechniqueTemplate] = SlugCache(
+    "technique", TechniqueTemplate
+)
+
+
 class Technique:
     """
     Particular skill that tuxemon monsters can use in battle.
 
+    The attributes coming from the database are shared with the other
+    techniques of the same slug (see :class:`TechniqueTemplate`), only the
+    state of this technique is its own.
+
     """
 
+    __slots__ = (
+        "instance_id",
+        "counter",
+        "tech_id",
+        "accuracy",
+        "animation",
+        "combat_state",
+        "conditions",
+        "default_potency",
+        "default_power",
+        "description",
+        "effects",
+        "flip_axes",
+        "icon",
+        "hit",
+        "is_fast",
+        "randomly",
+        "name",
+        "next_use",
+        "nr_turn",
+        "potency",
+        "power",
+        "range",
+        "healing_power",
+        "recharge_length",
+        "sfx",
+        "sort",
+        "slug",
+        "target",
+        "types",
+        "usable_on",
+        "use_success",
+        "use_failure",
+        "use_tech",
+    )
+
     effects_classes: ClassVar[Mapping[str, type[TechEffect]]] = {}
     conditions_classes: ClassVar[Mapping[str, type[TechCondition]]] = {}
 
@@ -58,19 +141,27 @@ class Technique:
         self.nr_turn = 0
         self.potency = 0.0
         self.power = 1.0
+        self.default_potency = 0.0
+        self.default_power = 1.0
         self.range = Range.melee
         self.healing_power = 0.0
         self.recharge_length = 0
         self.sfx = ""
         self.sort = ""
         self.slug = ""
-        self.types: list[Element] = []
+        self.target: Mapping[str, bool] = {}
+        self.types: Sequence[Element] = []
         self.usable_on = False
         self.use_success = ""
         self.use_failure = ""
         self.use_tech = ""
 
-        # load effect and condition plugins if it hasn't been done already
+        self.load_plugins()
+        self.set_state(save_data)
+
+    @classmethod
+    def load_plugins(cls) -> None:
+        """Loads the effect and condition plugins, if not done already."""
         if not Technique.effects_classes:
             Technique.effects_classes = plugin.load_plugins(
                 paths.TECH_EFFECT_PATH,
@@ -83,8 +174,6 @@ class Technique:
                 interface=TechCondition,
             )
 
-        self.set_state(save_data)
-
     def load(self, slug: str) -> None:
         """
         Loads and sets this technique's attributes from the technique
@@ -94,25 +183,25 @@ class Technique:
             The slug of the technique to look up in the database.
         """
         try:
-            results = db.lookup(slug, table="technique")
+            template = technique_templates.get(slug)
         except KeyError:
             raise RuntimeError(f"Technique {slug} not found")
+        results = db.lookup(slug, table="technique")
 
-        self.slug = results.slug  # a short English identifier
-        self.name = T.translate(self.slug)
-        self.description = T.translate(f"{self.slug}_description")
+        self.slug = template.slug  # a short English identifier
+        self.name = template.name
+        self.description = template.description
 
         self.sort = results.sort
 
         # technique use notifications (translated!)
-        self.use_tech = T.maybe_translate(results.use_tech)
-        self.use_success = T.maybe_translate(results.use_success)
-        self.use_failure = T.maybe_translate(results.use_failure)
+        self.use_tech = template.use_tech
+        self.use_success = template.use_success
+        self.use_failure = template.use_failure
 
         self.icon = results.icon
-        self.counter = self.counter
         # types
-        self.types = [Element(ele) for ele in results.types]
+        self.types = template.types
         # technique stats
         self.accuracy = results.accuracy or self.accuracy
         self.potency = results.potency or self.potency
@@ -121,7 +210,6 @@ class Technique:
         self.default_potency = results.potency or self.potency
         self.default_power = results.power or self.power
 
-        self.hit = self.hit
         self.is_fast = results.is_fast or self.is_fast
         self.randomly = results.randomly or self.randomly
         self.healing_power = results.healing_power or self.healing_power
@@ -129,9 +217,9 @@ class Technique:
         self.range = results.range or Range.melee
         self.tech_id = results.tech_id or self.tech_id
 
-        self.conditions = self.parse_conditions(results.conditions)
-        self.effects = self.parse_effects(results.effects)
-        self.target = results.target.model_dump()
+        self.conditions = template.conditions
+        self.effects = template.effects
+        self.target = template.target
         self.usable_on = results.usable_on or self.usable_on
 
         # Load the animation sprites that will be used for this technique
@@ -141,8 +229,9 @@ class Technique:
         # Load the sound effect for this technique
         self.sfx = results.sfx
 
+    @classmethod
     def parse_effects(
-        self,
+        cls,
         raw: Sequence[str],
     ) -> Sequence[TechEffect]:
         """
@@ -174,8 +263,9 @@ class Technique:
 
         return effects
 
+    @classmethod
     def parse_conditions(
-        self,
+        cls,
         raw: Sequence[str],
     ) -> Sequence[TechCondition]:
         """
@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import logging
 import math
-from collections.abc import Callable, Generator, Iterable, Sequence
-from itertools import product
-from typing import Optional
+from collections import OrderedDict
+from collections.abc import Callable, Generator, Hashable, Iterable, Sequence
+from itertools import accumulate, product
+from typing import Optional, TypeVar
 
 import pygame
 from pygame.rect import Rect
@@ -12,10 +13,13 @@ from pygame.surface import Surface
 
 from tuxemon import prepare
 from tuxemon.graphics import ColorLike
+from tuxemon.locale import T
 from tuxemon.sprite import Sprite
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 __all__ = ("GraphicBox",)
 
 
@@ -200,6 +204,30 @@ def shadow_text(
     fg: ColorLike,
     bg: ColorLike,
     text: str,
+) -> Surface:
+    """
+    Returns a text rendered with its shadow, from the label cache.
+
+    The surface is shared, it must not be modified.
+
+    Parameters:
+        font: Font of the text.
+        fg: Color of the text.
+        bg: Color of the shadow.
+        text: The text.
+
+    Returns:
+        The rendered text.
+
+    """
+    return label_cache.render(font, fg, bg, text)
+
+
+def render_shadow_text(
+    font: pygame.font.Font,
+    fg: ColorLike,
+    bg: ColorLike,
+    text: str,
 ) -> Surface:
     top = font.render(text, True, fg)
     shadow = font.render(text, True, bg)
@@ -213,6 +241,292 @@ def shadow_text(
     return image
 
 
+def font_key(font: pygame.font.Font) -> tuple[Hashable, ...]:
+    """
+    Returns a key identifying a font, its size and its style.
+
+    Fonts are created again for each menu, so the key is built from their
+    properties rather than from the font object.
+
+    Parameters:
+        font: The font.
+
+    Returns:
+        Key of the font.
+
+    """
+    return (
+        font.name,
+        font.style_name,
+        font.point_size,
+        font.bold,
+        font.italic,
+        font.underline,
+        font.strikethrough,
+    )
+
+
+def color_key(color: ColorLike) -> tuple[int, int, int, int]:
+    """Returns a hashable version of a color."""
+    r, g, b, a = pygame.Color(color)
+    return r, g, b, a
+
+
+class TextCache:
+    """
+    Keeps the rendered glyphs and the text layouts of the dialogs.
+
+    Glyphs are rendered with their shadow once per font, colors and
+    character. The layout of a text (its lines for a given width and the
+    position of every character of a line) is computed once, so drawing
+    a dialog character by character only blits cached glyphs.
+
+    Parameters:
+        max_glyphs: Maximum number of rendered glyphs kept.
+        max_layouts: Maximum number of line breaks and of line advances
+            kept.
+
+    """
+
+    def __init__(self, max_glyphs: int, max_layouts: int) -> None:
+        self.max_glyphs = max_glyphs
+        self.max_layouts = max_layouts
+        self.hits = 0
+        self.misses = 0
+        self._glyphs: OrderedDict[Hashable, Surface] = OrderedDict()
+        self._lines: OrderedDict[Hashable, list[str]] = OrderedDict()
+        self._offsets: OrderedDict[Hashable, list[int]] = OrderedDict()
+
+    def glyph(
+        self,
+        font: pygame.font.Font,
+        fg: ColorLike,
+        bg: ColorLike,
+        char: str,
+    ) -> Surface:
+        """
+        Returns a character rendered with its shadow.
+
+        The surface is shared, it must not be modified.
+
+        Parameters:
+            font: Font of the character.
+            fg: Color of the character.
+            bg: Color of the shadow.
+            char: The character.
+
+        Returns:
+            The rendered character.
+
+        """
+        key = (font_key(font), color_key(fg), color_key(bg), char)
+        surface = self._get(self._glyphs, key)
+        if surface is None:
+            surface = render_shadow_text(font, fg, bg, char)
+            self._put(self._glyphs, key, surface, self.max_glyphs)
+        return surface
+
+    def lines(
+        self,
+        font: pygame.font.Font,
+        text: str,
+        width: int,
+    ) -> list[str]:
+        """
+        Returns the lines of a text wrapped to a width.
+
+        Parameters:
+            font: Font of the text.
+            text: The text.
+            width: Maximum width of a line, in pixels.
+
+        Returns:
+            The lines, as returned by :func:`constrain_width`.
+
+        """
+        key = (font_key(font), text, width)
+        lines = self._get(self._lines, key)
+        if lines is None:
+            lines = list(constrain_width(text, font, width))
+            self._put(self._lines, key, lines, self.max_layouts)
+        return lines
+
+    def offsets(self, font: pygame.font.Font, line: str) -> list[int]:
+        """
+        Returns the horizontal position of every character of a line.
+
+        Positions are the widths of the line prefixes. They're computed
+        from the glyph advances, unless the font applies kerning to the
+        line.
+
+        Parameters:
+            font: Font of the line.
+            line: The line.
+
+        Returns:
+            The position of each character, in pixels.
+
+        """
+        key = (font_key(font), line)
+        offsets = self._get(self._offsets, key)
+        if offsets is None:
+            advances = [
+                font.size(char)[0] if metrics is None else metrics[4]
+                for char, metrics in zip(line, font.metrics(line))
+            ]
+            offsets = [0, *accumulate(advances[:-1])]
+            if sum(advances) != font.size(line)[0]:
+                # kerning, measure every prefix instead (only done once)
+                offsets = [font.size(line[:i])[0] for i in range(len(line))]
+            self._put(self._offsets, key, offsets, self.max_layouts)
+        return offsets
+
+    def _get(
+        self, cache: OrderedDict[Hashable, _T], key: Hashable
+    ) -> Optional[_T]:
+        value = cache.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        cache.move_to_end(key)
+        return value
+
+    @staticmethod
+    def _put(
+        cache: OrderedDict[Hashable, _T],
+        key: Hashable,
+        value: _T,
+        max_size: int,
+    ) -> None:
+        cache[key] = value
+        while len(cache) > max_size:
+            cache.popitem(last=False)
+
+    def clear(self) -> None:
+        """Removes all the glyphs and layouts from the cache."""
+        self._glyphs.clear()
+        self._lines.clear()
+        self._offsets.clear()
+
+    def stats(self) -> dict[str, int]:
+        """
+        Returns the counters of the cache.
+
+        Returns:
+            Number of glyphs, line breaks and line advances, hits and
+            misses.
+
+        """
+        return {
+            "glyphs": len(self._glyphs),
+            "lines": len(self._lines),
+            "offsets": len(self._offsets),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+text_cache = TextCache(
+    prepare.GLYPH_CACHE_SIZE, prepare.TEXT_LAYOUT_CACHE_SIZE
+)
+
+
+class LabelCache:
+    """
+    Keeps the labels rendered for the menus and the HUD.
+
+    The same strings (names, levels, money, etc.) are rendered again each
+    time a menu is rebuilt or the HUD is refreshed, so the rendered
+    surfaces are kept by text, font, colors and scale. The cache is
+    cleared when the language changes.
+
+    Parameters:
+        max_size: Maximum number of labels kept.
+
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._labels: OrderedDict[Hashable, Surface] = OrderedDict()
+
+    def render(
+        self,
+        font: pygame.font.Font,
+        fg: ColorLike,
+        bg: Optional[ColorLike],
+        text: str,
+    ) -> Surface:
+        """
+        Returns a rendered label.
+
+        The surface is shared, it must not be modified.
+
+        Parameters:
+            font: Font of the label.
+            fg: Color of the label.
+            bg: Color of the shadow, ``None`` renders the text without
+                shadow.
+            text: The text of the label.
+
+        Returns:
+            The rendered label.
+
+        """
+        key = (
+            text,
+            font_key(font),
+            color_key(fg),
+            None if bg is None else color_key(bg),
+            prepare.SCALE,
+        )
+        surface = self._labels.get(key)
+        if surface is not None:
+            self.hits += 1
+            self._labels.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        if bg is None:
+            surface = font.render(text, True, fg)
+        else:
+            surface = render_shadow_text(font, fg, bg, text)
+        self._labels[key] = surface
+        while len(self._labels) > self.max_size:
+            self._labels.popitem(last=False)
+        return surface
+
+    def language_changed(self, locale_name: str) -> None:
+        """Clears the cache, the labels are in the previous language."""
+        self.clear()
+
+    def clear(self) -> None:
+        """Removes all the labels from the cache."""
+        self._labels.clear()
+
+    def stats(self) -> dict[str, float]:
+        """
+        Returns the counters of the cache.
+
+        Returns:
+            Number of labels, hits, misses and hit rate.
+
+        """
+        lookups = self.hits + self.misses
+        return {
+            "labels": len(self._labels),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+label_cache = LabelCache(prepare.LABEL_CACHE_SIZE)
+T.language_changed_callbacks.append(label_cache.language_changed)
+
+
 def iter_render_text(
     text: str,
     font: pygame.font.Font,
@@ -221,17 +535,18 @@ def iter_render_text(
     rect: Rect,
 ) -> Generator[tuple[Rect, Surface], None, None]:
     line_height = guest_font_height(font)
-    for line_index, line in enumerate(constrain_width(text, font, rect.width)):
+    lines = text_cache.lines(font, text, rect.width)
+    for line_index, line in enumerate(lines):
         top = rect.top + line_index * line_height
-        for scrap in build_line(line):
-            if scrap[-1] == " ":
+        offsets = text_cache.offsets(font, line)
+        for char, offset in zip(line, offsets):
+            if char == " ":
                 # No need to blit a white sprite onto a white background
                 continue
-            dirty_length = font.size(scrap[:-1])[0]
-            surface = shadow_text(font, fg, bg, scrap[-1])
+            surface = text_cache.glyph(font, fg, bg, char)
             update_rect = surface.get_rect(
                 top=top,
-                left=rect.left + dirty_length,
+                left=rect.left + offset,
             )
             yield update_rect, surface
 
@@ -125,7 +125,7 @@ def draw_text(
 
     # Create a text surface so we can determine how many pixels
     # wide each character is
-    text_surface = font.render(text, True, font_color)
+    text_surface = draw.label_cache.render(font, font_color, None, text)
 
     # Calculate the number of pixels per letter based on the size
     # of the text and the number of characters in the text
@@ -200,7 +200,7 @@ def draw_text(
     # Set a spacing variable that we will add to space each line.
     spacing = 0
     for item in lines:
-        line = font.render(item, True, font_color)
+        line = draw.label_cache.render(font, font_color, None, item)
 
         surface.blit(line, (_left, _top + spacing))
         spacing += line.get_height()  # + self.line_spacing